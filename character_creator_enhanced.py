@@ -1071,6 +1071,11 @@ class EnhancedCharacterCreator:
             self.creation_history.pop(0)
 
 
+class NameInputLabel(Label):
+    """クリックで名前入力を開くラベル（イベント処理をインスタンスごとに差し替える）"""
+    INTERESTED_EVENTS = None
+
+
 class EnhancedCharacterCreationWindow(Panel):
     """拡張版キャラクター作成ウィンドウ"""
     def __init__(self, x, y, width, height, character_creator, game_manager, on_create=None, on_close=None):
@@ -1237,7 +1242,7 @@ class EnhancedCharacterCreationWindow(Panel):
         name_label = Label(right_panel.width // 4, 425, "名前", None, 24, (255, 255, 200), None, "center")
         right_panel.add_child(name_label)
         
-        self.name_input = Label(right_panel.width // 4, 455, "クリックして入力", None, 20, (200, 200, 255), None, "center")
+        self.name_input = NameInputLabel(right_panel.width // 4, 455, "クリックして入力", None, 20, (200, 200, 255), None, "center")
         right_panel.add_child(self.name_input)
         self.name_input.handle_event = lambda event: self.prompt_name_input() if event.type == pygame.MOUSEBUTTONDOWN else False
         
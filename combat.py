@@ -2,7 +2,7 @@
 import random
 from typing import Dict
 from constants import WeaponType, WEAPON_TRIANGLE
-from skills import SkillTriggerType, SkillEffectType
+from skills import SkillTriggerType, SkillEffectType, CombatContext
 
 class CombatSystem:
     @staticmethod
@@ -107,13 +107,13 @@ class CombatSystem:
     @staticmethod
     def perform_attack(attacker, defender, game_map) -> Dict:
         # スキルの発動チェック（攻撃時）
-        combat_data = {
+        combat_data = CombatContext({
             "attacker": attacker,
             "defender": defender,
             "is_attacker": True,
             "target": defender,
             "game_map": game_map
-        }
+        })
         
         attacker.activate_skills(SkillTriggerType.ON_ATTACK, combat_data)
         defender.activate_skills(SkillTriggerType.ON_DEFEND, combat_data)
@@ -201,21 +201,21 @@ class CombatSystem:
     def perform_combat(attacker, defender, game_map) -> Dict:
         """スキルを考慮した戦闘処理"""
         # 戦闘前のスキル処理
-        pre_combat_data = {
+        pre_combat_data = CombatContext({
             "attacker": attacker,
             "defender": defender,
             "is_attacker": True,
             "target": defender,
             "game_map": game_map
-        }
+        })
         
-        defender_pre_combat_data = {
+        defender_pre_combat_data = CombatContext({
             "attacker": defender,
             "defender": attacker,
             "is_attacker": False,
             "target": attacker, 
             "game_map": game_map
-        }
+        })
         
         # 先制攻撃のスキルをチェック
         attacker_has_vantage = False
@@ -276,7 +276,7 @@ class CombatSystem:
                 results["defender_results"] = temp_results
             
             # 戦闘後のスキル処理
-            post_combat_data = {
+            post_combat_data = CombatContext({
                 "attacker": attacker,
                 "defender": defender,
                 "results": results,
@@ -284,9 +284,9 @@ class CombatSystem:
                 "damage_received": 0,
                 "target_killed": defender.is_dead(),
                 "is_attacker": True,
-            }
+            })
             
-            defender_post_combat_data = {
+            defender_post_combat_data = CombatContext({
                 "attacker": defender,
                 "defender": attacker,
                 "results": results,
@@ -294,7 +294,7 @@ class CombatSystem:
                 "damage_received": sum(r.get("damage", 0) for r in results["attacker_results"]),
                 "target_killed": False,
                 "is_attacker": False,
-            }
+            })
             
             attacker.activate_skills(SkillTriggerType.POST_COMBAT, post_combat_data)
             defender.activate_skills(SkillTriggerType.POST_COMBAT, defender_post_combat_data)
@@ -339,7 +339,7 @@ class CombatSystem:
                     results["defender_results"] = temp_results
                 
                 # 戦闘後のスキル処理
-                post_combat_data = {
+                post_combat_data = CombatContext({
                     "attacker": attacker,
                     "defender": defender,
                     "results": results,
@@ -347,9 +347,9 @@ class CombatSystem:
                     "damage_received": sum(r.get("damage", 0) for r in results["defender_results"]),
                     "target_killed": defender.is_dead(),
                     "is_attacker": True,
-                }
+                })
                 
-                defender_post_combat_data = {
+                defender_post_combat_data = CombatContext({
                     "attacker": defender,
                     "defender": attacker,
                     "results": results,
@@ -357,7 +357,7 @@ class CombatSystem:
                     "damage_received": sum(r.get("damage", 0) for r in results["attacker_results"]),
                     "target_killed": attacker.is_dead(),
                     "is_attacker": False,
-                }
+                })
                 
                 attacker.activate_skills(SkillTriggerType.POST_COMBAT, post_combat_data)
                 defender.activate_skills(SkillTriggerType.POST_COMBAT, defender_post_combat_data)
@@ -405,7 +405,7 @@ class CombatSystem:
                     results["defender_results"] = temp_results
                 
                 # 戦闘後のスキル処理
-                post_combat_data = {
+                post_combat_data = CombatContext({
                     "attacker": attacker,
                     "defender": defender,
                     "results": results,
@@ -413,9 +413,9 @@ class CombatSystem:
                     "damage_received": sum(r.get("damage", 0) for r in results["defender_results"]),
                     "target_killed": defender.is_dead(),
                     "is_attacker": True,
-                }
+                })
                 
-                defender_post_combat_data = {
+                defender_post_combat_data = CombatContext({
                     "attacker": defender,
                     "defender": attacker,
                     "results": results,
@@ -423,7 +423,7 @@ class CombatSystem:
                     "damage_received": sum(r.get("damage", 0) for r in results["attacker_results"]),
                     "target_killed": False,
                     "is_attacker": False,
-                }
+                })
                 
                 attacker.activate_skills(SkillTriggerType.POST_COMBAT, post_combat_data)
                 defender.activate_skills(SkillTriggerType.POST_COMBAT, defender_post_combat_data)
@@ -456,7 +456,7 @@ class CombatSystem:
                     results["defender_results"] = temp_results
                 
                 # 戦闘後のスキル処理
-                post_combat_data = {
+                post_combat_data = CombatContext({
                     "attacker": attacker,
                     "defender": defender,
                     "results": results,
@@ -464,9 +464,9 @@ class CombatSystem:
                     "damage_received": sum(r.get("damage", 0) for r in results["defender_results"]),
                     "target_killed": defender.is_dead(),
                     "is_attacker": True,
-                }
+                })
                 
-                defender_post_combat_data = {
+                defender_post_combat_data = CombatContext({
                     "attacker": defender,
                     "defender": attacker,
                     "results": results,
@@ -474,7 +474,7 @@ class CombatSystem:
                     "damage_received": sum(r.get("damage", 0) for r in results["attacker_results"]),
                     "target_killed": attacker.is_dead(),
                     "is_attacker": False,
-                }
+                })
                 
                 attacker.activate_skills(SkillTriggerType.POST_COMBAT, post_combat_data)
                 defender.activate_skills(SkillTriggerType.POST_COMBAT, defender_post_combat_data)
@@ -498,7 +498,7 @@ class CombatSystem:
             results["defender_results"] = temp_results
         
         # 戦闘後のスキル処理
-        post_combat_data = {
+        post_combat_data = CombatContext({
             "attacker": attacker,
             "defender": defender,
             "results": results,
@@ -506,9 +506,9 @@ class CombatSystem:
             "damage_received": sum(r.get("damage", 0) for r in results["defender_results"]),
             "target_killed": defender.is_dead(),
             "is_attacker": True,
-        }
+        })
         
-        defender_post_combat_data = {
+        defender_post_combat_data = CombatContext({
             "attacker": defender,
             "defender": attacker,
             "results": results,
@@ -516,7 +516,7 @@ class CombatSystem:
             "damage_received": sum(r.get("damage", 0) for r in results["attacker_results"]),
             "target_killed": attacker.is_dead(),
             "is_attacker": False,
-        }
+        })
         
         attacker.activate_skills(SkillTriggerType.POST_COMBAT, post_combat_data)
         defender.activate_skills(SkillTriggerType.POST_COMBAT, defender_post_combat_data)
@@ -5,6 +5,7 @@ from typing import Dict, List, Tuple, Optional
 from combat import CombatSystem
 from support_system import SupportSystem
 from legendary_items import LegendaryWeapon
+from skills import CombatContext
 
 class EnhancedCombatSystem(CombatSystem):
     """支援効果とレジェンダリーアイテム効果を統合した拡張戦闘システム"""
@@ -80,13 +81,13 @@ class EnhancedCombatSystem(CombatSystem):
     def perform_attack(attacker, defender, game_map, support_system=None) -> Dict:
         """支援効果とレジェンダリーアイテム効果を考慮した攻撃処理"""
         # 戦闘データを準備
-        combat_data = {
+        combat_data = CombatContext({
             "attacker": attacker,
             "defender": defender,
             "is_attacker": True,
             "target": defender,
             "game_map": game_map
-        }
+        })
         
         # 支援効果を適用
         if support_system:
@@ -204,22 +205,36 @@ class EnhancedCombatSystem(CombatSystem):
     @staticmethod
     def perform_combat(attacker, defender, game_map, support_system=None) -> Dict:
         """支援効果とレジェンダリーアイテム効果を考慮した戦闘処理"""
+        # 前回の戦闘でユニットの生死が変わっている可能性があるため支援効果を計算し直す
+        if support_system:
+            support_system.invalidate_bonus_cache()
+        
+        results = EnhancedCombatSystem._resolve_combat(attacker, defender, game_map, support_system)
+        
+        # 倒れたユニットの支援効果が戦闘後の計算（AIの評価など）に残らないよう、もう一度破棄する
+        if support_system:
+            support_system.invalidate_bonus_cache()
+        return results
+    
+    @staticmethod
+    def _resolve_combat(attacker, defender, game_map, support_system) -> Dict:
+        """戦闘の本体（攻撃・反撃・追撃とスキルの処理）"""
         # 戦闘前のスキル処理
-        pre_combat_data = {
+        pre_combat_data = CombatContext({
             "attacker": attacker,
             "defender": defender,
             "is_attacker": True,
             "target": defender,
             "game_map": game_map
-        }
+        })
         
-        defender_pre_combat_data = {
+        defender_pre_combat_data = CombatContext({
             "attacker": defender,
             "defender": attacker,
             "is_attacker": False,
             "target": attacker, 
             "game_map": game_map
-        }
+        })
         
         # 先制攻撃のスキルをチェック
         attacker_has_vantage = False
@@ -298,7 +313,7 @@ class EnhancedCombatSystem(CombatSystem):
                 results["defender_results"] = temp_results
             
             # 戦闘後のスキル処理
-            post_combat_data = {
+            post_combat_data = CombatContext({
                 "attacker": attacker,
                 "defender": defender,
                 "results": results,
@@ -306,9 +321,9 @@ class EnhancedCombatSystem(CombatSystem):
                 "damage_received": 0,
                 "target_killed": defender.is_dead(),
                 "is_attacker": True,
-            }
+            })
             
-            defender_post_combat_data = {
+            defender_post_combat_data = CombatContext({
                 "attacker": defender,
                 "defender": attacker,
                 "results": results,
@@ -316,7 +331,7 @@ class EnhancedCombatSystem(CombatSystem):
                 "damage_received": sum(r.get("damage", 0) for r in results["attacker_results"]),
                 "target_killed": False,
                 "is_attacker": False,
-            }
+            })
             
             attacker.activate_skills(SkillTriggerType.POST_COMBAT, post_combat_data)
             defender.activate_skills(SkillTriggerType.POST_COMBAT, defender_post_combat_data)
@@ -336,13 +351,7 @@ class EnhancedCombatSystem(CombatSystem):
             
             # 支援システムの更新 - 一緒に戦闘した記録
             if support_system:
-                for unit1 in game_map.units:
-                    for unit2 in game_map.units:
-                        if unit1.team == unit2.team and unit1 != unit2:
-                            # 同じチームの異なるユニット同士で
-                            distance = abs(unit1.x - unit2.x) + abs(unit1.y - unit2.y)
-                            if distance <= 3:  # 3マス以内のユニット
-                                support_system.record_battle_together(unit1.name, unit2.name)
+                support_system.record_battle_nearby(game_map)
             
             # スキルをリセット
             attacker.deactivate_skills()
@@ -385,7 +394,7 @@ class EnhancedCombatSystem(CombatSystem):
                     results["defender_results"] = temp_results
                 
                 # 戦闘後のスキル処理
-                post_combat_data = {
+                post_combat_data = CombatContext({
                     "attacker": attacker,
                     "defender": defender,
                     "results": results,
@@ -393,9 +402,9 @@ class EnhancedCombatSystem(CombatSystem):
                     "damage_received": sum(r.get("damage", 0) for r in results["defender_results"]),
                     "target_killed": defender.is_dead(),
                     "is_attacker": True,
-                }
+                })
                 
-                defender_post_combat_data = {
+                defender_post_combat_data = CombatContext({
                     "attacker": defender,
                     "defender": attacker,
                     "results": results,
@@ -403,7 +412,7 @@ class EnhancedCombatSystem(CombatSystem):
                     "damage_received": sum(r.get("damage", 0) for r in results["attacker_results"]),
                     "target_killed": attacker.is_dead(),
                     "is_attacker": False,
-                }
+                })
                 
                 attacker.activate_skills(SkillTriggerType.POST_COMBAT, post_combat_data)
                 defender.activate_skills(SkillTriggerType.POST_COMBAT, defender_post_combat_data)
@@ -423,13 +432,7 @@ class EnhancedCombatSystem(CombatSystem):
                 
                 # 支援システムの更新 - 一緒に戦闘した記録
                 if support_system:
-                    for unit1 in game_map.units:
-                        for unit2 in game_map.units:
-                            if unit1.team == unit2.team and unit1 != unit2:
-                                # 同じチームの異なるユニット同士で
-                                distance = abs(unit1.x - unit2.x) + abs(unit1.y - unit2.y)
-                                if distance <= 3:  # 3マス以内のユニット
-                                    support_system.record_battle_together(unit1.name, unit2.name)
+                    support_system.record_battle_nearby(game_map)
                 
                 # スキルをリセット
                 attacker.deactivate_skills()
@@ -481,7 +484,7 @@ class EnhancedCombatSystem(CombatSystem):
                     results["defender_results"] = temp_results
                 
                 # 戦闘後のスキル処理
-                post_combat_data = {
+                post_combat_data = CombatContext({
                     "attacker": attacker,
                     "defender": defender,
                     "results": results,
@@ -489,9 +492,9 @@ class EnhancedCombatSystem(CombatSystem):
                     "damage_received": sum(r.get("damage", 0) for r in results["defender_results"]),
                     "target_killed": defender.is_dead(),
                     "is_attacker": True,
-                }
+                })
                 
-                defender_post_combat_data = {
+                defender_post_combat_data = CombatContext({
                     "attacker": defender,
                     "defender": attacker,
                     "results": results,
@@ -499,7 +502,7 @@ class EnhancedCombatSystem(CombatSystem):
                     "damage_received": sum(r.get("damage", 0) for r in results["attacker_results"]),
                     "target_killed": False,
                     "is_attacker": False,
-                }
+                })
                 
                 attacker.activate_skills(SkillTriggerType.POST_COMBAT, post_combat_data)
                 defender.activate_skills(SkillTriggerType.POST_COMBAT, defender_post_combat_data)
@@ -519,13 +522,7 @@ class EnhancedCombatSystem(CombatSystem):
                 
                 # 支援システムの更新 - 一緒に戦闘した記録
                 if support_system:
-                    for unit1 in game_map.units:
-                        for unit2 in game_map.units:
-                            if unit1.team == unit2.team and unit1 != unit2:
-                                # 同じチームの異なるユニット同士で
-                                distance = abs(unit1.x - unit2.x) + abs(unit1.y - unit2.y)
-                                if distance <= 3:  # 3マス以内のユニット
-                                    support_system.record_battle_together(unit1.name, unit2.name)
+                    support_system.record_battle_nearby(game_map)
                 
                 # スキルをリセット
                 attacker.deactivate_skills()
@@ -549,7 +546,7 @@ class EnhancedCombatSystem(CombatSystem):
                     results["defender_results"] = temp_results
                 
                 # 戦闘後のスキル処理
-                post_combat_data = {
+                post_combat_data = CombatContext({
                     "attacker": attacker,
                     "defender": defender,
                     "results": results,
@@ -557,9 +554,9 @@ class EnhancedCombatSystem(CombatSystem):
                     "damage_received": sum(r.get("damage", 0) for r in results["defender_results"]),
                     "target_killed": defender.is_dead(),
                     "is_attacker": True,
-                }
+                })
                 
-                defender_post_combat_data = {
+                defender_post_combat_data = CombatContext({
                     "attacker": defender,
                     "defender": attacker,
                     "results": results,
@@ -567,7 +564,7 @@ class EnhancedCombatSystem(CombatSystem):
                     "damage_received": sum(r.get("damage", 0) for r in results["attacker_results"]),
                     "target_killed": attacker.is_dead(),
                     "is_attacker": False,
-                }
+                })
                 
                 attacker.activate_skills(SkillTriggerType.POST_COMBAT, post_combat_data)
                 defender.activate_skills(SkillTriggerType.POST_COMBAT, defender_post_combat_data)
@@ -587,13 +584,7 @@ class EnhancedCombatSystem(CombatSystem):
                 
                 # 支援システムの更新 - 一緒に戦闘した記録
                 if support_system:
-                    for unit1 in game_map.units:
-                        for unit2 in game_map.units:
-                            if unit1.team == unit2.team and unit1 != unit2:
-                                # 同じチームの異なるユニット同士で
-                                distance = abs(unit1.x - unit2.x) + abs(unit1.y - unit2.y)
-                                if distance <= 3:  # 3マス以内のユニット
-                                    support_system.record_battle_together(unit1.name, unit2.name)
+                    support_system.record_battle_nearby(game_map)
                 
                 # スキルをリセット
                 attacker.deactivate_skills()
@@ -608,7 +599,7 @@ class EnhancedCombatSystem(CombatSystem):
             results["defender_results"] = temp_results
         
         # 戦闘後のスキル処理
-        post_combat_data = {
+        post_combat_data = CombatContext({
             "attacker": attacker,
             "defender": defender,
             "results": results,
@@ -616,9 +607,9 @@ class EnhancedCombatSystem(CombatSystem):
             "damage_received": sum(r.get("damage", 0) for r in results["defender_results"]),
             "target_killed": defender.is_dead(),
             "is_attacker": True,
-        }
+        })
         
-        defender_post_combat_data = {
+        defender_post_combat_data = CombatContext({
             "attacker": defender,
             "defender": attacker,
             "results": results,
@@ -626,7 +617,7 @@ class EnhancedCombatSystem(CombatSystem):
             "damage_received": sum(r.get("damage", 0) for r in results["attacker_results"]),
             "target_killed": attacker.is_dead(),
             "is_attacker": False,
-        }
+        })
         
         attacker.activate_skills(SkillTriggerType.POST_COMBAT, post_combat_data)
         defender.activate_skills(SkillTriggerType.POST_COMBAT, defender_post_combat_data)
@@ -646,13 +637,7 @@ class EnhancedCombatSystem(CombatSystem):
         
         # 支援システムの更新 - 一緒に戦闘した記録
         if support_system:
-            for unit1 in game_map.units:
-                for unit2 in game_map.units:
-                    if unit1.team == unit2.team and unit1 != unit2:
-                        # 同じチームの異なるユニット同士で
-                        distance = abs(unit1.x - unit2.x) + abs(unit1.y - unit2.y)
-                        if distance <= 3:  # 3マス以内のユニット
-                            support_system.record_battle_together(unit1.name, unit2.name)
+            support_system.record_battle_nearby(game_map)
         
         # スキルをリセット
         attacker.deactivate_skills()
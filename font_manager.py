@@ -3,6 +3,31 @@ import pygame
 import sys
 import os
 
+class CachedFont:
+    """pygame.font.Font のラッパー。同じ文字列・色の描画結果を再利用する"""
+    # キャッシュする描画結果の上限（超えたらクリア）
+    RENDER_CACHE_LIMIT = 512
+    
+    def __init__(self, font):
+        self.font = font
+        self._render_cache = {}
+    
+    def render(self, text, antialias, color, background=None):
+        """テキストを描画（キャッシュ済みならそれを返す）"""
+        key = (text, antialias, tuple(color), background and tuple(background))
+        surface = self._render_cache.get(key)
+        if surface is None:
+            if len(self._render_cache) >= self.RENDER_CACHE_LIMIT:
+                self._render_cache.clear()
+            surface = self.font.render(text, antialias, color, background)
+            self._render_cache[key] = surface
+        return surface
+    
+    def __getattr__(self, name):
+        # size, get_height などはそのまま元のフォントに委譲
+        return getattr(self.font, name)
+
+
 class FontManager:
     """日本語フォントを管理するシングルトンクラス"""
     _instance = None
@@ -72,8 +97,8 @@ class FontManager:
     def get_font(self, size):
         """指定サイズのフォントを取得（キャッシュから）"""
         if size not in self.font_cache:
-            # フォントをキャッシュに追加
-            self.font_cache[size] = pygame.font.Font(self.font_path, size)
+            # フォントをキャッシュに追加（描画結果もキャッシュするラッパーで包む）
+            self.font_cache[size] = CachedFont(pygame.font.Font(self.font_path, size))
         
         return self.font_cache[size]
 
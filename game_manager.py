@@ -16,16 +16,23 @@ class GameManager:
         self.selected_unit = None
         self.move_targets = []
         self.attack_targets = []
+        # 範囲が変わるたびに増える版数（表示側のキャッシュ判定用）
+        self.move_targets_version = 0
+        self.attack_targets_version = 0
         self.combat_results = None
         self.combat_animation_active = False
         self.phase = "select_unit"  # select_unit, move_unit, select_action, select_attack_target
         
+        # 描画が必要な変化があったかどうか（レンダラーが描画後にFalseに戻す）
+        self.dirty = True
+        
         # 拡張システム
         self.support_system = SupportSystem("data/supports/")
         self.legendary_generator = LegendaryItemGenerator()
         
         # インベントリシステム
         self.inventory = []  # ユニットに所属しない共有アイテム
+        self._inventory_counts = {}  # id(アイテム) -> 所持数（所持確認をリストの走査なしで行う）
         
         # UI関連のコールバック
         self.on_support_level_up = None  # 支援レベルアップ時のコールバック
@@ -45,7 +52,7 @@ class GameManager:
         for rarity in [ItemRarity.UNCOMMON, ItemRarity.RARE, ItemRarity.EPIC, ItemRarity.LEGENDARY]:
             for _ in range(2):  # 各2つずつ
                 weapon = self.legendary_generator.generate_legendary_weapon(rarity)
-                self.inventory.append(weapon)
+                self.add_item_to_inventory(weapon)
     
     def _setup_default_supports(self):
         """初期支援関係の設定"""
@@ -64,7 +71,9 @@ class GameManager:
         if unit and unit.team == self.turn_player and not unit.has_moved:
             self.selected_unit = unit
             self.move_targets = self.game_map.calculate_movement_range(unit)
+            self.move_targets_version += 1
             self.phase = "move_unit"
+            self.dirty = True
             return True
         return False
     
@@ -74,7 +83,9 @@ class GameManager:
             return False
         
         if self.game_map.move_unit(self.selected_unit, x, y):
+            self.dirty = True
             self.attack_targets = self.game_map.calculate_attack_range(self.selected_unit)
+            self.attack_targets_version += 1
             enemies = self.game_map.get_enemies_in_range(self.selected_unit, self.attack_targets)
             
             if enemies and not self.selected_unit.has_attacked:
@@ -93,6 +104,7 @@ class GameManager:
             )
             if enemies:
                 self.phase = "select_attack_target"
+                self.dirty = True
                 return True
         elif action == "wait":
             self.end_unit_turn()
@@ -131,6 +143,7 @@ class GameManager:
                 self.selected_unit, target, self.game_map, self.support_system
             )
             self.combat_animation_active = True
+            self.dirty = True
             self.selected_unit.has_attacked = True
             
             # 敵を倒した場合、アイテムドロップ判定
@@ -183,7 +196,7 @@ class GameManager:
                 self.on_item_drop(legendary_weapon)
             else:
                 # UI機能がなければ自動的にインベントリに追加
-                self.inventory.append(legendary_weapon)
+                self.add_item_to_inventory(legendary_weapon)
     
     def _add_kill_support_points(self, unit):
         """ユニットが敵を倒した時に支援ポイントを加算"""
@@ -206,7 +219,11 @@ class GameManager:
         self.selected_unit = None
         self.move_targets = []
         self.attack_targets = []
+        self.move_targets_version += 1
+        self.attack_targets_version += 1
         self.phase = "select_unit"
+        self.dirty = True
+        self.game_map.units_version += 1  # 戦闘などでHPやレベルが変わった可能性
     
     def end_player_turn(self):
         """プレイヤーのターン終了"""
@@ -223,6 +240,8 @@ class GameManager:
             self.current_turn += 1
         
         self.phase = "select_unit"
+        self.dirty = True
+        self.game_map.units_version += 1
     
     def _process_adjacent_units_support(self):
         """ターン終了時、隣接するユニット間の支援ポイント処理"""
@@ -230,15 +249,19 @@ class GameManager:
         
         # すべてのプレイヤーユニットをチェック
         player_units = [unit for unit in self.game_map.units if unit.team == 0 and not unit.is_dead()]
+        player_by_name = {}
+        for unit in player_units:
+            player_by_name.setdefault(unit.name, unit)
         
         for unit1 in player_units:
-            for unit2 in player_units:
-                if unit1 == unit2:
+            # 支援関係のある相手だけを調べる
+            for pair, other_name in self.support_system.by_character.get(unit1.name, ()):
+                unit2 = player_by_name.get(other_name)
+                if unit2 is None or unit1 == unit2:
                     continue
                 
                 # 既に処理したペアはスキップ
-                pair_key = tuple(sorted([unit1.name, unit2.name]))
-                if pair_key in processed_pairs:
+                if pair in processed_pairs:
                     continue
                 
                 # 隣接するユニット間の支援ポイント
@@ -251,7 +274,7 @@ class GameManager:
                     if level_up and self.on_support_level_up:
                         self.on_support_level_up(unit1.name, unit2.name, new_level)
                 
-                processed_pairs.add(pair_key)
+                processed_pairs.add(pair)
     
     def execute_ai_turn(self):
         """AIのターン実行"""
@@ -311,27 +334,39 @@ class GameManager:
         
         # 現在装備中の武器をインベントリに戻す（あれば）
         if unit.equipped_weapon:
-            self.inventory.append(unit.equipped_weapon)
+            self.add_item_to_inventory(unit.equipped_weapon)
         
         # 新しい武器を装備
         unit.equipped_weapon = weapon
         
         # インベントリから削除
-        if weapon in self.inventory:
-            self.inventory.remove(weapon)
+        self.remove_item_from_inventory(weapon)
         
         return True
     
     def add_item_to_inventory(self, item):
         """アイテムをインベントリに追加"""
         self.inventory.append(item)
+        key = id(item)
+        self._inventory_counts[key] = self._inventory_counts.get(key, 0) + 1
     
     def remove_item_from_inventory(self, item):
         """インベントリからアイテムを削除"""
-        if item in self.inventory:
-            self.inventory.remove(item)
-            return True
-        return False
+        key = id(item)
+        count = self._inventory_counts.get(key)
+        if not count:
+            return False
+        
+        self.inventory.remove(item)
+        if count > 1:
+            self._inventory_counts[key] = count - 1
+        else:
+            del self._inventory_counts[key]
+        return True
+    
+    def has_item(self, item):
+        """アイテムをインベントリに持っているか（同じアイテムそのものを持っているか）"""
+        return id(item) in self._inventory_counts
     
     def get_available_support_conversations(self, unit_name=None):
         """閲覧可能な支援会話のリストを取得"""
@@ -386,6 +421,9 @@ class GameManager:
         """新しいユニットをパーティーに追加"""
         # ユニットをマップに追加（実際のゲーム進行では適切な位置調整が必要）
         self.game_map.units.append(unit)
+        self.game_map.units_version += 1
+        self.dirty = True
+        self.support_system.invalidate_bonus_cache()
         
         # 支援関係の初期化（既存ユニットとの支援関係を設定）
         for existing_unit in self.game_map.units:
@@ -396,6 +434,9 @@ class GameManager:
         """ユニットをパーティーから削除"""
         if unit in self.game_map.units:
             self.game_map.units.remove(unit)
+            self.game_map.units_version += 1
+            self.dirty = True
+            self.support_system.invalidate_bonus_cache()
             
             # マップタイルからの削除
             if hasattr(unit, 'x') and hasattr(unit, 'y'):
@@ -51,6 +51,8 @@ class ItemEffect:
 
 class LegendaryWeapon(Weapon):
     """スキルや特殊効果を持つ伝説の武器クラス"""
+    HAS_EQUIP_CHECK = True
+    
     def __init__(self, name, weapon_type, might, hit, crit, weight, range_min, range_max, durability,
                  rarity: ItemRarity = ItemRarity.LEGENDARY,
                  effects: List[ItemEffect] = None,
@@ -140,7 +142,7 @@ class LegendaryWeapon(Weapon):
             "max_durability": self.max_durability,
             "rarity": self.rarity.name,
             "effects": [effect.to_dict() for effect in self.effects],
-            "skills": [skill.__dict__ for skill in self.skills],  # 簡易的な変換
+            "skills": [skill.to_dict() for skill in self.skills],
             "lore": self.lore,
             "required_level": self.required_level,
             "unique_owner": self.unique_owner
@@ -184,11 +184,20 @@ def main():
         # マップループ（独自のループが必要）
         map_running = True
         while map_running and state_manager.current_state == GameState.MAP:
+            # このフレームに入力があったか（ホバーやUIの開閉など、ゲーム状態以外の見た目の変化用）
+            had_input = False
             for event in pygame.event.get():
+                had_input = True
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
                 
+                # 戦闘アニメーション中のクリックは早送り・終了に使う
+                if (game_manager.combat_animation_active and
+                        event.type == pygame.MOUSEBUTTONDOWN and event.button == 1):
+                    renderer.handle_combat_animation_click()
+                    continue
+                
                 # UIマネージャーにイベントを渡す
                 if ui_manager.handle_event(event):
                     continue
@@ -222,12 +231,14 @@ def main():
                 show_game_over()
                 break
             
-            # 描画処理
-            renderer.render_map()
-            renderer.render_units()
-            ui_manager.render()
-            
-            pygame.display.flip()
+            # 描画処理（入力もゲーム状態の変化も戦闘アニメーションもないフレームは描き直さない）
+            if had_input or game_manager.dirty or game_manager.combat_animation_active:
+                game_manager.dirty = False
+                renderer.render_map()
+                renderer.render_units()
+                ui_manager.render()
+                
+                pygame.display.flip()
             clock.tick(60)
     
     # マップクリア判定
@@ -359,12 +370,20 @@ def main():
         if current_screen:
             current_screen.update()
         
-        # 画面の描画
-        screen.fill((0, 0, 0))  # 背景をクリア
-        if current_screen:
-            current_screen.render(screen)
-        
-        pygame.display.flip()
+        # 画面の描画（差分描画に対応した画面は変わった範囲だけを反映）
+        if current_screen and hasattr(current_screen, "render_dirty"):
+            dirty_rects = current_screen.render_dirty(screen)
+            if len(dirty_rects) == 1 and dirty_rects[0] == screen.get_rect():
+                # 全体を描き直した時（施設の表示中など）は矩形ごとの反映をせずにflipする
+                pygame.display.flip()
+            elif dirty_rects:
+                pygame.display.update(dirty_rects)
+        else:
+            screen.fill((0, 0, 0))  # 背景をクリア
+            if current_screen:
+                current_screen.render(screen)
+            
+            pygame.display.flip()
         clock.tick(60)
     
     pygame.quit()
@@ -14,6 +14,8 @@ class GameMap:
         self.cols = cols
         self.tiles = [[MapTile(TerrainType.PLAIN) for _ in range(cols)] for _ in range(rows)]
         self.units = []
+        self.version = 0  # ユニットの配置が変わるたびに増える
+        self.units_version = 0  # ユニットの増減や戦闘・ターン終了で増える（一覧表示の更新判定用）
     
     def generate_simple_map(self):
         # 簡単なマップを生成
@@ -38,6 +40,8 @@ class GameMap:
         unit.y = y
         self.tiles[y][x].unit = unit
         self.units.append(unit)
+        self.version += 1
+        self.units_version += 1
         return True
 
     def move_unit(self, unit, new_x: int, new_y: int) -> bool:
@@ -52,6 +56,7 @@ class GameMap:
         unit.y = new_y
         self.tiles[new_y][new_x].unit = unit
         unit.has_moved = True
+        self.version += 1
         return True
 
     def is_valid_position(self, x: int, y: int) -> bool:
@@ -135,11 +140,20 @@ class GameMap:
         return attack_positions
         
     def get_enemies_in_range(self, unit, attack_positions: List[Tuple[int, int]]) -> List:
+        # 攻撃範囲が空なら調べない（移動後に自動で待機した場合は選択ユニットがNoneで呼ばれる）
+        if not attack_positions:
+            return []
+        
+        # AIの探索で多数回呼ばれるため、タイル参照と範囲判定をその場で行う
+        tiles = self.tiles
+        cols, rows = self.cols, self.rows
+        team = unit.team
         enemies = []
         for x, y in attack_positions:
-            target = self.get_unit_at(x, y)
-            if target and target.team != unit.team:
-                enemies.append((target, x, y))
+            if 0 <= x < cols and 0 <= y < rows:
+                target = tiles[y][x].unit
+                if target and target.team != team:
+                    enemies.append((target, x, y))
         return enemies
     
     def hide_unit(self, unit):
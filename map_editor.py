@@ -675,6 +675,12 @@ class MapEditor:
         self.mouse_pos = (0, 0)
         self.mouse_down = False
         self.last_edited_tile = None
+        
+        # ユニット描画用スプライトキャッシュ（(チーム, 頭文字) -> Surface）
+        self._unit_sprite_cache: Dict[Tuple[int, str], pygame.Surface] = {}
+        
+        # 編集モード表示のキャッシュ（(表示名, Surface)）
+        self._mode_surface_cache: Optional[Tuple[str, pygame.Surface]] = None
     
     def create_new_map(self, map_name, rows, cols):
         """新規マップを作成"""
@@ -933,11 +939,12 @@ class MapEditor:
         if self.toolbar:
             self.toolbar.render(self.screen)
         
-        # 編集モード表示
-        mode_text = f"モード: {self._get_mode_display_name()}"
-        mode_font = get_font(24)
-        mode_surface = mode_font.render(mode_text, True, (255, 255, 200))
-        self.screen.blit(mode_surface, (220, 10))
+        # 編集モード表示（モードが変わった時のみ再描画）
+        mode_name = self._get_mode_display_name()
+        if not self._mode_surface_cache or self._mode_surface_cache[0] != mode_name:
+            mode_font = get_font(24)
+            self._mode_surface_cache = (mode_name, mode_font.render(f"モード: {mode_name}", True, (255, 255, 200)))
+        self.screen.blit(self._mode_surface_cache[1], (220, 10))
     
     def _get_mode_display_name(self):
         """編集モードの表示名を取得"""
@@ -964,6 +971,8 @@ class MapEditor:
         self.scroll_x = max(0, min(self.scroll_x, self.map_data.cols - visible_cols))
         self.scroll_y = max(0, min(self.scroll_y, self.map_data.rows - visible_rows))
         
+        unit_blits = []
+        
         # タイルを描画
         for y in range(self.scroll_y, min(self.scroll_y + visible_rows, self.map_data.rows)):
             for x in range(self.scroll_x, min(self.scroll_x + visible_cols, self.map_data.cols)):
@@ -1002,35 +1011,44 @@ class MapEditor:
                     id_surface = event_font.render("E", True, (0, 0, 0))
                     self.screen.blit(id_surface, (screen_x + GRID_SIZE // 2 - 5, screen_y + GRID_SIZE // 2 - 5))
                 
-                # ユニット表示
+                # ユニット表示（後でまとめて描画）
                 if tile.unit:
-                    # ユニットの色（チームに応じた色）
-                    unit_colors = {
-                        0: (100, 100, 255),  # プレイヤー
-                        1: (255, 100, 100),  # 敵
-                    }
-                    unit_color = unit_colors.get(tile.unit.team, (200, 200, 200))
-                    
-                    # ユニットを描画（例：円）
-                    pygame.draw.circle(
-                        self.screen,
-                        unit_color,
-                        (screen_x + GRID_SIZE // 2, screen_y + GRID_SIZE // 2),
-                        GRID_SIZE // 3
-                    )
-                    
-                    # ユニット名の頭文字
                     name_initial = tile.unit.name[0] if tile.unit.name else "?"
-                    unit_font = get_font(16)
-                    name_surface = unit_font.render(name_initial, True, (0, 0, 0))
-                    name_rect = name_surface.get_rect(center=(screen_x + GRID_SIZE // 2, screen_y + GRID_SIZE // 2))
-                    self.screen.blit(name_surface, name_rect)
+                    unit_blits.append((self._unit_sprite(tile.unit.team, name_initial), (screen_x, screen_y)))
+        
+        # ユニットを一括描画
+        if unit_blits:
+            self.screen.blits(unit_blits, doreturn=0)
         
         # マップ名表示
         map_name_font = get_font(20)
         map_name_surface = map_name_font.render(self.map_data.map_name, True, (255, 255, 255))
         self.screen.blit(map_name_surface, (map_x, 20))
     
+    def _unit_sprite(self, team, initial):
+        """チーム色の円と頭文字を焼き込んだユニットスプライトを取得（キャッシュ付き）"""
+        key = (team, initial)
+        sprite = self._unit_sprite_cache.get(key)
+        if sprite is None:
+            # ユニットの色（チームに応じた色）
+            unit_colors = {
+                0: (100, 100, 255),  # プレイヤー
+                1: (255, 100, 100),  # 敵
+            }
+            unit_color = unit_colors.get(team, (200, 200, 200))
+            
+            sprite = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
+            center = (GRID_SIZE // 2, GRID_SIZE // 2)
+            pygame.draw.circle(sprite, unit_color, center, GRID_SIZE // 3)
+            
+            # ユニット名の頭文字
+            name_surface = get_font(16).render(initial, True, (0, 0, 0))
+            sprite.blit(name_surface, name_surface.get_rect(center=center))
+            
+            sprite = sprite.convert_alpha()
+            self._unit_sprite_cache[key] = sprite
+        return sprite
+    
     def handle_event(self, event):
         """イベント処理"""
         # UI要素のイベント処理
@@ -273,8 +273,8 @@ class MovementSystem:
     
     def get_move_cost(self, unit, terrain: TerrainType) -> int:
         """ユニットの移動タイプと地形に基づいた移動コストを取得"""
-        # ユニットからMovementTypeを取得
-        move_type = unit.movement_type if hasattr(unit, 'movement_type') else MovementType.INFANTRY
+        # ユニットからMovementTypeを取得（Unitは構築時に必ず設定している）
+        move_type = unit.movement_type
         
         # カスタム移動コストがあればそれを優先
         unit_id = id(unit)
@@ -314,7 +314,7 @@ class MovementSystem:
     
     def get_terrain_features(self, unit, terrain: TerrainType) -> dict:
         """ユニットの移動タイプに基づいた地形の特殊効果を取得"""
-        move_type = unit.movement_type if hasattr(unit, 'movement_type') else MovementType.INFANTRY
+        move_type = unit.movement_type
         type_data = self.movement_data.get(move_type, self.movement_data.get(MovementType.INFANTRY))
         features = type_data.get('features', {})
         
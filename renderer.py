@@ -5,6 +5,14 @@ from constants import COLOR_GREEN, COLOR_YELLOW, TerrainType
 from font_manager import get_font  # フォントマネージャーをインポート
 
 class GameRenderer:
+    # フェーズに応じたメッセージ
+    PHASE_MESSAGES = {
+        "select_unit": "ユニットを選択",
+        "move_unit": "移動先を選択",
+        "select_action": "行動を選択: [A]攻撃 or [W]待機",
+        "select_attack_target": "攻撃対象を選択"
+    }
+    
     def __init__(self, screen, game_manager):
         self.screen = screen
         self.game_manager = game_manager
@@ -32,12 +40,68 @@ class GameRenderer:
         self.animation_timer = 0
         self.animation_frame = 0
         self.max_animation_frames = 60
+        
+        # 地形を焼き込んだマップ画像のキャッシュ
+        self._map_surface = None
+        self._map_dirty = True
+        # マップ画像の外側（毎フレーム背景色で消す範囲）
+        self._clear_rects = []
+        
+        # ユニット描画用のキャッシュ（チーム -> 円のスプライト）
+        self._unit_sprites = {}
+        
+        # 一様な半透明の塗りは、ピクセル単位のアルファではなく
+        # 不透明Surface + set_alphaにして高速なブレンド経路を使う
+        
+        # 行動済みユニット用の半透明ブラック
+        self._moved_overlay = self._solid_overlay((GRID_SIZE, GRID_SIZE), COLOR_BLACK, 128)
+        
+        # 戦闘アニメーション時に背景を暗くする全画面オーバーレイ
+        self._combat_dim = self._solid_overlay(screen.get_size(), COLOR_BLACK, 192)
+        
+        # ターン表示のキャッシュ（(ターン, 手番) が変わった時のみ更新）
+        self._last_turn_key = None
+        self._turn_surface = None
+        
+        # 移動範囲・攻撃範囲の半透明オーバーレイ
+        self._move_overlay = self._solid_overlay((GRID_SIZE, GRID_SIZE), (0, 0, 255), 128)  # 半透明ブルー
+        self._attack_overlay = self._solid_overlay((GRID_SIZE, GRID_SIZE), (255, 0, 0), 128)  # 半透明レッド
+        
+        # 範囲表示のblit列（対象リストが差し替えられた時のみ作り直す）
+        self._range_blits = {}
+        
+        # HPバー（色ごとに最大幅で塗ったものを切り出して使う）
+        self._hp_bars = {}
+        for hp_color in (COLOR_GREEN, COLOR_YELLOW, COLOR_RED):
+            bar = pygame.Surface((GRID_SIZE, 5)).convert(screen)
+            bar.fill(hp_color)
+            self._hp_bars[hp_color] = bar
+    
+    def _solid_overlay(self, size, color, alpha):
+        """画面と同じピクセル形式の、一様な半透明Surfaceを作成"""
+        overlay = pygame.Surface(size).convert(self.screen)
+        overlay.fill(color)
+        overlay.set_alpha(alpha)
+        return overlay
+    
+    def invalidate_map(self):
+        """地形が変化した際にマップ画像のキャッシュを破棄する"""
+        self._map_dirty = True
+        self.game_manager.dirty = True
     
     def render(self):
-        """従来の完全な描画（UI連携後は主に下位メソッドを使用）"""
-        self.screen.fill(COLOR_BLACK)
+        """従来の完全な描画（UI連携後は主に下位メソッドを使用）
+        
+        ゲーム状態に変化が無ければ何も描画しない。
+        """
+        game_manager = self.game_manager
+        if not (game_manager.dirty or game_manager.combat_animation_active or self._map_dirty):
+            return
+        
+        # 描画中に発生した変化（アニメーション終了など）は次フレームで拾う
+        game_manager.dirty = False
         
-        # マップの描画
+        # マップの描画（マップ外の背景もここで消す）
         self.render_map()
         
         # 選択中のユニットの移動範囲
@@ -61,60 +125,104 @@ class GameRenderer:
     
     def render_map(self):
         """マップのみ描画（UIシステムと連携するために分離）"""
-        self.screen.fill(COLOR_BLACK)
+        # 地形が変化した場合のみマップ画像を作り直す
+        if self._map_dirty or self._map_surface is None:
+            self._map_surface = self._build_map_surface()
+            self._map_dirty = False
+            
+            # 画面のうちマップ画像で覆われない右側と下側
+            screen_width, screen_height = self.screen.get_size()
+            map_width, map_height = self._map_surface.get_size()
+            self._clear_rects = [rect for rect in (pygame.Rect(map_width, 0, screen_width - map_width, screen_height),
+                                                   pygame.Rect(0, map_height, map_width, screen_height - map_height))
+                                 if rect.width > 0 and rect.height > 0]
         
+        # 画面全体ではなく、マップ画像の外側だけを背景色で消す
+        for rect in self._clear_rects:
+            self.screen.fill(COLOR_BLACK, rect)
+        self.screen.blit(self._map_surface, (0, 0))
+    
+    def _build_map_surface(self):
+        """全タイルを1枚のSurfaceに描画する"""
         game_map = self.game_manager.game_map
+        width, height = game_map.cols * GRID_SIZE, game_map.rows * GRID_SIZE
+        surface = pygame.Surface((width, height))
         
+        # 地形の塗りつぶし（Surface.fillで直接ピクセルを書き込む）
+        terrain_colors = self.terrain_colors
+        for y, row in enumerate(game_map.tiles):
+            for x, tile in enumerate(row):
+                color = terrain_colors.get(tile.terrain_type, COLOR_BLACK)
+                surface.fill(color, (x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE))
+        
+        # グリッド線（各タイルの外周1pxと同じ見た目を行・列単位で描く）
+        for x in range(game_map.cols):
+            surface.fill(COLOR_BLACK, (x * GRID_SIZE, 0, 1, height))
+            surface.fill(COLOR_BLACK, (x * GRID_SIZE + GRID_SIZE - 1, 0, 1, height))
         for y in range(game_map.rows):
-            for x in range(game_map.cols):
-                terrain = game_map.tiles[y][x].terrain_type
-                color = self.terrain_colors.get(terrain, COLOR_BLACK)
-                
-                rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-                pygame.draw.rect(self.screen, color, rect)
-                pygame.draw.rect(self.screen, COLOR_BLACK, rect, 1)  # グリッド線
+            surface.fill(COLOR_BLACK, (0, y * GRID_SIZE, width, 1))
+            surface.fill(COLOR_BLACK, (0, y * GRID_SIZE + GRID_SIZE - 1, width, 1))
+        
+        return surface
     
     def render_units(self):
         """ユニットのみ描画（UIシステムと連携するために分離）"""
+        unit_blits = []
+        hp_blits = []
+        moved_blits = []
+        
         for unit in self.game_manager.game_map.units:
             if unit.is_dead():
                 continue
-                
-            color = self.team_colors.get(unit.team, COLOR_WHITE)
+            
             x, y = unit.x * GRID_SIZE, unit.y * GRID_SIZE
             
             # ユニットの描画（簡易的な円）
-            pygame.draw.circle(self.screen, color, (x + GRID_SIZE // 2, y + GRID_SIZE // 2), GRID_SIZE // 2 - 2)
+            unit_blits.append((self._unit_sprite(unit.team), (x, y)))
             
             # HPバー
-            hp_ratio = unit.current_hp / unit.max_hp
-            hp_color = COLOR_GREEN if hp_ratio > 0.5 else COLOR_YELLOW if hp_ratio > 0.25 else COLOR_RED
-            hp_width = int(GRID_SIZE * hp_ratio)
-            pygame.draw.rect(self.screen, hp_color, (x, y + GRID_SIZE - 5, hp_width, 5))
+            hp_blits.append((self._hp_bars[unit.hp_color], (x, y + GRID_SIZE - 5), (0, 0, unit.hp_bar_width, 5)))
             
             # 既に行動済みのユニットは暗く表示
             if unit.has_moved:
-                s = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
-                s.fill((0, 0, 0, 128))  # 半透明ブラック
-                self.screen.blit(s, (x, y))
+                moved_blits.append((self._moved_overlay, (x, y)))
+        
+        # 円 → HPバー → 暗転の順にまとめて描画
+        self.screen.blits(unit_blits, False)
+        self.screen.blits(hp_blits, False)
+        self.screen.blits(moved_blits, False)
+    
+    def _unit_sprite(self, team):
+        """チーム色の円スプライトを取得（初回のみ作成）"""
+        sprite = self._unit_sprites.get(team)
+        if sprite is None:
+            color = self.team_colors.get(team, COLOR_WHITE)
+            sprite = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, (GRID_SIZE // 2, GRID_SIZE // 2), GRID_SIZE // 2 - 2)
+            sprite = sprite.convert_alpha(self.screen)
+            self._unit_sprites[team] = sprite
+        return sprite
     
     def _render_movement_range(self):
         """移動範囲を描画"""
         if self.game_manager.phase == "move_unit" and self.game_manager.move_targets:
-            for x, y in self.game_manager.move_targets:
-                rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-                s = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
-                s.fill((0, 0, 255, 128))  # 半透明ブルー
-                self.screen.blit(s, (x * GRID_SIZE, y * GRID_SIZE))
+            self.screen.blits(self._range_blit_list("move", self._move_overlay,
+                                                    self.game_manager.move_targets), False)
     
     def _render_attack_range(self):
         """攻撃範囲を描画"""
         if self.game_manager.phase == "select_attack_target" and self.game_manager.attack_targets:
-            for x, y in self.game_manager.attack_targets:
-                rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-                s = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
-                s.fill((255, 0, 0, 128))  # 半透明レッド
-                self.screen.blit(s, (x * GRID_SIZE, y * GRID_SIZE))
+            self.screen.blits(self._range_blit_list("attack", self._attack_overlay,
+                                                    self.game_manager.attack_targets), False)
+    
+    def _range_blit_list(self, kind, overlay, targets):
+        """範囲タイルのblit列を取得（対象リストが変わった時のみ座標を計算）"""
+        cached = self._range_blits.get(kind)
+        if cached is None or cached[0] is not targets:
+            blits = [(overlay, (x * GRID_SIZE, y * GRID_SIZE)) for x, y in targets]
+            cached = (targets, blits)
+            self._range_blits[kind] = cached
+        return cached[1]
     
     def _render_selected_unit(self):
         """選択中のユニットをハイライト表示"""
@@ -126,40 +234,41 @@ class GameRenderer:
     
     def _render_ui(self):
         """基本的なUI要素を描画"""
-        # 現在のターンとフェーズの表示
-        turn_text = f"ターン {self.game_manager.current_turn+1} - {'プレイヤー' if self.game_manager.turn_player == 0 else '敵'}"
-        turn_surface = self.font.render(turn_text, True, COLOR_WHITE)
+        # 現在のターンとフェーズの表示（ターンか手番が変わった時のみ作り直す）
+        turn_key = (self.game_manager.current_turn, self.game_manager.turn_player)
+        if turn_key != self._last_turn_key:
+            turn_text = f"ターン {turn_key[0]+1} - {'プレイヤー' if turn_key[1] == 0 else '敵'}"
+            self._turn_surface = self._text(turn_text, COLOR_WHITE)
+            self._last_turn_key = turn_key
+        turn_surface = self._turn_surface
         self.screen.blit(turn_surface, (10, self.screen.get_height() - 30))
         
         # 選択中のユニット情報
         if self.game_manager.selected_unit:
             unit = self.game_manager.selected_unit
             unit_text = f"{unit.name} - HP: {unit.current_hp}/{unit.max_hp}"
-            unit_surface = self.font.render(unit_text, True, COLOR_WHITE)
+            unit_surface = self._text(unit_text, COLOR_WHITE)
             self.screen.blit(unit_surface, (self.screen.get_width() - 200, self.screen.get_height() - 30))
             
             # スキルリストの表示
             if hasattr(unit, 'skills') and unit.skills:
                 y_offset = 60
-                skill_title_surface = self.font.render("スキル:", True, COLOR_WHITE)
+                skill_title_surface = self._text("スキル:", COLOR_WHITE)
                 self.screen.blit(skill_title_surface, (self.screen.get_width() - 200, y_offset))
                 
                 for i, skill in enumerate(unit.skills):
-                    skill_surface = self.font.render(f"- {skill.name}", True, COLOR_WHITE)
+                    skill_surface = self._text(f"- {skill.name}", COLOR_WHITE)
                     self.screen.blit(skill_surface, (self.screen.get_width() - 190, y_offset + 20 + i * 20))
         
         # フェーズに応じたメッセージ
-        phase_messages = {
-            "select_unit": "ユニットを選択",
-            "move_unit": "移動先を選択",
-            "select_action": "行動を選択: [A]攻撃 or [W]待機",
-            "select_attack_target": "攻撃対象を選択"
-        }
-        
-        phase_text = phase_messages.get(self.game_manager.phase, "")
-        phase_surface = self.font.render(phase_text, True, COLOR_WHITE)
+        phase_text = self.PHASE_MESSAGES.get(self.game_manager.phase, "")
+        phase_surface = self._text(phase_text, COLOR_WHITE)
         self.screen.blit(phase_surface, (10, 10))
     
+    def _text(self, text, color):
+        """文字列を描画したSurfaceを取得（キャッシュはフォント側で行う）"""
+        return self.font.render(text, True, color)
+    
     def _render_combat_animation(self):
         """戦闘アニメーションを描画（日本語対応）"""
         if not self.game_manager.combat_results:
@@ -176,9 +285,7 @@ class GameRenderer:
         defender = results["defender_unit"]
         
         # 背景を暗くする
-        s = pygame.Surface((self.screen.get_width(), self.screen.get_height()), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 192))
-        self.screen.blit(s, (0, 0))
+        self.screen.blit(self._combat_dim, (0, 0))
         
         # 戦闘ウィンドウの表示
         window_rect = pygame.Rect(50, 50, self.screen.get_width() - 100, self.screen.get_height() - 100)
@@ -190,8 +297,8 @@ class GameRenderer:
         defender_text = f"{defender.name}: HP {defender.current_hp}/{defender.max_hp}"
         
         # 日本語対応フォントでテキストをレンダリング
-        attacker_surface = self.font.render(attacker_text, True, COLOR_BLACK)
-        defender_surface = self.font.render(defender_text, True, COLOR_BLACK)
+        attacker_surface = self._text(attacker_text, COLOR_BLACK)
+        defender_surface = self._text(defender_text, COLOR_BLACK)
         
         # テキストの表示
         self.screen.blit(attacker_surface, (70, 70))
@@ -211,7 +318,7 @@ class GameRenderer:
                 crit_text = "会心!" if result["critical"] else ""
                 damage_text = f"{hit_text} {crit_text} ダメージ: {result['damage']}"
                 
-                result_surface = self.font.render(damage_text, True, COLOR_BLUE)
+                result_surface = self._text(damage_text, COLOR_BLUE)
                 self.screen.blit(result_surface, (70, y_offset + i * 30))
         
         if self.animation_frame >= 25:  # 防御側の結果を表示
@@ -221,7 +328,7 @@ class GameRenderer:
                 crit_text = "会心!" if result["critical"] else ""
                 damage_text = f"{hit_text} {crit_text} ダメージ: {result['damage']}"
                 
-                result_surface = self.font.render(damage_text, True, COLOR_RED)
+                result_surface = self._text(damage_text, COLOR_RED)
                 self.screen.blit(result_surface, (70, y_offset + i * 30))
         
         # スキル発動情報の表示
@@ -236,20 +343,20 @@ class GameRenderer:
             if attacker_skills:
                 attacker_name = attacker.name
                 skill_text = f"{attacker_name}のスキル発動: {', '.join(attacker_skills)}"
-                skill_surface = self.font.render(skill_text, True, COLOR_BLUE)
+                skill_surface = self._text(skill_text, COLOR_BLUE)
                 self.screen.blit(skill_surface, (70, y_offset))
                 y_offset += 25
             
             if defender_skills:
                 defender_name = defender.name
                 skill_text = f"{defender_name}のスキル発動: {', '.join(defender_skills)}"
-                skill_surface = self.font.render(skill_text, True, COLOR_RED)
+                skill_surface = self._text(skill_text, COLOR_RED)
                 self.screen.blit(skill_surface, (70, y_offset))
         
         # 続行ボタンの表示（アニメーション終了後）
         if self.animation_frame >= 50:
             continue_text = "クリックで続行"
-            continue_surface = self.font.render(continue_text, True, COLOR_BLACK)
+            continue_surface = self._text(continue_text, COLOR_BLACK)
             continue_rect = continue_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() - 100))
             self.screen.blit(continue_surface, continue_rect)
             
@@ -258,9 +365,11 @@ class GameRenderer:
                 pygame.draw.rect(self.screen, COLOR_YELLOW, continue_rect.inflate(10, 5), 2)
         
         # 戦闘アニメーションを終了
-        if self.animation_frame >= self.max_animation_frames or pygame.mouse.get_pressed()[0]:
+        # （クリックによる早送り・終了は handle_combat_animation_click で処理）
+        if self.animation_frame >= self.max_animation_frames:
             self.game_manager.combat_animation_active = False
             self.game_manager.combat_results = None
+            self.game_manager.dirty = True
             self.animation_timer = 0
             self.animation_frame = 0
     
@@ -273,5 +382,6 @@ class GameRenderer:
             # アニメーション終了
             self.game_manager.combat_animation_active = False
             self.game_manager.combat_results = None
+            self.game_manager.dirty = True
             self.animation_timer = 0
             self.animation_frame = 0
\ No newline at end of file
@@ -31,17 +31,20 @@ class SaveShop(Panel):
         
         # セーブスロットの表示
         self.create_save_slots(save_slots_panel)
+        
+        # スロット一覧は一枚の画像にまとめて描画（表示内容やホバーが変わった時のみ再描画）
+        save_slots_panel.render_to_cache()
     
     def create_save_slots(self, parent_panel):
-        """セーブスロットを作成"""
-        # 現在のセーブデータを取得
-        saves = self.save_system.get_all_saves()
-        
+        """セーブスロットを作成（ウィジェットは一度だけ生成し、以降は内容のみ更新）"""
         # セーブスロットのレイアウト
         slot_width = parent_panel.width - 20
         slot_height = 80
         slot_spacing = 10
         
+        # スロット番号 -> 更新対象のウィジェット
+        self.slot_views = {}
+        
         # 9つのセーブスロットを作成
         for i in range(1, 10):
             y_pos = (i - 1) * (slot_height + slot_spacing) + 10
@@ -52,58 +55,77 @@ class SaveShop(Panel):
             # スロット番号
             slot_panel.add_child(Label(20, 10, f"スロット {i}", None, 20, (255, 255, 255)))
             
-            # セーブデータがある場合は情報を表示
-            if i in saves:
-                save_info = saves[i]
-                
-                # 保存日時
-                slot_panel.add_child(Label(20, 35, f"保存日時: {save_info['save_time']}", None, 16, (200, 200, 255)))
-                
-                # プレイ時間
-                play_time = save_info.get('play_time', 0)
-                hours = play_time // 3600
-                minutes = (play_time % 3600) // 60
-                time_text = f"プレイ時間: {hours}時間{minutes}分"
-                slot_panel.add_child(Label(20, 55, time_text, None, 16, (200, 200, 255)))
-                
-                # 進行状況
-                progress_text = f"シナリオ: {save_info.get('current_scenario', '不明')}"
-                slot_panel.add_child(Label(slot_width - 150, 35, progress_text, None, 16, (200, 255, 200)))
+            # セーブデータがある場合の表示（保存日時・プレイ時間・進行状況）
+            view = {
+                "save_time": slot_panel.add_child(Label(20, 35, "", None, 16, (200, 200, 255))),
+                "play_time": slot_panel.add_child(Label(20, 55, "", None, 16, (200, 200, 255))),
+                "progress": slot_panel.add_child(Label(slot_width - 150, 35, "", None, 16, (200, 255, 200))),
                 
                 # 上書き保存ボタン
-                overwrite_btn = Button(slot_width - 170, 10, 80, 25, "上書き", None, 16,
-                                      (60, 100, 60), (255, 255, 255), (80, 150, 80),
-                                      (0, 0, 0), 1, lambda slot=i: self.save_game(slot))
-                slot_panel.add_child(overwrite_btn)
+                "overwrite_btn": slot_panel.add_child(Button(slot_width - 170, 10, 80, 25, "上書き", None, 16,
+                                                             (60, 100, 60), (255, 255, 255), (80, 150, 80),
+                                                             (0, 0, 0), 1, lambda slot=i: self.save_game(slot))),
                 
                 # ロードボタン
-                load_btn = Button(slot_width - 80, 10, 70, 25, "ロード", None, 16,
-                                 (60, 60, 100), (255, 255, 255), (80, 80, 150),
-                                 (0, 0, 0), 1, lambda slot=i: self.load_game(slot))
-                slot_panel.add_child(load_btn)
-            else:
+                "load_btn": slot_panel.add_child(Button(slot_width - 80, 10, 70, 25, "ロード", None, 16,
+                                                        (60, 60, 100), (255, 255, 255), (80, 80, 150),
+                                                        (0, 0, 0), 1, lambda slot=i: self.load_game(slot))),
+                
                 # 空きスロット
-                slot_panel.add_child(Label(slot_width // 2, 40, "空きスロット", None, 18, (180, 180, 180), None, "center"))
+                "empty": slot_panel.add_child(Label(slot_width // 2, 40, "空きスロット", None, 18, (180, 180, 180), None, "center")),
                 
                 # 新規保存ボタン
-                save_btn = Button(slot_width - 80, 10, 70, 25, "保存", None, 16,
-                                 (60, 100, 60), (255, 255, 255), (80, 150, 80),
-                                 (0, 0, 0), 1, lambda slot=i: self.save_game(slot))
-                slot_panel.add_child(save_btn)
+                "save_btn": slot_panel.add_child(Button(slot_width - 80, 10, 70, 25, "保存", None, 16,
+                                                        (60, 100, 60), (255, 255, 255), (80, 150, 80),
+                                                        (0, 0, 0), 1, lambda slot=i: self.save_game(slot))),
+            }
+            self.slot_views[i] = view
             
             parent_panel.add_child(slot_panel)
+        
+        self.refresh_save_slots()
+    
+    def refresh_save_slots(self):
+        """現在のセーブデータに合わせてスロットの表示内容を更新"""
+        saves = self.save_system.get_all_saves()
+        
+        for i, view in self.slot_views.items():
+            save_info = saves.get(i)
+            has_save = save_info is not None
+            
+            for key in ("save_time", "play_time", "progress", "overwrite_btn", "load_btn"):
+                view[key].set_visible(has_save)
+            view["empty"].set_visible(not has_save)
+            view["save_btn"].set_visible(not has_save)
+            
+            if has_save:
+                # 保存日時
+                view["save_time"].set_text(f"保存日時: {save_info['save_time']}")
+                
+                # プレイ時間
+                play_time = save_info.get('play_time', 0)
+                hours = play_time // 3600
+                minutes = (play_time % 3600) // 60
+                view["play_time"].set_text(f"プレイ時間: {hours}時間{minutes}分")
+                
+                # 進行状況
+                view["progress"].set_text(f"シナリオ: {save_info.get('current_scenario', '不明')}")
     
     def save_game(self, slot):
         """ゲームを保存"""
         # ゲームデータの取得
         game_data = self.game_manager.prepare_save_data()
         
-        # 保存処理
-        success = self.save_system.save_game(slot, game_data)
-        
+        # 保存処理（ファイル書き込みはバックグラウンドで行う）
+        self.save_system.save_game_async(slot, game_data, self.on_save_finished)
+    
+    def on_save_finished(self, success):
+        """セーブ完了時の処理"""
         if success:
+            # スロット表示を最新の状態にする
+            self.refresh_save_slots()
+            
             # 保存成功メッセージ（未実装）
-            pass
         else:
             # 保存失敗メッセージ（未実装）
             pass
@@ -125,6 +147,14 @@ class SaveShop(Panel):
             # ロード失敗メッセージ（未実装）
             pass
     
+    def handle_event(self, event):
+        """イベント処理"""
+        # 非同期セーブの完了通知
+        if self.save_system.handle_event(event):
+            return True
+        
+        return super().handle_event(event)
+    
     def close_shop(self):
         """セーブ屋を閉じる"""
         if self.on_close:
@@ -1,75 +1,197 @@
 # save_system.py
 import json
 import os
+import pickle
 import datetime
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+
+try:
+    import orjson
+except ImportError:
+    # orjsonが無い環境では標準のjsonを使う
+    orjson = None
+
+# 非同期セーブ完了を通知するイベントタイプ
+SAVE_COMPLETE_EVENT = pygame.USEREVENT + 1
+
+# セーブファイルの拡張子（pickle形式）と、旧形式（JSON）の拡張子
+SAVE_EXT = ".sav"
+LEGACY_SAVE_EXT = ".json"
+
+def _dumps(obj, pretty=False) -> bytes:
+    """オブジェクトをUTF-8のJSONバイト列に変換"""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if pretty else None).encode('utf-8')
+
+def _loads(data: bytes):
+    """JSONバイト列をオブジェクトに変換"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
 
 class SaveSystem:
     def __init__(self, save_directory="saves"):
         self.save_directory = save_directory
         os.makedirs(save_directory, exist_ok=True)
+        
+        # ファイルI/O用のワーカー（書き込み順を保つため1スレッド）
+        self._io = ThreadPoolExecutor(max_workers=1)
+        
+        # スロットごとの概要情報（セーブファイルを開かずに一覧を表示するため）
+        self._index_path = os.path.join(save_directory, "index.json")
+        self._index = self._load_index()
     
     def save_game(self, slot, game_data):
         """ゲームデータをセーブ"""
-        save_path = os.path.join(self.save_directory, f"save_{slot}.json")
+        return self._write_save(slot, self._prepare_save_data(game_data))
+    
+    def save_game_async(self, slot, game_data, on_done=None):
+        """ゲームデータをバックグラウンドでセーブ
+        
+        完了するとSAVE_COMPLETE_EVENTが投稿され、handle_event経由で
+        メインスレッド上でon_done(success)が呼ばれる。
+        """
+        save_data = self._prepare_save_data(game_data)
+        future = self._io.submit(self._write_save, slot, save_data)
+        
+        def notify(done_future):
+            pygame.event.post(pygame.event.Event(SAVE_COMPLETE_EVENT, slot=slot,
+                                                 success=done_future.result(), on_done=on_done))
+        
+        future.add_done_callback(notify)
+        return future
+    
+    def handle_event(self, event):
+        """非同期セーブの完了イベントを処理"""
+        if event.type != SAVE_COMPLETE_EVENT:
+            return False
         
-        # セーブデータに日時を追加
+        if event.on_done:
+            event.on_done(event.success)
+        return True
+    
+    def _prepare_save_data(self, game_data):
+        """セーブデータに日時を追加"""
         save_data = game_data.copy()
         save_data["save_time"] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return save_data
+    
+    def _save_path(self, slot, ext=SAVE_EXT):
+        """スロットのセーブファイルのパスを取得"""
+        return os.path.join(self.save_directory, f"save_{slot}{ext}")
+    
+    def _write_save(self, slot, save_data):
+        """セーブデータを一時ファイル経由で書き込む"""
+        save_path = self._save_path(slot)
+        temp_path = save_path + ".tmp"
         
         try:
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
-            return True
+            with open(temp_path, 'wb') as f:
+                pickle.dump(save_data, f, protocol=5)
+            os.replace(temp_path, save_path)
         except Exception as e:
             print(f"セーブエラー: {e}")
             return False
+        
+        # 概要インデックスを更新
+        self._index[slot] = self._summarize(save_data)
+        self._write_index()
+        return True
     
-    def load_game(self, slot):
-        """セーブデータをロード"""
-        save_path = os.path.join(self.save_directory, f"save_{slot}.json")
+    def _summarize(self, save_data):
+        """セーブデータから一覧表示用の基本情報を抽出"""
+        return {
+            "save_time": save_data.get("save_time", "不明"),
+            "party": save_data.get("party", []),
+            "play_time": save_data.get("play_time", 0),
+            "gold": save_data.get("gold", 0),
+            "current_scenario": save_data.get("current_scenario", "")
+        }
+    
+    def _load_index(self):
+        """概要インデックスを読み込む（無ければセーブファイルから再構築）"""
+        if os.path.exists(self._index_path):
+            try:
+                with open(self._index_path, 'rb') as f:
+                    return {int(slot): info for slot, info in _loads(f.read()).items()}
+            except Exception as e:
+                print(f"セーブインデックス読み込みエラー: {e}")
         
-        if not os.path.exists(save_path):
-            return None
+        index = {}
+        for i in range(1, 10):  # 9つのセーブスロット
+            info = self.get_save_info(i)
+            if info:
+                index[i] = info
         
+        self._index = index
+        self._write_index()
+        return index
+    
+    def _write_index(self):
+        """概要インデックスを一時ファイル経由で書き込む"""
+        temp_path = self._index_path + ".tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(_dumps(self._index))
+            os.replace(temp_path, self._index_path)
+        except Exception as e:
+            print(f"セーブインデックス保存エラー: {e}")
+    
+    def _read_save(self, slot):
+        """セーブファイルを読み込む（旧形式のJSONにも対応）。存在しなければNone"""
+        save_path = self._save_path(slot)
+        if os.path.exists(save_path):
+            with open(save_path, 'rb') as f:
+                return pickle.load(f)
+        
+        legacy_path = self._save_path(slot, LEGACY_SAVE_EXT)
+        if os.path.exists(legacy_path):
+            with open(legacy_path, 'rb') as f:
+                return _loads(f.read())
+        
+        return None
+    
+    def load_game(self, slot):
+        """セーブデータをロード"""
         try:
-            with open(save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
-            return save_data
+            return self._read_save(slot)
         except Exception as e:
             print(f"ロードエラー: {e}")
             return None
     
     def get_save_info(self, slot):
         """セーブデータの基本情報を取得"""
-        save_path = os.path.join(self.save_directory, f"save_{slot}.json")
-        
-        if not os.path.exists(save_path):
-            return None
-        
         try:
-            with open(save_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = self._read_save(slot)
+            if save_data is None:
+                return None
             
             # 基本情報のみ抽出
-            info = {
-                "save_time": save_data.get("save_time", "不明"),
-                "party": save_data.get("party", []),
-                "play_time": save_data.get("play_time", 0),
-                "gold": save_data.get("gold", 0),
-                "current_scenario": save_data.get("current_scenario", "")
-            }
-            return info
+            return self._summarize(save_data)
         except Exception as e:
             print(f"セーブ情報取得エラー: {e}")
             return None
     
-    def get_all_saves(self):
-        """全セーブデータの情報を取得"""
-        saves = {}
-        
-        for i in range(1, 10):  # 9つのセーブスロット
-            info = self.get_save_info(i)
-            if info:
-                saves[i] = info
+    def export_json(self, slot, export_path=None):
+        """デバッグ用にセーブデータをインデント付きJSONで書き出す"""
+        save_data = self.load_game(slot)
+        if save_data is None:
+            return False
         
-        return saves
\ No newline at end of file
+        export_path = export_path or self._save_path(slot, ".debug.json")
+        try:
+            with open(export_path, 'wb') as f:
+                f.write(_dumps(save_data, pretty=True))
+            return True
+        except Exception as e:
+            print(f"JSON書き出しエラー: {e}")
+            return False
+    
+    def get_all_saves(self):
+        """全セーブデータの情報を取得（概要インデックスから返す）"""
+        return dict(self._index)
\ No newline at end of file
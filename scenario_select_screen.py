@@ -42,6 +42,9 @@ class ScenarioSelectScreen(Panel):
         # コンテンツの高さを更新
         scenario_list.update_content_height()
         
+        # シナリオ一覧は一枚の画像にまとめて描画（ホバーが変わった時のみ再描画）
+        scenario_list.render_to_cache()
+        
         # 戻るボタン
         back_btn = Button(20, height - 60, 100, 40, "戻る", None, 24,
                          (100, 60, 60), (255, 255, 255), (150, 80, 80),
@@ -21,26 +21,6 @@ def create_weapons():
         "fire": fire
     }
 
-def create_units(weapons):
-    """ユニットを作成する"""
-    # プレイヤーユニット
-    marth = Unit("Marth", "Lord", 1, 20, 5, 0, 7, 9, 7, 5, 0, 5, 0, [weapons["iron_sword"]])
-    roy = Unit("Roy", "Knight", 1, 24, 8, 0, 5, 4, 3, 9, 2, 4, 0, [weapons["iron_lance"]])
-    lyn = Unit("Lyn", "Myrmidon", 1, 18, 4, 0, 9, 10, 8, 3, 2, 6, 0, [weapons["iron_sword"]])
-    hector = Unit("Hector", "Fighter", 1, 26, 9, 0, 4, 5, 2, 8, 1, 4, 0, [weapons["iron_axe"]])
-    robin = Unit("Robin", "Mage", 1, 16, 2, 7, 6, 6, 5, 2, 6, 5, 0, [weapons["fire"]])
-    
-    # 敵ユニット
-    bandit1 = Unit("Bandit", "Fighter", 1, 22, 7, 0, 3, 4, 1, 6, 0, 4, 1, [weapons["iron_axe"]])
-    bandit2 = Unit("Archer", "Archer", 1, 18, 5, 0, 7, 5, 2, 4, 0, 5, 1, [weapons["iron_bow"]])
-    bandit3 = Unit("Soldier", "Soldier", 1, 20, 6, 0, 5, 5, 2, 5, 1, 4, 1, [weapons["iron_lance"]])
-    bandit4 = Unit("Mage", "Mage", 1, 16, 1, 6, 6, 6, 3, 2, 5, 5, 1, [weapons["fire"]])
-    
-    player_units = [marth, roy, lyn, hector, robin]
-    enemy_units = [bandit1, bandit2, bandit3, bandit4]
-    
-    return player_units, enemy_units
-
 def add_skills_to_units(game_map):
     """ユニットにスキルを割り当てる"""
     skills = create_sample_skills()
@@ -82,11 +62,7 @@ def setup_game(game_map):
     player_units, enemy_units = create_units(weapons)
     
     # プレイヤーユニットの配置と設定
-    placement_positions = [
-        (2, 2), (1, 3), (3, 3), (2, 4), (4, 2)
-    ]
-    
-    for unit, (x, y) in zip(player_units, placement_positions):
+    for unit, (x, y) in zip(player_units, PLAYER_POSITIONS):
         game_map.place_unit(unit, x, y)
         
         # 主人公の設定 - Marthを主人公に指定
@@ -94,64 +70,54 @@ def setup_game(game_map):
             unit.is_hero = True
             unit.is_important = True
     
-    # 敵ユニットの配置と設定
-    enemy_positions = [
-        (12, 7), (10, 8), (11, 6), (9, 7)
-    ]
-    
-    for i, (unit, (x, y)) in enumerate(zip(enemy_units, enemy_positions)):
+    # 敵ユニットの配置と設定（AI役割も割り当て）
+    for unit, (x, y), ai_role in zip(enemy_units, ENEMY_POSITIONS, ENEMY_AI_ROLES):
         game_map.place_unit(unit, x, y)
-        
-        # AI役割の設定 - 敵ユニットに役割を割り当て
-        if i == 0:  # bandit1
-            unit.ai_role = "attacker"  # 攻撃役
-        elif i == 1:  # bandit2
-            unit.ai_role = "assassin"  # 暗殺者
-        elif i == 2:  # bandit3
-            unit.ai_role = "tank"      # タンク役
-        elif i == 3:  # bandit4
-            unit.ai_role = "healer"    # 回復役
+        unit.ai_role = ai_role
     
-    # スキルの割り当て
+    # スキルの割り当て（移動タイプはステータス表で設定済み）
     add_skills_to_units(game_map)
-    
-    # 移動タイプの調整（必要に応じて）
-    for unit in game_map.units:
-        if unit.name == "Marth":
-            unit.movement_type = MovementType.INFANTRY
-        elif unit.name == "Hector":
-            unit.movement_type = MovementType.ARMORED
-        elif unit.name == "Roy":
-            unit.movement_type = MovementType.CAVALRY
-        elif unit.name == "Robin":
-            unit.movement_type = MovementType.MAGE
 
 def create_units(weapons):
     """ユニットを作成する"""
-    # 既存のコード
     # プレイヤーユニット
-    marth = Unit("Marth", "Lord", 1, 20, 5, 0, 7, 9, 7, 5, 0, 5, 0, [weapons["iron_sword"]])
-    roy = Unit("Roy", "Knight", 1, 24, 8, 0, 5, 4, 3, 9, 2, 4, 0, [weapons["iron_lance"]])
-    lyn = Unit("Lyn", "Myrmidon", 1, 18, 4, 0, 9, 10, 8, 3, 2, 6, 0, [weapons["iron_sword"]])
-    hector = Unit("Hector", "Fighter", 1, 26, 9, 0, 4, 5, 2, 8, 1, 4, 0, [weapons["iron_axe"]])
-    robin = Unit("Robin", "Mage", 1, 16, 2, 7, 6, 6, 5, 2, 6, 5, 0, [weapons["fire"]])
-    
-    # 移動タイプを明示的に設定（オプション）
-    marth.movement_type = MovementType.INFANTRY
-    roy.movement_type = MovementType.CAVALRY  
-    lyn.movement_type = MovementType.INFANTRY
-    hector.movement_type = MovementType.ARMORED
-    robin.movement_type = MovementType.MAGE
+    player_units = [_create_unit(row, weapons, team=0) for row in PLAYER_UNIT_DATA]
     
     # 敵ユニット
-    bandit1 = Unit("Bandit", "Fighter", 1, 22, 7, 0, 3, 4, 1, 6, 0, 4, 1, [weapons["iron_axe"]])
-    bandit2 = Unit("Archer", "Archer", 1, 18, 5, 0, 7, 5, 2, 4, 0, 5, 1, [weapons["iron_bow"]])
-    bandit3 = Unit("Soldier", "Soldier", 1, 20, 6, 0, 5, 5, 2, 5, 1, 4, 1, [weapons["iron_lance"]])
-    bandit4 = Unit("Mage", "Mage", 1, 16, 1, 6, 6, 6, 3, 2, 5, 5, 1, [weapons["fire"]])
-    
-    player_units = [marth, roy, lyn, hector, robin]
-    enemy_units = [bandit1, bandit2, bandit3, bandit4]
+    enemy_units = [_create_unit(row, weapons, team=1) for row in ENEMY_UNIT_DATA]
     
     return player_units, enemy_units
 
-    
\ No newline at end of file
+def _create_unit(row, weapons, team):
+    """ステータス表の1行からユニットを生成する"""
+    name, unit_class, stats, weapon_key, movement_type = row
+    unit = Unit(name, unit_class, 1, *stats, team, [weapons[weapon_key]])
+    
+    # 移動タイプを明示的に設定（オプション）
+    if movement_type:
+        unit.movement_type = movement_type
+    return unit
+
+# ユニットのステータス表
+# (名前, 職業, (HP, 力, 魔力, 技, 速さ, 幸運, 守備, 魔防, 移動), 武器, 移動タイプ)
+PLAYER_UNIT_DATA = (
+    ("Marth", "Lord", (20, 5, 0, 7, 9, 7, 5, 0, 5), "iron_sword", MovementType.INFANTRY),
+    ("Roy", "Knight", (24, 8, 0, 5, 4, 3, 9, 2, 4), "iron_lance", MovementType.CAVALRY),
+    ("Lyn", "Myrmidon", (18, 4, 0, 9, 10, 8, 3, 2, 6), "iron_sword", MovementType.INFANTRY),
+    ("Hector", "Fighter", (26, 9, 0, 4, 5, 2, 8, 1, 4), "iron_axe", MovementType.ARMORED),
+    ("Robin", "Mage", (16, 2, 7, 6, 6, 5, 2, 6, 5), "fire", MovementType.MAGE),
+)
+
+ENEMY_UNIT_DATA = (
+    ("Bandit", "Fighter", (22, 7, 0, 3, 4, 1, 6, 0, 4), "iron_axe", None),
+    ("Archer", "Archer", (18, 5, 0, 7, 5, 2, 4, 0, 5), "iron_bow", None),
+    ("Soldier", "Soldier", (20, 6, 0, 5, 5, 2, 5, 1, 4), "iron_lance", None),
+    ("Mage", "Mage", (16, 1, 6, 6, 6, 3, 2, 5, 5), "fire", None),
+)
+
+# 初期配置
+PLAYER_POSITIONS = ((2, 2), (1, 3), (3, 3), (2, 4), (4, 2))
+ENEMY_POSITIONS = ((12, 7), (10, 8), (11, 6), (9, 7))
+
+# 敵ユニットのAI役割（攻撃役・暗殺者・タンク役・回復役）
+ENEMY_AI_ROLES = ("attacker", "assassin", "tank", "healer")
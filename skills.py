@@ -1,7 +1,10 @@
 # skills.py
 from enum import Enum
-import random
+import operator
+from random import random as _rand
+from collections import namedtuple
 from typing import Dict, Union, Optional, List
+from constants import WeaponType
 
 class SkillTriggerType(Enum):
     # 確率系トリガー
@@ -38,7 +41,163 @@ class SkillEffectType(Enum):
     RANGE_CHANGE = 14     # 攻撃範囲変更
     STATUS_IMMUNITY = 15  # 状態異常耐性
 
+class CombatContext(dict):
+    """戦闘データ。条件判定用の値は辞書として、スキル効果による修正値は属性として保持する"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.damage_modifier = 0
+        self.damage_reduction = 0
+        self.hit_modifier = 0
+        self.avoid_modifier = 0
+        self.crit_modifier = 0
+        self.guaranteed_follow_up = False
+        self.guaranteed_counter = False
+        self.temp_stats = {}  # 能力値名 -> ブースト後の値
+
+# HP閾値トリガーの比較演算子
+_HP_COMPARISONS = {
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+# トリガー判定ハンドラ（skill, unit, combat_data）-> bool
+def _check_percentage(skill, unit, combat_data):
+    # 発動率に基づくチェック（発動率は生成時に0〜1へ換算済み）
+    return _rand() < skill._trigger_chance
+
+def _check_stat_based(skill, unit, combat_data):
+    # 能力値に基づく発動率（例: 技×2%）
+    stat_name = skill._trigger_stat_name
+    if stat_name is not None and hasattr(unit, stat_name):
+        return _rand() < getattr(unit, stat_name) * skill._trigger_chance_per_stat
+    return False
+
+def _check_hp_threshold(skill, unit, combat_data):
+    # HP閾値チェック（例: HP < 50%）
+    compare = skill._hp_compare
+    if compare is None:
+        return False
+    hp_ratio = unit.current_hp / unit.max_hp * 100
+    return compare(hp_ratio, skill._hp_threshold)
+
+def _check_weapon_type(skill, unit, combat_data):
+    # 武器タイプチェック
+    weapon = unit.equipped_weapon
+    return weapon is not None and weapon.weapon_type is skill.trigger_value
+
+def _check_always_active(skill, unit, combat_data):
+    # 常時発動
+    return True
+
+# 戦闘関連トリガー (combat_dataが必要)
+def _check_on_attack(skill, unit, combat_data):
+    return bool(combat_data) and combat_data.get("is_attacker", False)
+
+def _check_on_defend(skill, unit, combat_data):
+    return bool(combat_data) and not combat_data.get("is_attacker", True)
+
+def _check_on_kill(skill, unit, combat_data):
+    return bool(combat_data) and combat_data.get("target_killed", False)
+
+def _check_on_damage(skill, unit, combat_data):
+    return bool(combat_data) and combat_data.get("damage_received", 0) > 0
+
+# トリガータイプ -> 判定ハンドラ（未登録のタイプは常に不発）
+_TRIGGER_HANDLERS = {
+    SkillTriggerType.PERCENTAGE: _check_percentage,
+    SkillTriggerType.STAT_BASED: _check_stat_based,
+    SkillTriggerType.HP_THRESHOLD: _check_hp_threshold,
+    SkillTriggerType.WEAPON_TYPE: _check_weapon_type,
+    SkillTriggerType.ALWAYS_ACTIVE: _check_always_active,
+    SkillTriggerType.ON_ATTACK: _check_on_attack,
+    SkillTriggerType.ON_DEFEND: _check_on_defend,
+    SkillTriggerType.ON_KILL: _check_on_kill,
+    SkillTriggerType.ON_DAMAGE: _check_on_damage,
+}
+
+# 効果適用ハンドラ（skill, unit, target, combat_data, effect_result）
+def _apply_stat_boost(skill, unit, target, combat_data, effect_result):
+    # 一時的な能力値ブースト
+    stat_name = skill._effect_stat_name
+    if stat_name is not None and hasattr(unit, stat_name):
+        current_value = getattr(unit, stat_name)
+        effect_result["boosted_stat"] = stat_name
+        effect_result["boost_amount"] = skill._effect_boost
+        combat_data.temp_stats[stat_name] = current_value + skill._effect_boost
+
+def _apply_damage_boost(skill, unit, target, combat_data, effect_result):
+    # ダメージ増加
+    combat_data.damage_modifier += skill.effect_value
+    effect_result["damage_boost"] = skill.effect_value
+
+def _apply_damage_reduce(skill, unit, target, combat_data, effect_result):
+    # ダメージ減少
+    combat_data.damage_reduction += skill.effect_value
+    effect_result["damage_reduction"] = skill.effect_value
+
+def _apply_hit_boost(skill, unit, target, combat_data, effect_result):
+    # 命中率ブースト
+    combat_data.hit_modifier += skill.effect_value
+    effect_result["hit_boost"] = skill.effect_value
+
+def _apply_avoid_boost(skill, unit, target, combat_data, effect_result):
+    # 回避率ブースト
+    combat_data.avoid_modifier += skill.effect_value
+    effect_result["avoid_boost"] = skill.effect_value
+
+def _apply_critical_boost(skill, unit, target, combat_data, effect_result):
+    # クリティカル率ブースト
+    combat_data.crit_modifier += skill.effect_value
+    effect_result["crit_boost"] = skill.effect_value
+
+def _apply_heal(skill, unit, target, combat_data, effect_result):
+    # HP回復（割合か固定値かは生成時に判定済み）
+    if skill._heal_value is None:
+        return
+    if skill._heal_is_ratio:
+        # 最大HPの割合で回復
+        heal_amount = int(unit.max_hp * skill._heal_value)
+    else:
+        # 固定値で回復
+        heal_amount = skill._heal_value
+        
+    unit.current_hp = min(unit.max_hp, unit.current_hp + heal_amount)
+    effect_result["healed"] = heal_amount
+
+def _apply_follow_up(skill, unit, target, combat_data, effect_result):
+    # 追撃を保証
+    combat_data.guaranteed_follow_up = True
+    effect_result["follow_up"] = True
+
+def _apply_counter_attack(skill, unit, target, combat_data, effect_result):
+    # 反撃を保証（通常反撃できない状況でも）
+    combat_data.guaranteed_counter = True
+    effect_result["counter_attack"] = True
+
+# 効果タイプ -> 適用ハンドラ（未登録のタイプは何もしない）
+_EFFECT_HANDLERS = {
+    SkillEffectType.STAT_BOOST: _apply_stat_boost,
+    SkillEffectType.DAMAGE_BOOST: _apply_damage_boost,
+    SkillEffectType.DAMAGE_REDUCE: _apply_damage_reduce,
+    SkillEffectType.HIT_BOOST: _apply_hit_boost,
+    SkillEffectType.AVOID_BOOST: _apply_avoid_boost,
+    SkillEffectType.CRITICAL_BOOST: _apply_critical_boost,
+    SkillEffectType.HEAL: _apply_heal,
+    SkillEffectType.FOLLOW_UP: _apply_follow_up,
+    SkillEffectType.COUNTER_ATTACK: _apply_counter_attack,
+}
+
 class Skill:
+    __slots__ = (
+        "name", "description", "trigger_type", "effect_type", "trigger_value", "effect_value",
+        "duration", "remaining_duration", "is_active",
+        "_trigger_stat_name", "_trigger_multiplier", "_trigger_chance", "_trigger_chance_per_stat",
+        "_hp_compare", "_hp_threshold", "_effect_stat_name", "_effect_boost",
+        "_heal_is_ratio", "_heal_value",
+    )
+    
     def __init__(
         self, 
         name: str,
@@ -59,129 +218,83 @@ class Skill:
         self.remaining_duration = duration if duration > 0 else -1
         self.is_active = False
         
+        # 判定・効果で使うパラメータを生成時に一度だけ展開しておく
+        self._trigger_stat_name = None
+        self._trigger_multiplier = 0
+        self._trigger_chance = 0.0
+        self._trigger_chance_per_stat = 0.0
+        self._hp_compare = None
+        self._hp_threshold = 0
+        self._effect_stat_name = None
+        self._effect_boost = 0
+        self._heal_is_ratio = False
+        self._heal_value = 0
+        
+        if trigger_type is SkillTriggerType.PERCENTAGE and isinstance(trigger_value, (int, float)):
+            self._trigger_chance = trigger_value / 100.0
+        
+        if isinstance(trigger_value, tuple) and len(trigger_value) == 2:
+            if trigger_type is SkillTriggerType.STAT_BASED:
+                self._trigger_stat_name, self._trigger_multiplier = trigger_value
+                self._trigger_chance_per_stat = self._trigger_multiplier / 100.0
+            elif trigger_type is SkillTriggerType.HP_THRESHOLD:
+                self._hp_compare = _HP_COMPARISONS.get(trigger_value[0])
+                self._hp_threshold = trigger_value[1]
+        
+        if effect_type is SkillEffectType.STAT_BOOST and isinstance(effect_value, tuple) and len(effect_value) == 2:
+            self._effect_stat_name, self._effect_boost = effect_value
+        
+        if effect_type is SkillEffectType.HEAL:
+            if isinstance(effect_value, float) and 0 <= effect_value <= 1:
+                self._heal_is_ratio = True
+                self._heal_value = effect_value
+            elif isinstance(effect_value, (int, float)):
+                self._heal_value = int(effect_value)
+            else:
+                # 数値以外（与ダメージ割合など）は戦闘処理側で扱う
+                self._heal_value = None
+    
+    def to_dict(self) -> Dict:
+        """辞書形式に変換（シリアライズ用）"""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "trigger_type": self.trigger_type.name,
+            "effect_type": self.effect_type.name,
+            "trigger_value": self.trigger_value,
+            "effect_value": self.effect_value,
+            "duration": self.duration
+        }
+    
+    @classmethod
+    def from_template(cls, template: "SkillTemplate") -> "Skill":
+        """テンプレートからスキルを生成する"""
+        return cls(*template)
+    
+    def copy(self) -> "Skill":
+        """同じ定義の新しいスキルを生成する（発動状態は引き継がない）"""
+        return Skill(self.name, self.description, self.trigger_type, self.effect_type,
+                     self.trigger_value, self.effect_value, self.duration)
+        
     def check_trigger(self, unit, combat_data: Dict = None) -> bool:
         """スキルのトリガー条件をチェックする"""
-        if self.trigger_type == SkillTriggerType.PERCENTAGE:
-            # 発動率に基づくチェック
-            roll = random.randint(1, 100)
-            return roll <= self.trigger_value
-            
-        elif self.trigger_type == SkillTriggerType.STAT_BASED:
-            # 能力値に基づく発動率（例: 技×2%）
-            if isinstance(self.trigger_value, tuple) and len(self.trigger_value) == 2:
-                stat_name, multiplier = self.trigger_value
-                if hasattr(unit, stat_name):
-                    stat_value = getattr(unit, stat_name)
-                    roll = random.randint(1, 100)
-                    return roll <= (stat_value * multiplier)
-            return False
-            
-        elif self.trigger_type == SkillTriggerType.HP_THRESHOLD:
-            # HP閾値チェック（例: HP < 50%）
-            if isinstance(self.trigger_value, tuple) and len(self.trigger_value) == 2:
-                operator, threshold = self.trigger_value
-                hp_ratio = unit.current_hp / unit.max_hp * 100
-                if operator == "<":
-                    return hp_ratio < threshold
-                elif operator == "<=":
-                    return hp_ratio <= threshold
-                elif operator == ">":
-                    return hp_ratio > threshold
-                elif operator == ">=":
-                    return hp_ratio >= threshold
-            return False
-            
-        elif self.trigger_type == SkillTriggerType.WEAPON_TYPE:
-            # 武器タイプチェック
-            if unit.equipped_weapon:
-                return unit.equipped_weapon.weapon_type == self.trigger_value
+        handler = _TRIGGER_HANDLERS.get(self.trigger_type)
+        if handler is None:
+            # 他のトリガータイプ
             return False
-            
-        elif self.trigger_type == SkillTriggerType.ALWAYS_ACTIVE:
-            # 常時発動
-            return True
-            
-        # 戦闘関連トリガー (combat_dataが必要)
-        elif combat_data:
-            if self.trigger_type == SkillTriggerType.ON_ATTACK:
-                return combat_data.get("is_attacker", False)
-                
-            elif self.trigger_type == SkillTriggerType.ON_DEFEND:
-                return not combat_data.get("is_attacker", True)
-                
-            elif self.trigger_type == SkillTriggerType.ON_KILL:
-                return combat_data.get("target_killed", False)
-                
-            elif self.trigger_type == SkillTriggerType.ON_DAMAGE:
-                return combat_data.get("damage_received", 0) > 0
-                
-        # 他のトリガータイプ
-        return False
+        return handler(self, unit, combat_data)
         
     def apply_effect(self, unit, target = None, combat_data: Dict = None) -> Dict:
-        """スキル効果を適用し、変更された戦闘データを返す"""
-        if not combat_data:
-            combat_data = {}
+        """スキル効果を適用し、効果の内容を返す（修正値はcombat_dataに加算される）"""
+        if not isinstance(combat_data, CombatContext):
+            combat_data = CombatContext(combat_data or {})
             
         effect_result = {}
         
         # スキル効果の適用
-        if self.effect_type == SkillEffectType.STAT_BOOST:
-            # 一時的な能力値ブースト
-            if isinstance(self.effect_value, tuple) and len(self.effect_value) == 2:
-                stat_name, boost_value = self.effect_value
-                if hasattr(unit, stat_name):
-                    current_value = getattr(unit, stat_name)
-                    effect_result["boosted_stat"] = stat_name
-                    effect_result["boost_amount"] = boost_value
-                    combat_data[f"temp_{stat_name}"] = current_value + boost_value
-                    
-        elif self.effect_type == SkillEffectType.DAMAGE_BOOST:
-            # ダメージ増加
-            combat_data["damage_modifier"] = combat_data.get("damage_modifier", 0) + self.effect_value
-            effect_result["damage_boost"] = self.effect_value
-            
-        elif self.effect_type == SkillEffectType.DAMAGE_REDUCE:
-            # ダメージ減少
-            combat_data["damage_reduction"] = combat_data.get("damage_reduction", 0) + self.effect_value
-            effect_result["damage_reduction"] = self.effect_value
-            
-        elif self.effect_type == SkillEffectType.HIT_BOOST:
-            # 命中率ブースト
-            combat_data["hit_modifier"] = combat_data.get("hit_modifier", 0) + self.effect_value
-            effect_result["hit_boost"] = self.effect_value
-            
-        elif self.effect_type == SkillEffectType.AVOID_BOOST:
-            # 回避率ブースト
-            combat_data["avoid_modifier"] = combat_data.get("avoid_modifier", 0) + self.effect_value
-            effect_result["avoid_boost"] = self.effect_value
-            
-        elif self.effect_type == SkillEffectType.CRITICAL_BOOST:
-            # クリティカル率ブースト
-            combat_data["crit_modifier"] = combat_data.get("crit_modifier", 0) + self.effect_value
-            effect_result["crit_boost"] = self.effect_value
-            
-        elif self.effect_type == SkillEffectType.HEAL:
-            # HP回復
-            if isinstance(self.effect_value, float) and 0 <= self.effect_value <= 1:
-                # 最大HPの割合で回復
-                heal_amount = int(unit.max_hp * self.effect_value)
-            else:
-                # 固定値で回復
-                heal_amount = int(self.effect_value)
-                
-            unit.current_hp = min(unit.max_hp, unit.current_hp + heal_amount)
-            effect_result["healed"] = heal_amount
-            
-        elif self.effect_type == SkillEffectType.FOLLOW_UP:
-            # 追撃を保証
-            combat_data["guaranteed_follow_up"] = True
-            effect_result["follow_up"] = True
-            
-        elif self.effect_type == SkillEffectType.COUNTER_ATTACK:
-            # 反撃を保証（通常反撃できない状況でも）
-            combat_data["guaranteed_counter"] = True
-            effect_result["counter_attack"] = True
+        handler = _EFFECT_HANDLERS.get(self.effect_type)
+        if handler is not None:
+            handler(self, unit, target, combat_data, effect_result)
             
         # デュレーション管理
         if self.duration > 0:
@@ -191,105 +304,83 @@ class Skill:
                 
         return effect_result
 
-def create_sample_skills():
-    """サンプルスキルを作成する"""
-    from constants import WeaponType
-    
+# スキルの定義データ（共有される不変のテンプレート）
+SkillTemplate = namedtuple("SkillTemplate", "name description trigger_type effect_type trigger_value effect_value duration")
+
+SAMPLE_SKILL_TEMPLATES = (
     # 攻撃系スキル
-    astra = Skill(
-        name="連続攻撃",
-        description="確率で5回連続攻撃を行う（各攻撃のダメージは通常の30%）",
-        trigger_type=SkillTriggerType.STAT_BASED,
-        effect_type=SkillEffectType.SPECIAL_ATTACK,
-        trigger_value=("skill", 0.5),  # 技×0.5%の確率で発動
-        effect_value={"attacks": 5, "damage_multiplier": 0.3}
-    )
+    SkillTemplate(
+        "連続攻撃", "確率で5回連続攻撃を行う（各攻撃のダメージは通常の30%）",
+        SkillTriggerType.STAT_BASED, SkillEffectType.SPECIAL_ATTACK,
+        ("skill", 0.5),  # 技×0.5%の確率で発動
+        {"attacks": 5, "damage_multiplier": 0.3}, -1
+    ),
+    SkillTemplate(
+        "月光", "攻撃時、敵の守備または魔防の50%を無視する",
+        SkillTriggerType.PERCENTAGE, SkillEffectType.SPECIAL_ATTACK,
+        35,  # 35%の確率で発動
+        {"defense_pierce": 0.5}, -1
+    ),
+    SkillTemplate(
+        "連撃", "速さが一定以上高いと追撃が発生する確率が上がる",
+        SkillTriggerType.STAT_BASED, SkillEffectType.FOLLOW_UP,
+        ("speed", 0.75),  # 速さ×0.75%の確率で発動
+        True, -1
+    ),
     
-    luna = Skill(
-        name="月光",
-        description="攻撃時、敵の守備または魔防の50%を無視する",
-        trigger_type=SkillTriggerType.PERCENTAGE,
-        effect_type=SkillEffectType.SPECIAL_ATTACK,
-        trigger_value=35,  # 35%の確率で発動
-        effect_value={"defense_pierce": 0.5}
-    )
-    
-    adept = Skill(
-        name="連撃",
-        description="速さが一定以上高いと追撃が発生する確率が上がる",
-        trigger_type=SkillTriggerType.STAT_BASED,
-        effect_type=SkillEffectType.FOLLOW_UP,
-        trigger_value=("speed", 0.75),  # 速さ×0.75%の確率で発動
-        effect_value=True
-    )
-
     # 防御系スキル
-    pavise = Skill(
-        name="大盾",
-        description="物理攻撃のダメージを半減する",
-        trigger_type=SkillTriggerType.STAT_BASED,
-        effect_type=SkillEffectType.DAMAGE_REDUCE,
-        trigger_value=("defense", 0.4),  # 守備×0.4%の確率で発動
-        effect_value=0.5  # ダメージ50%減少
-    )
+    SkillTemplate(
+        "大盾", "物理攻撃のダメージを半減する",
+        SkillTriggerType.STAT_BASED, SkillEffectType.DAMAGE_REDUCE,
+        ("defense", 0.4),  # 守備×0.4%の確率で発動
+        0.5, -1  # ダメージ50%減少
+    ),
+    SkillTemplate(
+        "聖盾", "魔法攻撃のダメージを半減する",
+        SkillTriggerType.STAT_BASED, SkillEffectType.DAMAGE_REDUCE,
+        ("resistance", 0.4),  # 魔防×0.4%の確率で発動
+        0.5, -1  # ダメージ50%減少
+    ),
     
-    aegis = Skill(
-        name="聖盾",
-        description="魔法攻撃のダメージを半減する",
-        trigger_type=SkillTriggerType.STAT_BASED,
-        effect_type=SkillEffectType.DAMAGE_REDUCE,
-        trigger_value=("resistance", 0.4),  # 魔防×0.4%の確率で発動
-        effect_value=0.5  # ダメージ50%減少
-    )
-
     # 能力強化系スキル
-    vantage = Skill(
-        name="先制攻撃",
-        description="HPが50%以下のとき、敵より先に攻撃する",
-        trigger_type=SkillTriggerType.HP_THRESHOLD,
-        effect_type=SkillEffectType.SPECIAL_ATTACK,
-        trigger_value=("<", 50),  # HP < 50%で発動
-        effect_value={"vantage": True}
-    )
-    
-    wrath = Skill(
-        name="怒り",
-        description="HPが50%以下のとき、クリティカル率+20",
-        trigger_type=SkillTriggerType.HP_THRESHOLD,
-        effect_type=SkillEffectType.CRITICAL_BOOST,
-        trigger_value=("<", 50),  # HP < 50%で発動
-        effect_value=20  # クリティカル率+20
-    )
+    SkillTemplate(
+        "先制攻撃", "HPが50%以下のとき、敵より先に攻撃する",
+        SkillTriggerType.HP_THRESHOLD, SkillEffectType.SPECIAL_ATTACK,
+        ("<", 50),  # HP < 50%で発動
+        {"vantage": True}, -1
+    ),
+    SkillTemplate(
+        "怒り", "HPが50%以下のとき、クリティカル率+20",
+        SkillTriggerType.HP_THRESHOLD, SkillEffectType.CRITICAL_BOOST,
+        ("<", 50),  # HP < 50%で発動
+        20, -1  # クリティカル率+20
+    ),
+    SkillTemplate(
+        "太陽", "攻撃時、与えたダメージの半分を回復する",
+        SkillTriggerType.PERCENTAGE, SkillEffectType.HEAL,
+        30,  # 30%の確率で発動
+        {"heal_ratio": 0.5}, -1  # 与ダメージの50%回復
+    ),
     
-    sol = Skill(
-        name="太陽",
-        description="攻撃時、与えたダメージの半分を回復する",
-        trigger_type=SkillTriggerType.PERCENTAGE,
-        effect_type=SkillEffectType.HEAL,
-        trigger_value=30,  # 30%の確率で発動
-        effect_value={"heal_ratio": 0.5}  # 与ダメージの50%回復
-    )
-
     # 武器タイプに関するスキル
-    swordfaire = Skill(
-        name="剣の達人",
-        description="剣装備時、攻撃+5",
-        trigger_type=SkillTriggerType.WEAPON_TYPE,
-        effect_type=SkillEffectType.DAMAGE_BOOST,
-        trigger_value=WeaponType.SWORD,
-        effect_value=5  # 攻撃+5
-    )
-    
-    axebreaker = Skill(
-        name="斧殺し",
-        description="斧使用ユニットとの戦闘時、命中・回避+30",
-        trigger_type=SkillTriggerType.ALWAYS_ACTIVE,
-        effect_type=SkillEffectType.SPECIAL_ATTACK,
-        effect_value={
+    SkillTemplate(
+        "剣の達人", "剣装備時、攻撃+5",
+        SkillTriggerType.WEAPON_TYPE, SkillEffectType.DAMAGE_BOOST,
+        WeaponType.SWORD,
+        5, -1  # 攻撃+5
+    ),
+    SkillTemplate(
+        "斧殺し", "斧使用ユニットとの戦闘時、命中・回避+30",
+        SkillTriggerType.ALWAYS_ACTIVE, SkillEffectType.SPECIAL_ATTACK,
+        None,
+        {
             "condition": "opponent_weapon_type == WeaponType.AXE",
             "hit_bonus": 30,
             "avoid_bonus": 30
-        }
-    )
-    
-    return [astra, luna, adept, pavise, aegis, vantage, wrath, sol, swordfaire, axebreaker]
\ No newline at end of file
+        }, -1
+    ),
+)
+
+def create_sample_skills():
+    """サンプルスキルを作成する"""
+    return [Skill.from_template(template) for template in SAMPLE_SKILL_TEMPLATES]
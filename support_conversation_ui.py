@@ -1,5 +1,6 @@
 # support_conversation_ui.py
 import pygame
+import operator
 from typing import List, Dict, Tuple, Optional, Callable
 from ui_system import Panel, Label, Button, ScrollPanel
 from support_system import SupportSystem, SupportLevel, SupportConversation
@@ -8,6 +9,19 @@ from constants import SCREEN_WIDTH, SCREEN_HEIGHT
 
 class SupportListWindow(Panel):
     """支援関係一覧を表示するウィンドウ"""
+    # 支援レベルごとの表示色
+    LEVEL_COLORS = {
+        SupportLevel.NONE: COLOR_GRAY,
+        SupportLevel.C: (150, 150, 255),
+        SupportLevel.B: (100, 100, 255),
+        SupportLevel.A: (50, 50, 255),
+        SupportLevel.S: (255, 150, 150)
+    }
+    
+    # 支援ペア1行分の描画済み画像（(名前, 名前, レベル, 残りポイント, 幅, 高さ) -> Surface）
+    ROW_CACHE_LIMIT = 256
+    _row_cache = {}
+    
     def __init__(self, x: int, y: int, width: int, height: int,
                  support_system: SupportSystem,
                  unit_name: Optional[str] = None,  # 特定ユニットのみ表示する場合
@@ -64,12 +78,14 @@ class SupportListWindow(Panel):
         self.scroll_panel.clear_children()
         
         # 表示する支援ペアを収集
+        # 特定ユニットの支援のみ表示する場合はキャラクター別の索引から取得
+        if self.unit_name:
+            candidates = self.support_system.get_pairs_for(self.unit_name)
+        else:
+            candidates = self.support_system.supports.values()
+        
         pairs_to_show = []
-        for key, pair in self.support_system.supports.items():
-            # 特定ユニットの支援のみ表示する場合
-            if self.unit_name and self.unit_name not in pair.characters:
-                continue
-                
+        for pair in candidates:
             # 支援レベルがNONEの場合は条件次第で除外
             if pair.current_level == SupportLevel.NONE:
                 # 特定ユニット表示時のみNONEも表示
@@ -79,52 +95,59 @@ class SupportListWindow(Panel):
             pairs_to_show.append(pair)
         
         # ソート（支援レベル降順、次に名前順）
-        pairs_to_show.sort(key=lambda p: (-p.current_level.value, p.characters[0], p.characters[1]))
+        pairs_to_show.sort(key=operator.attrgetter("sort_key"))
         
         # 各支援ペアを表示
         y_offset = 10
-        for i, pair in enumerate(pairs_to_show):
-            # ペアのパネル
+        row_width = self.scroll_panel.width - 20
+        for pair in pairs_to_show:
+            # ペアの行（文字部分は描画済み画像を再利用）
             pair_height = 60
-            pair_panel = Panel(5, y_offset, self.scroll_panel.width - 20, pair_height,
-                              (60, 60, 60), COLOR_BLACK, 1, 255)
-            
-            # キャラクター名
-            char1, char2 = pair.characters
-            names_text = f"{char1} ＆ {char2}"
-            pair_panel.add_child(Label(10, 8, names_text, self.font, 24, COLOR_WHITE))
+            row = SupportPairRow(5, y_offset, row_width, pair_height, self._get_row_surface(pair, row_width, pair_height))
             
-            # 支援レベル
-            level_colors = {
-                SupportLevel.NONE: COLOR_GRAY,
-                SupportLevel.C: (150, 150, 255),
-                SupportLevel.B: (100, 100, 255),
-                SupportLevel.A: (50, 50, 255),
-                SupportLevel.S: (255, 150, 150)
-            }
-            level_text = f"支援レベル: {pair.current_level.name}"
-            level_color = level_colors.get(pair.current_level, COLOR_WHITE)
-            pair_panel.add_child(Label(10, 30, level_text, self.font, 20, level_color))
-            
-            # 次のレベルへの進捗
-            if pair.current_level != pair.max_level:
-                next_points = pair.get_next_required_points()
-                progress_text = f"次のレベルまで: {next_points}ポイント"
-                pair_panel.add_child(Label(200, 30, progress_text, self.small_font, 18, COLOR_WHITE))
-            
-            # 会話アイコン（未読会話がある場合）
+            # 会話ボタン（未読会話がある場合）
             if pair.has_available_conversation():
-                msg_btn = Button(self.scroll_panel.width - 60, 10, 40, 40, "会話",
+                msg_btn = Button(self.scroll_panel.width - 60, y_offset + 10, 40, 40, "会話",
                                self.font, 16, (80, 150, 80), COLOR_WHITE, (100, 200, 100),
                                COLOR_BLACK, 1, lambda p=pair: self.select_pair(p))
-                pair_panel.add_child(msg_btn)
+                row.add_child(msg_btn)
             
-            self.scroll_panel.add_child(pair_panel)
+            self.scroll_panel.add_child(row)
             y_offset += pair_height + 5
         
         # コンテンツ高さの更新
         self.scroll_panel.update_content_height()
     
+    def _get_row_surface(self, pair, width, height):
+        """支援ペア1行分の画像を取得（表示内容が変わった時のみ描画）"""
+        char1, char2 = pair.characters
+        has_next = pair.current_level != pair.max_level
+        next_points = pair.get_next_required_points() if has_next else None
+        key = (char1, char2, pair.current_level, next_points, width, height)
+        
+        surface = self._row_cache.get(key)
+        if surface is None:
+            if len(self._row_cache) >= self.ROW_CACHE_LIMIT:
+                self._row_cache.clear()
+            
+            surface = pygame.Surface((width, height)).convert()
+            surface.fill((60, 60, 60))
+            pygame.draw.rect(surface, COLOR_BLACK, (0, 0, width, height), 1)
+            
+            # キャラクター名
+            surface.blit(self.font.render(f"{char1} ＆ {char2}", True, COLOR_WHITE), (10, 8))
+            
+            # 支援レベル
+            level_color = self.LEVEL_COLORS.get(pair.current_level, COLOR_WHITE)
+            surface.blit(self.font.render(f"支援レベル: {pair.current_level.name}", True, level_color), (10, 30))
+            
+            # 次のレベルへの進捗
+            if has_next:
+                surface.blit(self.small_font.render(f"次のレベルまで: {next_points}ポイント", True, COLOR_WHITE), (200, 30))
+            
+            self._row_cache[key] = surface
+        return surface
+    
     def select_pair(self, pair):
         """支援ペアを選択して会話ウィンドウを表示"""
         self.selected_pair = pair
@@ -136,6 +159,18 @@ class SupportListWindow(Panel):
         """ウィンドウを閉じる"""
         self.visible = False
 
+class SupportPairRow(Panel):
+    """描画済みの画像を表示する支援一覧の1行（ボタンのみ子要素として持つ）"""
+    def __init__(self, x: int, y: int, width: int, height: int, image):
+        super().__init__(x, y, width, height, border_color=None)
+        self.image = image
+    
+    def _render_contents(self, screen):
+        screen.blit(self.image, (self.x, self.y))
+        for child in self.children:
+            if child.visible:
+                child.render(screen)
+
 class SupportConversationWindow(Panel):
     """支援会話を表示するウィンドウ"""
     def __init__(self, x: int, y: int, width: int, height: int,
@@ -163,6 +198,11 @@ class SupportConversationWindow(Panel):
         # アニメーション用タイマー
         self.animation_timer = 0
         
+        # 表示中メッセージの描画済み画像と、各文字数での表示幅
+        self._full_surface = None
+        self._char_x = [0]
+        self._reveal_complete = False  # 現在のメッセージを全て表示し終えたか
+        
         # キャラクターの配置（左右）
         if conversation and len(conversation.characters) >= 2:
             self.left_character = conversation.characters[0]
@@ -236,6 +276,10 @@ class SupportConversationWindow(Panel):
         """状態更新（テキストアニメーション）"""
         super().update()
         
+        # 全文表示済みなら何もしない
+        if self._reveal_complete:
+            return
+        
         if not self.messages or self.current_message_index >= len(self.messages):
             return
         
@@ -254,15 +298,24 @@ class SupportConversationWindow(Panel):
         if self.animation_timer >= self.message_speed:
             self.animation_timer = 0
             
-            # 表示する文字数を増やす
+            # 表示する文字数を増やす（描画済み画像の表示幅を広げるだけ）
             if self.current_char_index < len(full_text):
                 self.current_char_index += 1
-                # 現在のテキストを更新
-                current_text = full_text[:self.current_char_index]
-                self.message_label.set_text(current_text)
                 
                 # 文字表示時のSE（未実装）
                 # self._play_text_sound()
+            
+            if self.current_char_index >= len(full_text):
+                self._reveal_complete = True
+    
+    def render(self, screen):
+        super().render(screen)
+        
+        # 表示中のメッセージは描画済み画像の左側だけを切り出して描画
+        if self.visible and self._full_surface:
+            shown_width = self._char_x[self.current_char_index]
+            screen.blit(self._full_surface, (self.message_label.x, self.message_label.y),
+                        (0, 0, shown_width, self._full_surface.get_height()))
     
     def update_current_message(self):
         """現在のメッセージを更新"""
@@ -270,6 +323,8 @@ class SupportConversationWindow(Panel):
             # 会話終了
             self.next_btn.text = "閉じる"
             self.speaker_label.set_text("")
+            self._full_surface = None
+            self._reveal_complete = True
             self.message_label.set_text("（会話終了）")
             return
         
@@ -289,9 +344,18 @@ class SupportConversationWindow(Panel):
         else:
             self.speaker_label.color = COLOR_YELLOW
         
+        # メッセージ全体を一度だけ描画し、各文字数での表示幅を求めておく
+        if full_text:
+            self._full_surface = self.text_font.render(full_text, True, self.message_label.color)
+            self._char_x = [self.text_font.size(full_text[:i])[0] for i in range(len(full_text) + 1)]
+        else:
+            self._full_surface = None
+            self._char_x = [0]
+        
         # テキストのアニメーション開始
         self.current_char_index = 0
         self.animation_timer = 0
+        self._reveal_complete = False
         self.message_label.set_text("")
     
     def next_message(self):
@@ -303,7 +367,7 @@ class SupportConversationWindow(Panel):
             
             if self.current_char_index < len(full_text):
                 self.current_char_index = len(full_text)
-                self.message_label.set_text(full_text)
+                self._reveal_complete = True
                 return
         
         # 次のメッセージへ
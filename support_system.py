@@ -1,7 +1,9 @@
 # support_system.py
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, NamedTuple, Tuple, Optional
 import json
 import os
+import pickle
+import sys
 from enum import Enum
 
 class SupportLevel(Enum):
@@ -12,29 +14,24 @@ class SupportLevel(Enum):
     A = 3       # Aランク
     S = 4       # Sランク（最大）
 
-class SupportBonus:
-    """支援効果を定義するクラス"""
-    def __init__(self, 
-                 damage_bonus: int = 0,      # 与ダメージボーナス
-                 defense_bonus: int = 0,     # 受けダメージ軽減
-                 hit_bonus: int = 0,         # 命中率ボーナス
-                 avoid_bonus: int = 0):      # 回避率ボーナス
-        self.damage_bonus = damage_bonus
-        self.defense_bonus = defense_bonus
-        self.hit_bonus = hit_bonus
-        self.avoid_bonus = avoid_bonus
+# レベル名 -> 支援レベル（読み込み時の変換用）
+_LEVEL_BY_NAME = {level.name: level for level in SupportLevel}
+
+class SupportBonus(NamedTuple):
+    """支援効果を定義する不変のタプル"""
+    damage_bonus: int = 0       # 与ダメージボーナス
+    defense_bonus: int = 0      # 受けダメージ軽減
+    hit_bonus: int = 0          # 命中率ボーナス
+    avoid_bonus: int = 0        # 回避率ボーナス
     
     def __add__(self, other):
         """複数の支援効果を加算できるようにする"""
         if not isinstance(other, SupportBonus):
             return self
         
-        return SupportBonus(
-            self.damage_bonus + other.damage_bonus,
-            self.defense_bonus + other.defense_bonus,
-            self.hit_bonus + other.hit_bonus,
-            self.avoid_bonus + other.avoid_bonus
-        )
+        d1, f1, h1, a1 = self
+        d2, f2, h2, a2 = other
+        return SupportBonus(d1 + d2, f1 + f2, h1 + h2, a1 + a2)
     
     @classmethod
     def calculate_from_level(cls, level: SupportLevel):
@@ -47,6 +44,15 @@ class SupportBonus:
             avoid_bonus=level_value * 5           # レベル×5の回避率上昇
         )
 
+# 値 -> 支援レベル（値は0から連番なので添字で引ける）
+_LEVEL_BY_VALUE = tuple(sorted(SupportLevel, key=lambda level: level.value))
+
+# 支援レベルごとの支援効果（レベルは5段階しかないため事前に作成して共有する）
+_BONUS_BY_LEVEL = {level: SupportBonus.calculate_from_level(level) for level in SupportLevel}
+
+# 支援効果が届く最大距離（マンハッタン距離）
+SUPPORT_RANGE = 3
+
 class SupportConversation:
     """支援会話を管理するクラス"""
     def __init__(self, 
@@ -79,8 +85,8 @@ class SupportConversation:
         """辞書からインスタンスを生成（デシリアライズ用）"""
         try:
             return cls(
-                characters=tuple(data["characters"]),
-                level=SupportLevel[data["level"]],
+                characters=tuple(sys.intern(name) for name in data["characters"]),
+                level=_LEVEL_BY_NAME[data["level"]],
                 title=data.get("title", ""),
                 content=data.get("content", []),
                 requirements=data.get("requirements", {"battles": 0}),
@@ -99,8 +105,9 @@ class SupportPair:
                  points: int = 0,                             # 現在の支援ポイント
                  points_needed: Dict[SupportLevel, int] = None,  # 各レベルに必要なポイント
                  conversations: Dict[SupportLevel, SupportConversation] = None):  # 各レベルの会話
-        self.characters = sorted(characters)  # 常にアルファベット順に保存
-        self.current_level = current_level
+        self.characters = tuple(sorted(characters))  # 常にアルファベット順に保存
+        self.a, self.b = self.characters
+        self.current_level = current_level  # 並び替え用のキーも同時に設定される
         self.max_level = max_level
         self.points = points
         
@@ -115,6 +122,18 @@ class SupportPair:
         # 支援会話の初期化
         self.conversations = conversations or {}
     
+    @property
+    def current_level(self) -> SupportLevel:
+        return self._current_level
+    
+    @current_level.setter
+    def current_level(self, level: SupportLevel):
+        self._current_level = level
+        # 一覧表示の並び順（支援レベル降順、次に名前順）はレベル変更時のみ更新
+        self.sort_key = (-level.value, self.characters[0], self.characters[1])
+        # 有効な支援効果（NONEの場合はNone）もレベル変更時に決めておく
+        self.active_bonus = _BONUS_BY_LEVEL[level] if level.value else None
+    
     def add_points(self, points: int) -> Tuple[bool, Optional[SupportLevel]]:
         """
         支援ポイントを追加し、レベルアップの有無を返す
@@ -125,39 +144,33 @@ class SupportPair:
         Returns:
             Tuple[bool, Optional[SupportLevel]]: レベルアップしたかどうかとレベルアップ後のレベル
         """
-        if self.current_level == self.max_level:
+        if self.current_level is self.max_level:
             return False, None  # 既に最大レベルに達している
         
-        old_level = self.current_level
         self.points += points
         
-        # 次のレベルを計算
-        next_level = None
-        for level in [SupportLevel.C, SupportLevel.B, SupportLevel.A, SupportLevel.S]:
-            if level.value > self.current_level.value and level.value <= self.max_level.value:
-                if self.points >= self.points_needed[level]:
-                    next_level = level
-                break
-        
         # レベルアップ処理
-        if next_level and next_level.value > self.current_level.value:
+        next_level = self._get_next_level()
+        if next_level and self.points >= self.points_needed[next_level]:
             self.current_level = next_level
             return True, next_level
         
         return False, None
     
+    def _get_next_level(self) -> Optional[SupportLevel]:
+        """次の支援レベルを取得（最大レベルを超える場合はNone）"""
+        next_value = self.current_level.value + 1
+        if next_value > self.max_level.value:
+            return None
+        return _LEVEL_BY_VALUE[next_value]
+    
     def get_next_required_points(self) -> int:
         """次のレベルに必要な残りポイント数を取得"""
-        if self.current_level == self.max_level:
+        if self.current_level is self.max_level:
             return 0
         
         # 次のレベルを特定
-        next_level = None
-        for level in [SupportLevel.C, SupportLevel.B, SupportLevel.A, SupportLevel.S]:
-            if level.value > self.current_level.value and level.value <= self.max_level.value:
-                next_level = level
-                break
-        
+        next_level = self._get_next_level()
         if not next_level:
             return 0
         
@@ -181,7 +194,7 @@ class SupportPair:
     
     def get_support_bonus(self) -> SupportBonus:
         """現在のレベルに基づいた支援効果を取得"""
-        return SupportBonus.calculate_from_level(self.current_level)
+        return _BONUS_BY_LEVEL[self.current_level]
     
     def to_dict(self) -> Dict:
         """辞書形式に変換（シリアライズ用）"""
@@ -199,29 +212,24 @@ class SupportPair:
         """辞書からインスタンスを生成（デシリアライズ用）"""
         try:
             # ポイント必要数の変換
-            points_needed = {}
-            for level_name, points in data.get("points_needed", {}).items():
-                try:
-                    level = SupportLevel[level_name]
-                    points_needed[level] = points
-                except KeyError:
-                    continue
+            points_needed = {_LEVEL_BY_NAME[level_name]: points
+                             for level_name, points in data.get("points_needed", {}).items()
+                             if level_name in _LEVEL_BY_NAME}
             
             # 会話の変換
             conversations = {}
             for level_name, conv_data in data.get("conversations", {}).items():
-                try:
-                    level = SupportLevel[level_name]
-                    conv = SupportConversation.from_dict(conv_data)
-                    if conv:
-                        conversations[level] = conv
-                except KeyError:
+                level = _LEVEL_BY_NAME.get(level_name)
+                if level is None:
                     continue
+                conv = SupportConversation.from_dict(conv_data)
+                if conv:
+                    conversations[level] = conv
             
             return cls(
-                characters=tuple(data["characters"]),
-                current_level=SupportLevel[data.get("current_level", "NONE")],
-                max_level=SupportLevel[data.get("max_level", "A")],
+                characters=tuple(sys.intern(name) for name in data["characters"]),
+                current_level=_LEVEL_BY_NAME[data.get("current_level", "NONE")],
+                max_level=_LEVEL_BY_NAME[data.get("max_level", "A")],
                 points=data.get("points", 0),
                 points_needed=points_needed,
                 conversations=conversations
@@ -232,20 +240,27 @@ class SupportPair:
 
 class SupportSystem:
     """全ユニットの支援関係を管理するクラス"""
-    def __init__(self, data_path: str = "data/supports/"):
+    def __init__(self, data_path: str = "data/supports/", pretty: bool = False):
         self.data_path = data_path
+        self.pretty = pretty  # Trueの場合はJSONを整形して保存（デバッグ用）
+        self._dirty = True  # 前回の保存・読み込みから変更があるか
         self.supports = {}  # キャラクターペアをキーとした支援ペアの辞書
+        self.by_character = {}  # キャラクター名 -> (支援ペア, 相手の名前) のリスト
+        self.active_by_character = {}  # by_character のうち支援レベルがNONEでないものだけ
         self.battle_counts = {}  # キャラクターペアをキーとした戦闘回数の辞書
+        self._bonus_cache = {}  # ユニット名 -> (x, y, 支援効果)
+        self._bonus_cache_map = None  # キャッシュ作成時の (マップ, マップの版数)
         
         # データディレクトリの確認
         os.makedirs(data_path, exist_ok=True)
         
         # 支援会話データの読み込み
-        self.load_support_data()
+        if self.load_support_data():
+            self._dirty = False
     
     def get_support_pair_key(self, char1: str, char2: str) -> str:
         """2人のキャラクターから辞書キーを生成（常にアルファベット順）"""
-        return "_".join(sorted([char1, char2]))
+        return f"{char1}_{char2}" if char1 < char2 else f"{char2}_{char1}"
     
     def get_support_pair(self, char1: str, char2: str) -> Optional[SupportPair]:
         """2人のキャラクター間の支援ペアを取得"""
@@ -256,19 +271,58 @@ class SupportSystem:
         """新しい支援ペアを登録"""
         key = self.get_support_pair_key(char1, char2)
         if key not in self.supports:
-            self.supports[key] = SupportPair(
+            self._add_pair(key, SupportPair(
                 characters=(char1, char2),
                 max_level=max_level
-            )
+            ))
         return self.supports[key]
     
+    def _add_pair(self, key: str, pair: SupportPair):
+        """支援ペアを登録し、キャラクター別の索引も更新"""
+        old_pair = self.supports.get(key)
+        if old_pair:
+            self.by_character[old_pair.a].remove((old_pair, old_pair.b))
+            self.by_character[old_pair.b].remove((old_pair, old_pair.a))
+            if old_pair.active_bonus is not None:
+                self.active_by_character[old_pair.a].remove((old_pair, old_pair.b))
+                self.active_by_character[old_pair.b].remove((old_pair, old_pair.a))
+        
+        self.supports[key] = pair
+        self._bonus_cache = {}
+        self._dirty = True
+        self.by_character.setdefault(pair.a, []).append((pair, pair.b))
+        self.by_character.setdefault(pair.b, []).append((pair, pair.a))
+        if pair.active_bonus is not None:
+            self._activate_pair(pair)
+    
+    def _activate_pair(self, pair: SupportPair):
+        """支援レベルがNONEでなくなったペアを有効な索引に追加"""
+        self.active_by_character.setdefault(pair.a, []).append((pair, pair.b))
+        self.active_by_character.setdefault(pair.b, []).append((pair, pair.a))
+    
+    def get_pairs_for(self, char_name: str) -> List[SupportPair]:
+        """指定キャラクターが含まれる支援ペアのリストを取得"""
+        return [pair for pair, _ in self.by_character.get(char_name, ())]
+    
     def add_support_points(self, char1: str, char2: str, points: int) -> Tuple[bool, Optional[SupportLevel]]:
         """2人のキャラクター間の支援ポイントを追加"""
         pair = self.get_support_pair(char1, char2)
         if not pair:
             return False, None
         
-        return pair.add_points(points)
+        was_active = pair.active_bonus is not None
+        level_up, new_level = pair.add_points(points)
+        self._dirty = True
+        # NONEから昇格した場合のみ有効な索引に追加（レベルは下がらない）
+        if level_up:
+            if not was_active:
+                self._activate_pair(pair)
+            self._bonus_cache = {}
+        return level_up, new_level
+    
+    def invalidate_bonus_cache(self):
+        """支援効果のキャッシュを破棄（ユニットの生死やHPが変わった時など）"""
+        self._bonus_cache = {}
     
     def record_battle_together(self, char1: str, char2: str):
         """2人のキャラクターが同じマップで戦闘したことを記録"""
@@ -280,21 +334,30 @@ class SupportSystem:
         
         # 戦闘回数を増加
         self.battle_counts[key] = self.battle_counts.get(key, 0) + 1
+        self._dirty = True
         
         # 一定回数戦闘するとポイント増加
         if self.battle_counts[key] % 5 == 0:  # 5戦闘ごとにポイント獲得
             self.add_support_points(char1, char2, 5)
     
-    def record_adjacent_turns(self, char1: str, char2: str):
+    def record_battle_nearby(self, game_map):
+        """同じチームで3マス以内にいる支援相手同士の戦闘を記録（各組を双方のユニットから記録）"""
+        units_by_name = {}
+        for unit in game_map.units:
+            units_by_name.setdefault(unit.name, []).append(unit)
+        
+        # 支援関係のある相手だけを調べる（キャラクター別の索引を使用）
+        for unit1 in game_map.units:
+            for _, other_name in self.by_character.get(unit1.name, ()):
+                for unit2 in units_by_name.get(other_name, ()):
+                    if (unit2.team == unit1.team and unit2 != unit1 and
+                            abs(unit1.x - unit2.x) + abs(unit1.y - unit2.y) <= SUPPORT_RANGE):
+                        self.record_battle_together(unit1.name, unit2.name)
+    
+    def record_adjacent_turns(self, char1: str, char2: str) -> Tuple[bool, Optional[SupportLevel]]:
         """2人のキャラクターが隣接してターンを終了したことを記録"""
-        key = self.get_support_pair_key(char1, char2)
-        
-        # 支援ペアがない場合はスキップ
-        if key not in self.supports:
-            return
-        
-        # 隣接してターン終了するとポイント増加
-        self.add_support_points(char1, char2, 1)
+        # 隣接してターン終了するとポイント増加（支援ペアがない場合は何もしない）
+        return self.add_support_points(char1, char2, 1)
     
     def get_available_conversations(self) -> List[Tuple[str, str, SupportLevel]]:
         """閲覧可能な支援会話のリストを取得"""
@@ -320,52 +383,61 @@ class SupportSystem:
         pair = self.get_support_pair(char1, char2)
         if pair:
             pair.mark_conversation_viewed(level)
+            self._dirty = True
     
-    def get_support_bonus(self, unit, game_map) -> SupportBonus:
+    def get_support_bonus(self, unit, game_map, alive_by_name: Optional[Dict] = None) -> SupportBonus:
         """
         ユニットが受ける全支援効果を計算
         
         Args:
             unit: 対象ユニット
             game_map: ゲームマップ
+            alive_by_name: 名前 -> 生存ユニットの辞書（省略時はマップから作成）
             
         Returns:
             SupportBonus: 適用される総合的な支援効果
         """
-        total_bonus = SupportBonus()
+        # マップ上でユニットが動いていれば、キャッシュは使えない
+        map_state = (game_map, getattr(game_map, "version", None))
+        if self._bonus_cache_map != map_state:
+            self._bonus_cache = {}
+            self._bonus_cache_map = map_state
         
-        # 指定ユニットと支援関係があるユニットを探す
-        for key, pair in self.supports.items():
-            # 支援レベルがNONEの場合はスキップ
-            if pair.current_level == SupportLevel.NONE:
-                continue
-            
-            # このペアに指定ユニットが含まれるか確認
-            if unit.name not in pair.characters:
-                continue
-            
-            # もう一方のキャラクターを特定
-            other_name = pair.characters[0] if pair.characters[1] == unit.name else pair.characters[1]
+        ux, uy = unit.x, unit.y
+        cached = self._bonus_cache.get(unit.name)
+        if cached and cached[0] == ux and cached[1] == uy:
+            return cached[2]
+        
+        if alive_by_name is None:
+            alive_by_name = self._get_alive_units_by_name(game_map)
+        
+        damage = defense = hit = avoid = 0
+        
+        # 支援レベルがNONEでない相手だけを探す（キャラクター別の有効な索引を使用）
+        for pair, other_name in self.active_by_character.get(unit.name, ()):
+            bonus = pair.active_bonus
             
             # マップ上で相手を探す
-            other_unit = None
-            for u in game_map.units:
-                if u.name == other_name and not u.is_dead():
-                    other_unit = u
-                    break
-            
+            other_unit = alive_by_name.get(other_name)
             if not other_unit:
                 continue
             
-            # 距離を計算
-            distance = abs(unit.x - other_unit.x) + abs(unit.y - other_unit.y)
-            
-            # 3マス以内なら支援効果を適用
-            if distance <= 3:
-                total_bonus += pair.get_support_bonus()
-        
+            # 範囲内なら支援効果を加算（最後に一度だけ SupportBonus を作る）
+            if abs(ux - other_unit.x) + abs(uy - other_unit.y) <= SUPPORT_RANGE:
+                d, f, h, a = bonus
+                damage += d
+                defense += f
+                hit += h
+                avoid += a
+        
+        total_bonus = SupportBonus(damage, defense, hit, avoid)
+        self._bonus_cache[unit.name] = (ux, uy, total_bonus)
         return total_bonus
     
+    def _get_alive_units_by_name(self, game_map) -> Dict:
+        """マップ上の生存ユニットを名前で引ける辞書を作成（同名の場合は先のユニットを優先）"""
+        return {u.name: u for u in reversed(game_map.units) if not u.is_dead()}
+    
     def apply_support_effects(self, attacker, defender, combat_data, game_map):
         """
         戦闘時に支援効果を適用する
@@ -373,7 +445,7 @@ class SupportSystem:
         Args:
             attacker: 攻撃側ユニット
             defender: 防御側ユニット
-            combat_data: 戦闘データ（修正用）
+            combat_data: 戦闘データ（CombatContext、修正値を加算する）
             game_map: ゲームマップ
         """
         # 攻撃側の支援効果
@@ -384,22 +456,26 @@ class SupportSystem:
         
         # 戦闘データに効果を適用
         # 与ダメージボーナス
-        combat_data["damage_modifier"] = combat_data.get("damage_modifier", 0) + attacker_bonus.damage_bonus
+        combat_data.damage_modifier += attacker_bonus.damage_bonus
         
         # 受けダメージ軽減
-        combat_data["damage_reduction"] = combat_data.get("damage_reduction", 0) + defender_bonus.defense_bonus
+        combat_data.damage_reduction += defender_bonus.defense_bonus
         
         # 命中率ボーナス
-        combat_data["hit_modifier"] = combat_data.get("hit_modifier", 0) + attacker_bonus.hit_bonus
+        combat_data.hit_modifier += attacker_bonus.hit_bonus
         
         # 回避率ボーナス
-        combat_data["avoid_modifier"] = combat_data.get("avoid_modifier", 0) + defender_bonus.avoid_bonus
+        combat_data.avoid_modifier += defender_bonus.avoid_bonus
     
-    def load_support_data(self):
-        """支援データをファイルから読み込む"""
+    def load_support_data(self) -> bool:
+        """支援データをファイルから読み込む。読み込めた場合はTrue"""
         # 支援ペアファイル
         pairs_file = os.path.join(self.data_path, "support_pairs.json")
         
+        # JSONより新しいキャッシュがあればそちらを使う
+        if self._load_support_cache(pairs_file + ".pkl", pairs_file):
+            return True
+        
         # ファイルが存在する場合は読み込み
         if os.path.exists(pairs_file):
             try:
@@ -410,15 +486,20 @@ class SupportSystem:
                     for key, pair_data in data.get("supports", {}).items():
                         pair = SupportPair.from_dict(pair_data)
                         if pair:
-                            self.supports[key] = pair
+                            self._add_pair(key, pair)
                     
                     # 戦闘回数の復元
                     self.battle_counts = data.get("battle_counts", {})
+                return True
             except Exception as e:
                 print(f"支援データの読み込みエラー: {e}")
+        return False
     
     def save_support_data(self):
-        """支援データをファイルに保存"""
+        """支援データをファイルに保存（前回から変更がない場合は何もしない）"""
+        if not self._dirty:
+            return
+        
         # 支援ペアファイル
         pairs_file = os.path.join(self.data_path, "support_pairs.json")
         
@@ -429,12 +510,46 @@ class SupportSystem:
                 "battle_counts": self.battle_counts
             }
             
-            # ファイルに保存
-            with open(pairs_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 一時ファイル経由で保存（書き込み途中で壊れないように）
+            with open(pairs_file + ".tmp", 'w', encoding='utf-8') as f:
+                if self.pretty:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                else:
+                    json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(pairs_file + ".tmp", pairs_file)
+            
+            # 読み込み用のキャッシュ（オブジェクトをそのまま保存）
+            with open(pairs_file + ".pkl.tmp", 'wb') as f:
+                pickle.dump({"supports": self.supports, "battle_counts": self.battle_counts}, f, protocol=5)
+            os.replace(pairs_file + ".pkl.tmp", pairs_file + ".pkl")
+            
+            self._dirty = False
         except Exception as e:
             print(f"支援データの保存エラー: {e}")
     
+    def _load_support_cache(self, cache_file: str, json_file: str) -> bool:
+        """支援データのキャッシュを読み込む。使えない場合はFalse"""
+        if not os.path.exists(cache_file):
+            return False
+        if os.path.exists(json_file) and os.path.getmtime(json_file) > os.path.getmtime(cache_file):
+            return False  # JSONが後から編集されている
+        
+        try:
+            with open(cache_file, 'rb') as f:
+                data = pickle.load(f)
+            
+            for key, pair in data["supports"].items():
+                pair.current_level = pair.current_level  # レベルから決まる値を作り直す
+                self._add_pair(key, pair)
+            self.battle_counts = data["battle_counts"]
+            return True
+        except Exception as e:
+            print(f"支援データキャッシュの読み込みエラー: {e}")
+            self.supports = {}
+            self.by_character = {}
+            self.active_by_character = {}
+            return False
+    
     def register_default_supports(self, character_data: List[Dict]):
         """
         キャラクターデータから初期支援関係を登録
@@ -1,6 +1,30 @@
 # tavern.py
 import pygame
-from ui_system import Panel, Label, Button, ScrollPanel
+from ui_system import Panel, Label, Button, VirtualScrollPanel
+from skills import create_sample_skills
+
+# 支援レベルごとの表示色
+SUPPORT_LEVEL_COLORS = {
+    "C": (150, 150, 255),
+    "B": (100, 100, 255),
+    "A": (50, 50, 255),
+    "S": (255, 150, 150)
+}
+
+# スキル名に含まれる語 -> 習得に必要なレベル（仮の条件、先に一致したものを使う）
+SKILL_LEVEL_REQUIREMENTS = (
+    ("太陽", 10),
+    ("月光", 10),
+    ("連撃", 5),
+    ("連続攻撃", 5),
+)
+
+def get_skill_level_requirement(skill_name):
+    """スキルの習得に必要なレベルを取得"""
+    for keyword, level_req in SKILL_LEVEL_REQUIREMENTS:
+        if keyword in skill_name:
+            return level_req
+    return 1
 
 class Tavern(Panel):
     def __init__(self, x, y, width, height, game_manager, on_close=None):
@@ -8,6 +32,10 @@ class Tavern(Panel):
         self.game_manager = game_manager
         self.on_close = on_close
         
+        # 習得候補のスキル一覧（仮のデータ、一度だけ作成）
+        self._all_skills = create_sample_skills()
+        self._skill_level_reqs = {skill.name: get_skill_level_requirement(skill.name) for skill in self._all_skills}
+        
         # 酒場タイトル
         title_label = Label(width // 2, 20, "酒場", None, 30, (255, 255, 200), None, "center")
         self.add_child(title_label)
@@ -78,61 +106,60 @@ class Tavern(Panel):
             ))
             return
         
-        # 支援会話リスト
-        for i, (char1, char2, level) in enumerate(available_supports):
-            support_panel = Panel(10, i * 80 + 10, self.content_panel.width - 20, 70, (50, 50, 60), (0, 0, 0), 1, 255)
+        # 支援会話リスト（表示範囲の行だけを生成）
+        def build_support_row(i, row_y):
+            char1, char2, level = available_supports[i]
+            support_panel = Panel(10, row_y + 10, self.content_panel.width - 20, 70, (50, 50, 60), (0, 0, 0), 1, 255)
             
             # キャラクター名と支援レベル
             support_panel.add_child(Label(10, 10, f"{char1} ＆ {char2}", None, 20, (255, 255, 255)))
             
             # 支援レベル
             level_text = f"支援レベル: {level.name}"
-            level_colors = {
-                "C": (150, 150, 255),
-                "B": (100, 100, 255),
-                "A": (50, 50, 255),
-                "S": (255, 150, 150)
-            }
-            level_color = level_colors.get(level.name, (200, 200, 200))
+            level_color = SUPPORT_LEVEL_COLORS.get(level.name, (200, 200, 200))
             support_panel.add_child(Label(10, 35, level_text, None, 18, level_color))
             
             # 閲覧ボタン
             view_btn = Button(support_panel.width - 90, 20, 80, 30, "閲覧", None, 18,
                              (60, 100, 60), (255, 255, 255), (80, 150, 80),
-                             (0, 0, 0), 1, lambda c1=char1, c2=char2, lvl=level: self.view_support_conversation(c1, c2, lvl))
+                             (0, 0, 0), 1, self.view_support_conversation)
+            view_btn.set_callback_args(char1, char2, level)
             support_panel.add_child(view_btn)
-            
-            self.content_panel.add_child(support_panel)
+            return support_panel
+        
+        self.content_panel.add_child(VirtualScrollPanel(
+            0, 0, self.content_panel.width, self.content_panel.height,
+            len(available_supports), 80, build_support_row, (40, 40, 50), None, 0, 0
+        ))
     
     def show_skill_tab(self):
         """スキル編集タブの表示"""
-        # ユニット選択部分（左側）
-        unit_select = ScrollPanel(0, 0, self.content_panel.width // 2 - 10, self.content_panel.height,
-                                 self.content_panel.height, (40, 40, 50), None, 0, 220)
-        self.content_panel.add_child(unit_select)
-        
         # ユニットリストの取得
         units = [unit for unit in self.game_manager.game_map.units if unit.team == 0]
         
-        for i, unit in enumerate(units):
-            unit_panel = Panel(10, i * 60 + 10, unit_select.width - 20, 50, (50, 50, 60), (0, 0, 0), 1, 255)
+        def build_unit_row(i, row_y):
+            unit = units[i]
+            unit_panel = Panel(10, row_y + 10, self.content_panel.width // 2 - 30, 50, (50, 50, 60), (0, 0, 0), 1, 255)
             
             # ユニット名と職業
             unit_panel.add_child(Label(10, 10, f"{unit.name} (Lv.{unit.level})", None, 18, (255, 255, 255)))
             unit_panel.add_child(Label(10, 30, unit.unit_class, None, 16, (200, 200, 200)))
             
-            # クリックハンドラを設定
-            unit_index = i
-            
-            def make_handler(idx):
-                return lambda: self.select_unit_for_skills(units[idx])
+            # クリックハンドラを設定（パネル内の左クリックのみ）
+            def handle_click(event):
+                if (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
+                        and unit_panel.contains_point(*event.pos)):
+                    self.select_unit_for_skills(unit)
+                    return True
+                return False
             
-            unit_panel.handle_event = make_handler(unit_index)
-            
-            unit_select.add_child(unit_panel)
+            unit_panel.handle_event = handle_click
+            return unit_panel
         
-        # コンテンツ高さを更新
-        unit_select.update_content_height()
+        # ユニット選択部分（左側、表示範囲の行だけを生成）
+        unit_select = VirtualScrollPanel(0, 0, self.content_panel.width // 2 - 10, self.content_panel.height,
+                                         len(units), 60, build_unit_row, (40, 40, 50), None, 0, 220)
+        self.content_panel.add_child(unit_select)
         
         # スキル編集部分（右側）- 初期状態では非表示
         skill_panel = Panel(self.content_panel.width // 2 + 10, 0, self.content_panel.width // 2 - 10, self.content_panel.height,
@@ -163,128 +190,130 @@ class Tavern(Panel):
             hint_y += 40
     
     def select_unit_for_skills(self, unit):
-       """スキル編集用のユニット選択"""
-       self.skill_panel.clear_children()
-       
-       # ユニット情報
-       self.skill_panel.add_child(Label(10, 10, f"ユニット: {unit.name}", None, 18, (255, 255, 255)))
-       self.skill_panel.add_child(Label(10, 35, f"職業: {unit.unit_class}", None, 16, (200, 200, 200)))
-       
-       # 現在のスキルリスト
-       self.skill_panel.add_child(Label(10, 60, "装備中スキル:", None, 18, (255, 255, 200)))
-       
-       if unit.skills:
-           for i, skill in enumerate(unit.skills):
-               skill_panel = Panel(10, 90 + i * 70, self.skill_panel.width - 20, 60, (50, 50, 60), (0, 0, 0), 1, 255)
-               
-               # スキル名
-               skill_panel.add_child(Label(10, 10, skill.name, None, 18, (255, 255, 255)))
-               
-               # スキル説明（短く）
-               desc = skill.description
-               if len(desc) > 30:
-                   desc = desc[:27] + "..."
-               skill_panel.add_child(Label(10, 35, desc, None, 14, (200, 200, 200)))
-               
-               # 外すボタン
-               remove_btn = Button(skill_panel.width - 70, 15, 60, 30, "外す", None, 16,
+        """スキル編集用のユニット選択"""
+        self.skill_panel.clear_children()
+        
+        # ユニット情報
+        self.skill_panel.add_child(Label(10, 10, f"ユニット: {unit.name}", None, 18, (255, 255, 255)))
+        self.skill_panel.add_child(Label(10, 35, f"職業: {unit.unit_class}", None, 16, (200, 200, 200)))
+        
+        # 現在のスキルリスト
+        self.skill_panel.add_child(Label(10, 60, "装備中スキル:", None, 18, (255, 255, 200)))
+        
+        if unit.skills:
+            for i, skill in enumerate(unit.skills):
+                skill_panel = Panel(10, 90 + i * 70, self.skill_panel.width - 20, 60, (50, 50, 60), (0, 0, 0), 1, 255)
+                
+                # スキル名
+                skill_panel.add_child(Label(10, 10, skill.name, None, 18, (255, 255, 255)))
+                
+                # スキル説明（短く）
+                desc = skill.description
+                if len(desc) > 30:
+                    desc = desc[:27] + "..."
+                skill_panel.add_child(Label(10, 35, desc, None, 14, (200, 200, 200)))
+                
+                # 外すボタン
+                remove_btn = Button(skill_panel.width - 70, 15, 60, 30, "外す", None, 16,
                                   (150, 60, 60), (255, 255, 255), (200, 80, 80),
-                                  (0, 0, 0), 1, lambda s=skill: self.remove_skill(unit, s))
-               skill_panel.add_child(remove_btn)
-               
-               self.skill_panel.add_child(skill_panel)
-       else:
-           self.skill_panel.add_child(Label(self.skill_panel.width // 2, 90, "スキルなし", None, 16, (180, 180, 180), None, "center"))
-       
-       # 装備可能なスキルリスト（ユニットが習得済みだが装備していないスキル）
-       available_skills = self.get_available_skills(unit)
-       
-       if available_skills:
-           self.skill_panel.add_child(Label(10, 210, "習得済みスキル:", None, 18, (255, 255, 200)))
-           
-           for i, skill in enumerate(available_skills):
-               skill_panel = Panel(10, 240 + i * 70, self.skill_panel.width - 20, 60, (50, 50, 60), (0, 0, 0), 1, 255)
-               
-               # スキル名
-               skill_panel.add_child(Label(10, 10, skill.name, None, 18, (255, 255, 255)))
-               
-               # スキル説明（短く）
-               desc = skill.description
-               if len(desc) > 30:
-                   desc = desc[:27] + "..."
-               skill_panel.add_child(Label(10, 35, desc, None, 14, (200, 200, 200)))
-               
-               # 装備ボタン
-               equip_btn = Button(skill_panel.width - 70, 15, 60, 30, "装備", None, 16,
+                                  (0, 0, 0), 1, self.remove_skill)
+                remove_btn.set_callback_args(unit, skill)
+                skill_panel.add_child(remove_btn)
+                
+                self.skill_panel.add_child(skill_panel)
+        else:
+            self.skill_panel.add_child(Label(self.skill_panel.width // 2, 90, "スキルなし", None, 16, (180, 180, 180), None, "center"))
+        
+        # 装備可能なスキルリスト（ユニットが習得済みだが装備していないスキル）
+        available_skills = self.get_available_skills(unit)
+        
+        if available_skills:
+            self.skill_panel.add_child(Label(10, 210, "習得済みスキル:", None, 18, (255, 255, 200)))
+            
+            # 表示範囲の行だけを生成
+            def build_skill_row(i, row_y):
+                skill = available_skills[i]
+                skill_panel = Panel(10, 240 + row_y, self.skill_panel.width - 20, 60, (50, 50, 60), (0, 0, 0), 1, 255)
+                
+                # スキル名
+                skill_panel.add_child(Label(10, 10, skill.name, None, 18, (255, 255, 255)))
+                
+                # スキル説明（短く）
+                desc = skill.description
+                if len(desc) > 30:
+                    desc = desc[:27] + "..."
+                skill_panel.add_child(Label(10, 35, desc, None, 14, (200, 200, 200)))
+                
+                # 装備ボタン
+                equip_btn = Button(skill_panel.width - 70, 15, 60, 30, "装備", None, 16,
                                  (60, 100, 60), (255, 255, 255), (80, 150, 80),
-                                 (0, 0, 0), 1, lambda s=skill: self.equip_skill(unit, s))
-               skill_panel.add_child(equip_btn)
-               
-               self.skill_panel.add_child(skill_panel)
-   
-   def get_available_skills(self, unit):
-       """ユニットが装備可能な（習得済みだが未装備の）スキルを取得"""
-       # 実際のゲームでは習得済みスキルのリストからユニットの装備中スキルを除外
-       available_skills = []
-       
-       # 仮のデータ（実際のゲームでは適切なデータソースから取得）
-       from skills import create_sample_skills
-       all_skills = create_sample_skills()
-       
-       # 現在装備していないスキルを抽出
-       equipped_skill_names = [skill.name for skill in unit.skills]
-       for skill in all_skills:
-           if skill.name not in equipped_skill_names:
-               # このスキルが習得可能か確認（レベルや職業による条件）
-               if self.can_learn_skill(unit, skill):
-                   available_skills.append(skill)
-       
-       return available_skills
-   
-   def can_learn_skill(self, unit, skill):
-       """ユニットがスキルを習得可能か確認"""
-       # 実際のゲームではより複雑な条件チェック
-       # 例：レベル条件、職業条件、前提スキルなど
-       
-       # 仮の実装：レベルに基づく簡易チェック
-       level_req = 1
-       if "太陽" in skill.name or "月光" in skill.name:
-           level_req = 10
-       elif "連撃" in skill.name or "連続攻撃" in skill.name:
-           level_req = 5
-       
-       return unit.level >= level_req
-   
-   def equip_skill(self, unit, skill):
-       """スキルを装備"""
-       # スキルスロット制限（仮に3つまで）
-       if len(unit.skills) >= 3:
-           # スキルスロット上限メッセージ（未実装）
-           return
-       
-       # スキルを追加
-       unit.add_skill(skill)
-       
-       # スキルパネルを更新
-       self.select_unit_for_skills(unit)
-   
-   def remove_skill(self, unit, skill):
-       """スキルを外す"""
-       # スキルを削除
-       unit.remove_skill(skill.name)
-       
-       # スキルパネルを更新
-       self.select_unit_for_skills(unit)
-   
-   def view_support_conversation(self, char1, char2, level):
-       """支援会話の閲覧"""
-       # ゲームマネージャーの会話表示メソッドを呼び出す
-       self.game_manager.view_support_conversation(char1, char2, level)
-       
-       # 閲覧後にタブを更新（会話が既読になるため）
-       self.update_tab_content()
-   
-   def close_tavern(self):
-       """酒場を閉じる"""
-       if self.on_close:
-           self.on_close()
\ No newline at end of file
+                                 (0, 0, 0), 1, self.equip_skill)
+                equip_btn.set_callback_args(unit, skill)
+                skill_panel.add_child(equip_btn)
+                return skill_panel
+            
+            self.skill_panel.add_child(VirtualScrollPanel(
+                0, 240, self.skill_panel.width, self.skill_panel.height - 240,
+                len(available_skills), 70, build_skill_row, (40, 40, 50), None, 0, 0
+            ))
+    
+    def get_available_skills(self, unit):
+        """ユニットが装備可能な（習得済みだが未装備の）スキルを取得"""
+        # 実際のゲームでは習得済みスキルのリストからユニットの装備中スキルを除外
+        available_skills = []
+        
+        # 現在装備していないスキルを抽出
+        equipped_skill_names = {skill.name for skill in unit.skills}
+        for skill in self._all_skills:
+            if skill.name not in equipped_skill_names:
+                # このスキルが習得可能か確認（レベルや職業による条件）
+                if self.can_learn_skill(unit, skill):
+                    available_skills.append(skill)
+        
+        return available_skills
+    
+    def can_learn_skill(self, unit, skill):
+        """ユニットがスキルを習得可能か確認"""
+        # 実際のゲームではより複雑な条件チェック
+        # 例：レベル条件、職業条件、前提スキルなど
+        
+        # 仮の実装：レベルに基づく簡易チェック
+        level_req = self._skill_level_reqs.get(skill.name)
+        if level_req is None:
+            level_req = get_skill_level_requirement(skill.name)
+        
+        return unit.level >= level_req
+    
+    def equip_skill(self, unit, skill):
+        """スキルを装備"""
+        # スキルスロット制限（仮に3つまで）
+        if len(unit.skills) >= 3:
+            # スキルスロット上限メッセージ（未実装）
+            return
+        
+        # スキルを追加（一覧のスキルは共有しているため複製を渡す）
+        unit.add_skill(skill.copy())
+        
+        # スキルパネルを更新
+        self.select_unit_for_skills(unit)
+    
+    def remove_skill(self, unit, skill):
+        """スキルを外す"""
+        # スキルを削除
+        unit.remove_skill(skill.name)
+        
+        # スキルパネルを更新
+        self.select_unit_for_skills(unit)
+    
+    def view_support_conversation(self, char1, char2, level):
+        """支援会話の閲覧"""
+        # ゲームマネージャーの会話表示メソッドを呼び出す
+        self.game_manager.view_support_conversation(char1, char2, level)
+        
+        # 閲覧後にタブを更新（会話が既読になるため）
+        self.update_tab_content()
+    
+    def close_tavern(self):
+        """酒場を閉じる"""
+        if self.on_close:
+            self.on_close()
\ No newline at end of file
@@ -1,17 +1,68 @@
 # town_screen.py
 import pygame
-import os
-from typing import List, Dict, Tuple, Optional, Callable
-from ui_system import Panel, Label, Button, ScrollPanel
-from font_manager import get_font
-from constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from typing import List
+from ui_system import Panel, Label, Button
 
-# 各施設用のクラスをインポート
-from adventurer_guild import AdventurerGuild, AdventurerGuildExtended
-from church import Church
-from weapon_shop import WeaponShop
-from save_shop import SaveShop
-from tavern import Tavern
+# 施設ボタン（表示名, 施設を開くメソッド名）
+FACILITY_BUTTONS = (
+    ("冒険者ギルド", "show_adventurer_guild"),
+    ("教会", "show_church"),
+    ("武器屋", "show_weapon_shop"),
+    ("酒場", "show_tavern"),
+    ("セーブ屋", "show_save_shop"),
+)
+
+# ボタンの配色
+BUTTON_TEXT_COLOR = (255, 255, 255)
+BUTTON_BORDER_COLOR = (0, 0, 0)
+FACILITY_BUTTON_COLOR = (60, 60, 100)
+FACILITY_BUTTON_HOVER_COLOR = (80, 80, 150)
+LEAVE_BUTTON_COLOR = (100, 60, 60)
+LEAVE_BUTTON_HOVER_COLOR = (150, 80, 80)
+
+# 街背景のキャッシュ（サイズ -> サーフェス）。背景は描画元として使うだけなので共有する
+_BACKGROUND_CACHE = {}
+
+# 建物の画像キャッシュ（(幅, 高さ, 色) -> サーフェス）
+_BUILDING_CACHE = {}
+ROOF_HEIGHT = 40
+BUILDING_MARGIN = 2  # 輪郭線のはみ出し分の余白
+ROAD_WIDTH = 30
+ROAD_COLOR = (150, 150, 150)
+
+# UI要素が処理しないウィンドウやオーディオ関連のイベント（子要素に渡さない）
+# （セーブ完了通知などのユーザーイベントは施設が処理するので除外しない）
+_IGNORED_EVENT_TYPES = frozenset((
+    pygame.ACTIVEEVENT, pygame.VIDEOEXPOSE,
+    pygame.WINDOWSHOWN, pygame.WINDOWHIDDEN, pygame.WINDOWEXPOSED, pygame.WINDOWMOVED,
+    pygame.WINDOWENTER, pygame.WINDOWLEAVE, pygame.WINDOWFOCUSGAINED, pygame.WINDOWFOCUSLOST,
+    pygame.AUDIODEVICEADDED, pygame.AUDIODEVICEREMOVED,
+))
+
+def _draw_outlined_polygon(surface, fill_color, outline_color, points):
+    """輪郭付きの多角形を描画"""
+    pygame.draw.polygon(surface, fill_color, points)
+    pygame.draw.polygon(surface, outline_color, points, 2)
+
+def _get_building_surface(w, h, color):
+    """屋根付きの建物の画像を取得（同じ大きさと色の建物は一度だけ描画）"""
+    key = (w, h, color)
+    surface = _BUILDING_CACHE.get(key)
+    if surface is None:
+        m = BUILDING_MARGIN
+        surface = pygame.Surface((w + m * 2 + 1, h + ROOF_HEIGHT + m * 2 + 1), pygame.SRCALPHA)
+        left, top = m, m + ROOF_HEIGHT
+        surface.fill(color, (left, top, w, h))
+        pygame.draw.rect(surface, (50, 50, 50), (left, top, w, h), 2)  # 輪郭
+        
+        # 屋根
+        _draw_outlined_polygon(surface, (180, 30, 30), (50, 50, 50), [
+            (left, top),
+            (left + w // 2, top - ROOF_HEIGHT),
+            (left + w // 2 * 2, top)
+        ])
+        _BUILDING_CACHE[key] = surface
+    return surface
 
 class TownScreen(Panel):
     """冒険者の街画面"""
@@ -21,6 +72,13 @@ class TownScreen(Panel):
         self.on_leave_town = on_leave_town
         self.current_facility = None
         
+        # 差分描画用（画面全体を描き直す必要があるか、部分的に描き直す範囲）
+        self._full_redraw = True
+        self._dirty_rects = []
+        
+        # 変化しないUI要素をまとめて描いたサーフェス
+        self._ui_layer = None
+        
         # 背景画像（実際のゲームでは適切な背景画像をロード）
         self.background = self._create_town_background()
         
@@ -28,7 +86,22 @@ class TownScreen(Panel):
         self._setup_ui()
     
     def _create_town_background(self):
-        """簡易的な街背景を作成"""
+        """簡易的な街背景を取得（同じサイズの背景は一度だけ作成）"""
+        key = (self.width, self.height)
+        bg = _BACKGROUND_CACHE.get(key)
+        if bg is None:
+            bg = self._draw_town_background()
+            # 画面と同じピクセル形式にしておくと毎フレームの転送が速い
+            # （画面がまだない場合は変換できないので、キャッシュせずに次回作り直す）
+            try:
+                bg = bg.convert()
+            except pygame.error:
+                return bg
+            _BACKGROUND_CACHE[key] = bg
+        return bg
+    
+    def _draw_town_background(self):
+        """簡易的な街背景を描画"""
         bg = pygame.Surface((self.width, self.height))
         bg.fill((100, 150, 100))  # 草原色の背景
         
@@ -41,22 +114,16 @@ class TownScreen(Panel):
             ((self.width // 2, self.height * 3 // 4), (150, 110), (100, 100, 150)),  # セーブ屋
         ]
         
-        for (x, y), (w, h), color in buildings:
-            pygame.draw.rect(bg, color, (x - w // 2, y - h // 2, w, h))
-            pygame.draw.rect(bg, (50, 50, 50), (x - w // 2, y - h // 2, w, h), 2)  # 輪郭
-            
-            # 屋根
-            roof_points = [
-                (x - w // 2, y - h // 2),
-                (x, y - h // 2 - 40),
-                (x + w // 2, y - h // 2)
-            ]
-            pygame.draw.polygon(bg, (180, 30, 30), roof_points)
-            pygame.draw.polygon(bg, (50, 50, 50), roof_points, 2)  # 輪郭
-        
-        # 道路
-        pygame.draw.line(bg, (150, 150, 150), (self.width // 2, 0), (self.width // 2, self.height), 30)
-        pygame.draw.line(bg, (150, 150, 150), (0, self.height // 2), (self.width, self.height // 2), 30)
+        bg.blits([
+            (_get_building_surface(w, h, color),
+             (x - w // 2 - BUILDING_MARGIN, y - h // 2 - ROOF_HEIGHT - BUILDING_MARGIN))
+            for (x, y), (w, h), color in buildings
+        ], False)
+        
+        # 道路（縦横の直線なので矩形の塗りつぶしで描く。位置は太線の描画と同じ）
+        road_offset = ROAD_WIDTH // 2 - 1
+        bg.fill(ROAD_COLOR, (self.width // 2 - road_offset, 0, ROAD_WIDTH, self.height))
+        bg.fill(ROAD_COLOR, (0, self.height // 2 - road_offset, self.width, ROAD_WIDTH))
         
         return bg
     
@@ -64,125 +131,152 @@ class TownScreen(Panel):
         """UI要素をセットアップ"""
         # タイトル
         title_label = Label(self.width // 2, 30, "冒険者の街", None, 36, (255, 255, 200), None, "center")
-        self.add_child(title_label)
         
         # 所持金表示
         gold_label = Label(self.width - 20, 20, f"所持金: {self.game_state_manager.player_gold}G", None, 24, (255, 255, 0), None, "right")
-        self.add_child(gold_label)
         self.gold_label = gold_label
+        self._last_gold = self.game_state_manager.player_gold  # 表示中の所持金
         
         # 施設ボタン
         button_width = 180
         button_height = 60
         button_margin = 20
         
-        facilities = [
-            ("冒険者ギルド", self.show_adventurer_guild),
-            ("教会", self.show_church),
-            ("武器屋", self.show_weapon_shop),
-            ("酒場", self.show_tavern),
-            ("セーブ屋", self.show_save_shop),
-        ]
+        x = self.width - button_width - button_margin
         
-        for i, (name, callback) in enumerate(facilities):
-            x = self.width - button_width - button_margin
-            y = 80 + i * (button_height + button_margin)
-            
-            facility_btn = Button(x, y, button_width, button_height, name, None, 24,
-                              (60, 60, 100), (255, 255, 255), (80, 80, 150),
-                              (0, 0, 0), 1, callback)
-            self.add_child(facility_btn)
+        children = [title_label, gold_label]
+        children += [
+            Button(x, 80 + i * (button_height + button_margin), button_width, button_height, name, None, 24,
+                   FACILITY_BUTTON_COLOR, BUTTON_TEXT_COLOR, FACILITY_BUTTON_HOVER_COLOR,
+                   BUTTON_BORDER_COLOR, 1, getattr(self, method_name))
+            for i, (name, method_name) in enumerate(FACILITY_BUTTONS)
+        ]
         
         # 街を出るボタン
-        leave_btn = Button(self.width - button_width - button_margin, self.height - button_height - button_margin,
+        leave_btn = Button(x, self.height - button_height - button_margin,
                          button_width, button_height, "街を出る", None, 24,
-                         (100, 60, 60), (255, 255, 255), (150, 80, 80),
-                         (0, 0, 0), 1, self.leave_town)
-        self.add_child(leave_btn)
+                         LEAVE_BUTTON_COLOR, BUTTON_TEXT_COLOR, LEAVE_BUTTON_HOVER_COLOR,
+                         BUTTON_BORDER_COLOR, 1, self.leave_town)
+        children.append(leave_btn)
+        
+        # 子要素はまとめて追加する
+        self.extend_children(children)
     
     def render(self, screen):
         """描画処理をオーバーライド"""
         # 背景表示
         screen.blit(self.background, (self.x, self.y))
         
-        # UI要素描画
-        for child in self.children:
-            if child.visible:
-                child.render(screen)
+        # UI要素描画（変化しない要素は一枚にまとめたものを使い、ホバーなどで変わった時だけ描き直す）
+        if self._ui_layer is None or self._dirty:
+            self._build_ui_layer()
+        screen.blit(self._ui_layer, (0, 0))
+        if self.gold_label.visible:
+            self.gold_label.render(screen)
         
         # 現在表示している施設
         if self.current_facility:
             self.current_facility.render(screen)
     
+    def _build_ui_layer(self):
+        """所持金と施設以外のUI要素を一枚のサーフェスに描く"""
+        # 子要素は画面座標で描画されるため、画面左上からの大きさで作る
+        layer = pygame.Surface((self.x + self.width, self.y + self.height), pygame.SRCALPHA)
+        for child in self.children:
+            if child.visible and child is not self.gold_label and child is not self.current_facility:
+                child.render(layer)
+        
+        try:
+            layer = layer.convert_alpha()
+        except pygame.error:
+            pass
+        self._ui_layer = layer
+        self._dirty = False
+    
+    def render_dirty(self, screen) -> List[pygame.Rect]:
+        """前回から変わった部分だけを描画し、画面に反映すべき範囲を返す"""
+        # 施設の表示中や、範囲の分からない変更（ボタンのホバーなど）があれば全体を描き直す
+        if self.current_facility or self._full_redraw or self._dirty:
+            screen.fill((0, 0, 0))
+            self.render(screen)
+            rects = [screen.get_rect()]
+        else:
+            rects = self._dirty_rects
+            if rects:
+                # 要素の範囲は一度だけ求め、重なり判定はpygame側（C実装）のcollidelistallに任せる
+                children = [child for child in self.children if child.visible]
+                child_rects = [self._get_element_rect(child) for child in children]
+            for rect in rects:
+                # 背景で消してから、重なる要素だけを描き直す
+                screen.blit(self.background, rect.topleft, rect.move(-self.x, -self.y))
+                screen.set_clip(rect)
+                for i in rect.collidelistall(child_rects):
+                    children[i].render(screen)
+                screen.set_clip(None)
+        
+        self._full_redraw = False
+        self._dirty_rects = []
+        self._dirty = False
+        return rects
+    
+    def _get_element_rect(self, element) -> pygame.Rect:
+        """子要素の描画範囲を取得"""
+        if isinstance(element, Label):
+            return element.get_rect()
+        return pygame.Rect(element.x, element.y, element.width, element.height)
+    
     def update(self):
         """状態更新"""
+        # 子要素の更新（表示中の施設も子要素なので、ここで一度だけ更新される）
         super().update()
         
-        # 所持金表示の更新
-        self.gold_label.set_text(f"所持金: {self.game_state_manager.player_gold}G")
-        
-        # 現在表示している施設の更新
-        if self.current_facility:
-            self.current_facility.update()
+        # 所持金表示の更新（変わった時だけ文字を描き直す）
+        gold = self.game_state_manager.player_gold
+        if gold != self._last_gold:
+            # 変更前後の表示範囲だけを描き直す
+            was_dirty = self._dirty
+            old_rect = self.gold_label.get_rect()
+            self.gold_label.set_text(f"所持金: {gold}G")
+            self._dirty_rects.append(old_rect.union(self.gold_label.get_rect()))
+            self._dirty = was_dirty
+            self._last_gold = gold
     
-    def show_adventurer_guild(self):
-        """冒険者ギルドを表示"""
-        if self.current_facility:
-            self.remove_child(self.current_facility)
+    def _open_facility(self, facility_class, *extra_args):
+        """施設を開く（表示中の施設は閉じる）"""
+        self.close_facility()
         
-        # 拡張版の冒険者ギルドを使用
-        self.current_facility = AdventurerGuildExtended(
+        self.current_facility = facility_class(
             50, 50, self.width - 100, self.height - 100,
-            self.game_state_manager, 
-            on_close=lambda: self.close_facility()
+            self.game_state_manager, *extra_args,
+            on_close=self.close_facility
         )
         
         self.add_child(self.current_facility)
     
+    def show_adventurer_guild(self):
+        """冒険者ギルドを表示"""
+        # 拡張版の冒険者ギルドを使用（施設のモジュールは開く時に読み込む）
+        from adventurer_guild import AdventurerGuildExtended
+        self._open_facility(AdventurerGuildExtended)
+    
     def show_church(self):
         """教会を表示"""
-        if self.current_facility:
-            self.remove_child(self.current_facility)
-        
-        self.current_facility = Church(
-            50, 50, self.width - 100, self.height - 100,
-            self.game_state_manager, 
-            on_close=lambda: self.close_facility()
-        )
-        
-        self.add_child(self.current_facility)
+        from church import Church
+        self._open_facility(Church)
     
     def show_weapon_shop(self):
         """武器屋を表示"""
-        if self.current_facility:
-            self.remove_child(self.current_facility)
-        
-        self.current_facility = WeaponShop(
-            50, 50, self.width - 100, self.height - 100,
-            self.game_state_manager, 
-            on_close=lambda: self.close_facility()
-        )
-        
-        self.add_child(self.current_facility)
+        from weapon_shop import WeaponShop
+        self._open_facility(WeaponShop)
     
     def show_tavern(self):
         """酒場を表示"""
-        if self.current_facility:
-            self.remove_child(self.current_facility)
-        
-        self.current_facility = Tavern(
-            50, 50, self.width - 100, self.height - 100,
-            self.game_state_manager, 
-            on_close=lambda: self.close_facility()
-        )
-        
-        self.add_child(self.current_facility)
+        from tavern import Tavern
+        self._open_facility(Tavern)
     
     def show_save_shop(self):
         """セーブ屋を表示"""
-        if self.current_facility:
-            self.remove_child(self.current_facility)
-        
+        from save_shop import SaveShop
         save_system = self.game_state_manager.save_system
         if not save_system:
             # ゲームマネージャーにセーブシステムがない場合は作成
@@ -190,20 +284,14 @@ class TownScreen(Panel):
             save_system = SaveSystem()
             self.game_state_manager.save_system = save_system
         
-        self.current_facility = SaveShop(
-            50, 50, self.width - 100, self.height - 100,
-            self.game_state_manager, 
-            save_system,
-            on_close=lambda: self.close_facility()
-        )
-        
-        self.add_child(self.current_facility)
+        self._open_facility(SaveShop, save_system)
     
     def close_facility(self):
         """施設を閉じる"""
         if self.current_facility:
             self.remove_child(self.current_facility)
             self.current_facility = None
+            self._full_redraw = True
     
     def leave_town(self):
         """街を出る"""
@@ -212,8 +300,12 @@ class TownScreen(Panel):
     
     def handle_event(self, event):
         """イベント処理"""
+        if event.type in _IGNORED_EVENT_TYPES:
+            return False
+        
         # 現在表示している施設があればそちらを優先
-        if self.current_facility and self.current_facility.handle_event(event):
+        facility = self.current_facility
+        if facility is not None and facility.handle_event(event):
             return True
         
         # 施設がないか処理されなかった場合は親クラスの処理
@@ -3,10 +3,53 @@ import pygame
 import os
 import sys
 
+# 検出済みのフォント情報（init_font_system()の結果、一度だけ検出する）
+_FONT_INFO = None
+# 作成済みのフォント（(フォントのパスまたは名前, サイズ) -> Font）
+_FONT_CACHE = {}
+# 作成済みのUI用フォントセット（基本サイズ -> フォントの辞書）
+_UI_FONT_SETS = {}
+
+# OSごとの代表的な日本語フォントファイル（フォント一覧の取得より先に直接確認する）
+_FAST_FONT_PATHS = {
+    'win': ["C:/Windows/Fonts/meiryo.ttc", "C:/Windows/Fonts/YuGothR.ttc"],
+    'darwin': ["/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc"],
+    'linux': ["/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc"],
+}
+
 def init_font_system():
-    """日本語フォントを使用するための初期化を行う"""
+    """日本語フォントを使用するための初期化を行う（検出は初回のみ）"""
+    global _FONT_INFO
+    if _FONT_INFO is None:
+        _FONT_INFO = _detect_font()
+    return _FONT_INFO
+
+def _supports_japanese(font):
+    """フォントに日本語の字形があるか（描画せずに字形の情報だけで判定）"""
+    metrics = font.metrics("日本語テスト")
+    # 字形がない文字は None か、存在しない文字（U+FFFF）と同じ代替字形の情報になる
+    missing = font.metrics("\uffff")[0]
+    return bool(metrics) and all(m is not None and m != missing for m in metrics)
+
+def _detect_font():
+    """使用可能な日本語フォントを検出する"""
     pygame.init()
     
+    # よく使われるフォントファイルがあれば、システムのフォント一覧を調べずに使う
+    for platform_key, paths in _FAST_FONT_PATHS.items():
+        if sys.platform.startswith(platform_key):
+            for path in paths:
+                if os.path.exists(path):
+                    try:
+                        if _supports_japanese(pygame.font.Font(path, 24)):
+                            return {
+                                'font_type': 'file',
+                                'font_path': path
+                            }
+                    except Exception:
+                        continue
+            break
+    
     # OSの判定
     if sys.platform.startswith('win'):
         # Windowsの場合、メイリオなどのフォントを使用
@@ -19,7 +62,7 @@ def init_font_system():
         font_names = ['Noto Sans CJK JP', 'IPAGothic', 'VL Gothic', 'Droid Sans Japanese', 'Arial']
     
     # 使用可能な日本語フォントを探す
-    available_fonts = pygame.font.get_fonts()
+    available_fonts = frozenset(pygame.font.get_fonts())
     system_font = None
     
     # 日本語フォントを探す
@@ -31,8 +74,7 @@ def init_font_system():
             if font_lower in available_fonts or font_name in available_fonts:
                 test_font = pygame.font.Font(font_name, 24)
                 # 日本語文字が描画できるかテスト
-                test_render = test_font.render("日本語テスト", True, (0, 0, 0))
-                if test_render.get_width() > 10:  # 正常に描画されていれば幅がある
+                if _supports_japanese(test_font):
                     system_font = font_name
                     break
         except:
@@ -52,8 +94,7 @@ def init_font_system():
             if os.path.exists(path):
                 try:
                     test_font = pygame.font.Font(path, 24)
-                    test_render = test_font.render("日本語テスト", True, (0, 0, 0))
-                    if test_render.get_width() > 10:
+                    if _supports_japanese(test_font):
                         # カスタムフォントを使用
                         return {
                             'font_type': 'file',
@@ -84,10 +125,18 @@ def create_font(size, font_info=None):
     
     if font_info['font_type'] == 'file':
         # フォントファイルを直接使用
-        return pygame.font.Font(font_info['font_path'], size)
+        source = font_info['font_path']
     else:
         # システムフォントを使用
-        return pygame.font.Font(font_info['font_name'], size)
+        source = font_info['font_name']
+    
+    # 同じフォント・サイズは一度だけ作成して共有
+    key = (source, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = pygame.font.Font(source, size)
+        _FONT_CACHE[key] = font
+    return font
 
 def create_ui_fonts(base_size=24):
     """
@@ -99,15 +148,20 @@ def create_ui_fonts(base_size=24):
     Returns:
         dict: さまざまなサイズのフォントを含む辞書
     """
-    font_info = init_font_system()
-    
-    return {
-        'small': create_font(int(base_size * 0.75), font_info),
-        'normal': create_font(base_size, font_info),
-        'large': create_font(int(base_size * 1.25), font_info),
-        'title': create_font(int(base_size * 1.5), font_info),
-        'header': create_font(int(base_size * 2), font_info)
-    }
+    # 同じ基本サイズのフォントセットは一度だけ組み立てる
+    fonts = _UI_FONT_SETS.get(base_size)
+    if fonts is None:
+        font_info = init_font_system()
+        fonts = {
+            'small': create_font(int(base_size * 0.75), font_info),
+            'normal': create_font(base_size, font_info),
+            'large': create_font(int(base_size * 1.25), font_info),
+            'title': create_font(int(base_size * 1.5), font_info),
+            'header': create_font(int(base_size * 2), font_info)
+        }
+        _UI_FONT_SETS[base_size] = fonts
+    # 呼び出し側での書き換えがキャッシュに及ばないよう辞書はコピーして返す
+    return dict(fonts)
 
 def patch_ui_system():
     """
@@ -120,6 +174,15 @@ def patch_ui_system():
     # フォント情報の初期化
     font_info = init_font_system()
     
+    # サイズ -> フォント（ウィジェット作成時は辞書を引くだけで済むようにする）
+    font_by_size = {}
+    
+    def get_font_for_size(font_size):
+        font = font_by_size.get(font_size)
+        if font is None:
+            font = font_by_size[font_size] = create_font(font_size, font_info)
+        return font
+    
     # Label.__init__の元のメソッドを保存
     original_label_init = Label.__init__
     
@@ -128,7 +191,7 @@ def patch_ui_system():
                        color=(255, 255, 255), background_color=None, align="left"):
         # フォントが指定されていない場合は日本語対応フォントを使用
         if font is None:
-            font = create_font(font_size, font_info)
+            font = get_font_for_size(font_size)
         
         # 元のイニシャライザを呼び出し
         original_label_init(self, x, y, text, font, font_size, color, background_color, align)
@@ -146,7 +209,7 @@ def patch_ui_system():
                         border_width=1, callback=None):
         # フォントが指定されていない場合は日本語対応フォントを使用
         if font is None:
-            font = create_font(font_size, font_info)
+            font = get_font_for_size(font_size)
         
         # 元のイニシャライザを呼び出し
         original_button_init(self, x, y, width, height, text, font, font_size,
@@ -166,7 +229,7 @@ def patch_ui_system():
                           border_width=1, alpha=230, font=None, font_size=24):
             # フォントが指定されていない場合は日本語対応フォントを使用
             if font is None:
-                font = create_font(font_size, font_info)
+                font = get_font_for_size(font_size)
             
             # 元のイニシャライザを呼び出し
             original_menu_init(self, x, y, width, item_height, items, callbacks,
@@ -186,7 +249,7 @@ def patch_ui_system():
                             close_button=True):
             # フォントが指定されていない場合は日本語対応フォントを使用
             if font is None:
-                font = create_font(font_size, font_info)
+                font = get_font_for_size(font_size)
             
             # 元のイニシャライザを呼び出し
             original_dialog_init(self, x, y, width, height, title, 
@@ -4,8 +4,34 @@ from typing import List, Dict, Tuple, Callable, Optional
 from constants import SCREEN_WIDTH, SCREEN_HEIGHT, GRID_SIZE, COLOR_BLACK, COLOR_WHITE, COLOR_BLUE, COLOR_RED, COLOR_GREEN, COLOR_YELLOW, COLOR_GRAY
 from font_manager import get_font
 
+def _blit_batch(screen, batch, special_flags=0):
+    """(サーフェス, 位置) の一覧をまとめて転送（fblitsがあれば使う）"""
+    fblits = getattr(screen, 'fblits', None)
+    if fblits:
+        fblits(batch, special_flags)
+    elif special_flags:
+        screen.blits([(surf, pos, None, special_flags) for surf, pos in batch], False)
+    else:
+        screen.blits(batch, False)
+
+
+def _make_border_tile(color, width):
+    """1マス分の枠線だけを描いた透明タイルを作成（ハイライト表示用）"""
+    tile = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
+    pygame.draw.rect(tile, color, (0, 0, GRID_SIZE, GRID_SIZE), width)
+    return tile
+
+
 class UIElement:
     """UIの基本クラス"""
+    # 処理するイベントの種類（Noneはすべて。これ以外の種類はパネルから渡されない）
+    INTERESTED_EVENTS = None
+    
+    # 数の多い部品（ラベル・ボタンなど）のインスタンス辞書を省く。
+    # __slots__を持たないサブクラス（パネルなど）は従来どおり任意の属性を追加できる
+    __slots__ = ('x', 'y', 'width', 'height', 'visible', 'active', 'parent',
+                 '_rect', '_hit_bounds', '_text_key', '_text_surface')
+    
     def __init__(self, x: int, y: int, width: int, height: int, visible: bool = True):
         self.x = x
         self.y = y
@@ -14,11 +40,28 @@ class UIElement:
         self.visible = visible
         self.active = True
         self.parent = None
+        
+        # 当たり判定用の矩形（位置・大きさの変更時に更新）
+        self._rect = pygame.Rect(x, y, width, height)
+        # 自身と子孫の当たり判定をすべて含む矩形（パネルのみ使用、変更時にNoneに戻す）
+        self._hit_bounds = None
+        
+        # 描画済みの文字（(文字列, 色, フォント) -> サーフェス）
+        self._text_key = None
+        self._text_surface = None
     
     def render(self, screen):
         """画面に描画する"""
         pass
     
+    def _render_text(self, text: str, color: Tuple[int, int, int]):
+        """文字を描画したサーフェスを取得（文字列・色・フォントが前回と同じなら再利用）"""
+        key = (text, color, self.font)
+        if key != self._text_key:
+            self._text_surface = self.font.render(text, True, color)
+            self._text_key = key
+        return self._text_surface
+    
     def handle_event(self, event) -> bool:
         """イベントを処理する。処理した場合はTrueを返す"""
         return False
@@ -31,15 +74,21 @@ class UIElement:
         """位置を設定する"""
         self.x = x
         self.y = y
+        self._rect.topleft = (x, y)
+        self._invalidate_hit_bounds()
     
     def set_size(self, width: int, height: int):
         """サイズを設定する"""
         self.width = width
         self.height = height
+        self._rect.size = (width, height)
+        self._invalidate_hit_bounds()
     
     def set_visible(self, visible: bool):
         """表示/非表示を設定する"""
-        self.visible = visible
+        if self.visible != visible:
+            self.visible = visible
+            self.mark_dirty()
     
     def set_active(self, active: bool):
         """アクティブ/非アクティブを設定する"""
@@ -47,7 +96,21 @@ class UIElement:
     
     def contains_point(self, x: int, y: int) -> bool:
         """指定された座標がこの要素内にあるかどうかを判定"""
-        return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+        return self._rect.collidepoint(x, y)
+    
+    def _invalidate_hit_bounds(self):
+        """当たり判定の範囲が変わったことを自身と親パネルに通知"""
+        element = self
+        while element:
+            element._hit_bounds = None
+            element = element.parent
+    
+    def mark_dirty(self):
+        """見た目が変わったことを親パネルに通知（描画キャッシュを無効化）"""
+        parent = self.parent
+        while parent:
+            parent._dirty = True
+            parent = parent.parent
 
 
 class Panel(UIElement):
@@ -63,33 +126,105 @@ class Panel(UIElement):
         self.border_width = border_width
         self.alpha = alpha
         self.children = []
+        # イベント処理用に逆順に並べた子要素（子要素の増減時に作り直す）
+        self._children_reversed = None
+        self._reversed_source = None
+        
+        # 静的な内容の描画キャッシュ（render_to_cacheで作成）
+        self._cache = None
+        self._cache_pos = (0, 0)
+        self._dirty = True
+        
+        # 半透明の背景（(幅, 高さ, 色, 透明度) が変わった時だけ作り直す）
+        self._bg_key = None
+        self._bg_surface = None
+        
+        # 直前のマウス位置が当たり判定の範囲内だったか
+        self._pointer_inside = True
     
     def render(self, screen):
         if not self.visible:
             return
         
-        # 半透明のパネルを描画
-        s = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        s.fill((self.color[0], self.color[1], self.color[2], self.alpha))
-        screen.blit(s, (self.x, self.y))
+        # キャッシュがあれば一枚の画像として描画
+        if self._cache is not None:
+            if self._dirty:
+                self.render_to_cache()
+            screen.blit(self._cache, self._cache_pos)
+            return
+        
+        self._render_contents(screen)
+    
+    def _render_contents(self, screen):
+        """パネルと子要素を描画"""
+        self._render_background(screen)
+        self._render_children(screen)
+    
+    def _render_background(self, screen):
+        """背景と枠線を描画"""
+        if self.alpha >= 255:
+            # 不透明なパネルは透過用のサーフェスを使わずに直接塗りつぶす
+            screen.fill(self.color, (self.x, self.y, self.width, self.height))
+        else:
+            # 半透明のパネルを描画
+            key = (self.width, self.height, self.color, self.alpha)
+            if key != self._bg_key:
+                self._bg_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+                self._bg_surface.fill((self.color[0], self.color[1], self.color[2], self.alpha))
+                self._bg_key = key
+            screen.blit(self._bg_surface, (self.x, self.y))
         
         # 枠線を描画
         if self.border_color:
             pygame.draw.rect(screen, self.border_color, 
                              (self.x, self.y, self.width, self.height), 
                              self.border_width)
-        
-        # 子要素を描画
+    
+    def _render_children(self, screen):
+        """子要素を描画（背景のないラベルが続く間は、文字の画像をまとめて一度に転送する）"""
+        # 描画先の範囲外にある要素は描画しない（パネルは子要素が範囲外にはみ出すことがあるので除く）
+        clip = screen.get_clip()
+        batch = []
         for child in self.children:
-            if child.visible:
-                child.render(screen)
+            if not child.visible:
+                continue
+            if isinstance(child, Label) and not child.background_color:
+                if child.text and clip.colliderect(child.get_rect()):
+                    batch.append((child._render_text(child.text, child.color), (child._aligned_x(), child.y)))
+                continue
+            if (not isinstance(child, Panel) and child.width > 0 and child.height > 0
+                    and not clip.colliderect((child.x, child.y, child.width, child.height))):
+                continue
+            if batch:
+                _blit_batch(screen, batch)
+                batch = []
+            child.render(screen)
+        if batch:
+            _blit_batch(screen, batch)
     
     def handle_event(self, event) -> bool:
         if not self.visible or not self.active:
             return False
         
-        # 子要素にイベントを伝播
-        for child in reversed(self.children):  # 描画順と逆順に処理（前面の要素が優先）
+        # 子要素のどれにも当たらない位置のマウス操作は伝播しない
+        # （子要素は画面座標で配置されパネル外にはみ出すことがあるため、子孫を含む範囲で判定する。
+        #   ホバーの解除やドラッグのため、範囲外へ出た直後の移動・ボタン押下中の移動・ボタンを離す操作は常に伝播する）
+        if event.type == pygame.MOUSEMOTION:
+            inside = self._get_hit_bounds().collidepoint(event.pos)
+            was_inside = self._pointer_inside
+            self._pointer_inside = inside
+            if not (inside or was_inside or any(event.buttons)):
+                return False
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if not self._get_hit_bounds().collidepoint(event.pos):
+                return False
+        
+        # 子要素にイベントを伝播（その種類のイベントを処理しない要素は呼ばない）
+        event_type = event.type
+        for child in self._get_children_reversed():  # 描画順と逆順に処理（前面の要素が優先）
+            interested = child.INTERESTED_EVENTS
+            if interested is not None and event_type not in interested:
+                continue
             if child.active and child.handle_event(event):
                 return True
         
@@ -103,27 +238,80 @@ class Panel(UIElement):
         for child in self.children:
             child.update()
     
+    def _get_children_reversed(self) -> tuple:
+        """前面の要素から順に並べた子要素を取得（childrenが差し替えられた場合も作り直す）"""
+        if self._children_reversed is None or self._reversed_source is not self.children:
+            self._children_reversed = tuple(reversed(self.children))
+            self._reversed_source = self.children
+        return self._children_reversed
+    
+    def _get_hit_bounds(self) -> pygame.Rect:
+        """自身と子孫の当たり判定をすべて含む矩形を取得（変更があるまで再計算しない）"""
+        if self._hit_bounds is None:
+            bounds = self._rect.copy()
+            for child in self.children:
+                bounds.union_ip(child._get_hit_bounds() if isinstance(child, Panel) else child._rect)
+            self._hit_bounds = bounds
+        return self._hit_bounds
+    
+    def render_to_cache(self):
+        """パネルと子要素を一度だけ描画してキャッシュする（以降は変更時のみ再描画）"""
+        # 子要素は画面座標で描画されるため、画面サイズの透明サーフェスに描いて使用範囲を切り出す
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._render_contents(surface)
+        bounds = surface.get_bounding_rect()
+        self._cache = surface.subsurface(bounds).copy()
+        self._cache_pos = bounds.topleft
+        self._dirty = False
+    
     def add_child(self, child):
         """子要素を追加"""
         self.children.append(child)
+        self._children_reversed = None
         child.parent = self
+        self._dirty = True
+        self.mark_dirty()
+        self._invalidate_hit_bounds()
         return child
     
+    def extend_children(self, children):
+        """複数の子要素をまとめて追加（キャッシュの無効化は一度だけ）"""
+        children = list(children)
+        for child in children:
+            child.parent = self
+        self.children.extend(children)
+        self._children_reversed = None
+        self._dirty = True
+        self.mark_dirty()
+        self._invalidate_hit_bounds()
+        return children
+    
     def remove_child(self, child):
         """子要素を削除"""
-        if child in self.children:
+        try:
             self.children.remove(child)
-            child.parent = None
+        except ValueError:
+            return
+        self._children_reversed = None
+        child.parent = None
+        self.mark_dirty()
+        self._invalidate_hit_bounds()
     
     def clear_children(self):
         """すべての子要素を削除"""
         for child in self.children:
             child.parent = None
         self.children.clear()
+        self._children_reversed = None
+        self.mark_dirty()
+        self._invalidate_hit_bounds()
 
 
 class Label(UIElement):
     """テキストラベル"""
+    INTERESTED_EVENTS = frozenset()
+    __slots__ = ('text', 'font', 'font_size', 'color', 'background_color', 'align')
+    
     def __init__(self, x: int, y: int, text: str, font=None, font_size: int = 24, 
                  color: Tuple[int, int, int] = COLOR_WHITE, 
                  background_color: Optional[Tuple[int, int, int]] = None,
@@ -139,40 +327,53 @@ class Label(UIElement):
     
     def _update_size(self):
         """テキストサイズに基づいてサイズを更新"""
-        text_surface = self.font.render(self.text, True, self.color)
-        self.width = text_surface.get_width()
-        self.height = text_surface.get_height()
+        # 描画せずに寸法だけを取得（描画はrender時に行う）
+        self.width, self.height = self.font.size(self.text)
+        self._rect.size = (self.width, self.height)
+        self._invalidate_hit_bounds()
     
     def render(self, screen):
         if not self.visible or not self.text:
             return
         
-        # テキストをレンダリング
-        text_surface = self.font.render(self.text, True, self.color)
+        # テキストをレンダリング（変更がなければ前回の画像を使う）
+        text_surface = self._render_text(self.text, self.color)
         
         # 背景を描画（指定されている場合）
         if self.background_color:
             pygame.draw.rect(screen, self.background_color, 
                              (self.x, self.y, self.width, self.height))
         
-        # アライメントに応じて位置を調整
-        x_pos = self.x
+        # テキストを描画（アライメントに応じて位置を調整）
+        screen.blit(text_surface, (self._aligned_x(), self.y))
+    
+    def _aligned_x(self) -> int:
+        """アライメントを考慮した描画位置のX座標を取得"""
         if self.align == "center":
-            x_pos = self.x - self.width // 2
+            return self.x - self.width // 2
         elif self.align == "right":
-            x_pos = self.x - self.width
-        
-        # テキストを描画
-        screen.blit(text_surface, (x_pos, self.y))
+            return self.x - self.width
+        return self.x
+    
+    def get_rect(self) -> pygame.Rect:
+        """アライメントを考慮した描画範囲を取得"""
+        return pygame.Rect(self._aligned_x(), self.y, self.width, self.height)
     
     def set_text(self, text: str):
-        """テキストを設定し、サイズを更新"""
+        """テキストを設定し、サイズを更新（同じテキストなら何もしない）"""
+        if text == self.text:
+            return
         self.text = text
         self._update_size()
+        self.mark_dirty()
 
 
 class Button(UIElement):
     """ボタン"""
+    INTERESTED_EVENTS = frozenset((pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
+    __slots__ = ('text', 'font', 'font_size', 'color', 'text_color', 'hover_color',
+                 'border_color', 'border_width', 'callback', 'callback_args', 'hovered', 'pressed')
+    
     def __init__(self, x: int, y: int, width: int, height: int, 
                  text: str, font=None, font_size: int = 24,
                  color: Tuple[int, int, int] = COLOR_GRAY,
@@ -191,16 +392,21 @@ class Button(UIElement):
         self.border_color = border_color
         self.border_width = border_width
         self.callback = callback
+        self.callback_args = ()  # コールバックに渡す引数
         self.hovered = False
         self.pressed = False
     
+    def set_callback_args(self, *args):
+        """コールバックに渡す引数を設定（一覧の行ごとにクロージャを作らずに済む）"""
+        self.callback_args = args
+    
     def render(self, screen):
         if not self.visible:
             return
         
         # ボタンの背景
         current_color = self.hover_color if self.hovered else self.color
-        pygame.draw.rect(screen, current_color, (self.x, self.y, self.width, self.height))
+        screen.fill(current_color, self._rect)
         
         # 枠線
         if self.border_color:
@@ -209,7 +415,7 @@ class Button(UIElement):
                              self.border_width)
         
         # テキスト
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = self._render_text(self.text, self.text_color)
         text_x = self.x + (self.width - text_surface.get_width()) // 2
         text_y = self.y + (self.height - text_surface.get_height()) // 2
         screen.blit(text_surface, (text_x, text_y))
@@ -219,19 +425,22 @@ class Button(UIElement):
             return False
         
         if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.contains_point(*event.pos)
+            hovered = self._rect.collidepoint(event.pos)
+            if hovered != self.hovered:
+                self.hovered = hovered
+                self.mark_dirty()
             return self.hovered
         
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.contains_point(*event.pos):
+            if self._rect.collidepoint(event.pos):
                 self.pressed = True
                 return True
         
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
             was_pressed = self.pressed
             self.pressed = False
-            if was_pressed and self.contains_point(*event.pos) and self.callback:
-                self.callback()
+            if was_pressed and self._rect.collidepoint(event.pos) and self.callback:
+                self.callback(*self.callback_args)
                 return True
         
         return False
@@ -239,6 +448,8 @@ class Button(UIElement):
 
 class ImageButton(Button):
     """画像ボタン"""
+    __slots__ = ('image', 'hover_image', '_scaled_images')
+    
     def __init__(self, x: int, y: int, width: int, height: int, 
                  image, hover_image=None,
                  text: str = "", font=None, font_size: int = 24,
@@ -251,6 +462,19 @@ class ImageButton(Button):
                          border_color, border_width, callback)
         self.image = image
         self.hover_image = hover_image or image
+        self._scaled_images = {}  # (画像, 幅, 高さ) -> ボタンの大きさに拡大縮小した画像
+    
+    def _get_scaled_image(self, image):
+        """ボタンの大きさに合わせた画像を取得（画像と大きさが変わらなければ再利用）"""
+        key = (image, self.width, self.height)
+        scaled = self._scaled_images.get(key)
+        if scaled is None:
+            # 通常時とホバー時の2枚だけを保持する
+            if len(self._scaled_images) >= 2:
+                self._scaled_images.clear()
+            scaled = pygame.transform.scale(image, (self.width, self.height))
+            self._scaled_images[key] = scaled
+        return scaled
     
     def render(self, screen):
         if not self.visible:
@@ -259,8 +483,7 @@ class ImageButton(Button):
         # 画像の描画
         current_image = self.hover_image if self.hovered else self.image
         # 画像をボタンのサイズに合わせる
-        scaled_image = pygame.transform.scale(current_image, (self.width, self.height))
-        screen.blit(scaled_image, (self.x, self.y))
+        screen.blit(self._get_scaled_image(current_image), (self.x, self.y))
         
         # 枠線
         if self.border_color:
@@ -270,13 +493,17 @@ class ImageButton(Button):
         
         # テキスト
         if self.text:
-            text_surface = self.font.render(self.text, True, self.text_color)
+            text_surface = self._render_text(self.text, self.text_color)
             text_x = self.x + (self.width - text_surface.get_width()) // 2
             text_y = self.y + (self.height - text_surface.get_height()) // 2
             screen.blit(text_surface, (text_x, text_y))
 
 
 class ProgressBar(UIElement):
+    INTERESTED_EVENTS = frozenset()
+    __slots__ = ('value', 'max_value', 'color', 'background_color', 'border_color',
+                 'border_width', 'show_text', 'font', 'font_size', '_bar_key', '_bar_surface')
+    
     def __init__(self, x: int, y: int, width: int, height: int,
                  value: float = 1.0, max_value: float = 1.0,
                  color: Tuple[int, int, int] = COLOR_GREEN,
@@ -295,43 +522,65 @@ class ProgressBar(UIElement):
         self.show_text = show_text
         self.font = font if font else get_font(font_size)  # フォントマネージャーを使用
         self.font_size = font_size
+        self._bar_key = None  # 描画済みバーの条件
+        self._bar_surface = None
     
     def render(self, screen):
         if not self.visible:
             return
         
-        # 背景
-        pygame.draw.rect(screen, self.background_color, 
-                         (self.x, self.y, self.width, self.height))
-        
-        # プログレスバー
         progress_width = int(self.width * (self.value / self.max_value)) if self.max_value > 0 else 0
-        if progress_width > 0:
-            pygame.draw.rect(screen, self.color, 
-                             (self.x, self.y, progress_width, self.height))
-        
-        # 枠線
-        if self.border_color:
-            pygame.draw.rect(screen, self.border_color, 
-                             (self.x, self.y, self.width, self.height), 
-                             self.border_width)
+        if 0 < self.width and 0 < self.height and progress_width <= self.width:
+            # バー部分は値や大きさが変わった時だけ描き直し、普段は1回の転送で済ませる
+            key = (progress_width, self.width, self.height, self.color,
+                   self.background_color, self.border_color, self.border_width)
+            if key != self._bar_key:
+                self._bar_surface = pygame.Surface((self.width, self.height))
+                self._draw_bar(self._bar_surface, 0, 0, progress_width)
+                self._bar_key = key
+            screen.blit(self._bar_surface, (self.x, self.y))
+        else:
+            self._draw_bar(screen, self.x, self.y, progress_width)
         
         # テキスト
         if self.show_text:
             text = f"{int(self.value)}/{int(self.max_value)}"
-            text_surface = self.font.render(text, True, COLOR_BLACK)
+            text_surface = self._render_text(text, COLOR_BLACK)
             text_x = self.x + (self.width - text_surface.get_width()) // 2
             text_y = self.y + (self.height - text_surface.get_height()) // 2
             screen.blit(text_surface, (text_x, text_y))
     
+    def _draw_bar(self, surface, x, y, progress_width):
+        """バー（塗りつぶし・背景・枠線）を指定位置に描画"""
+        # 塗りつぶしはfillで行い、背景はバーに隠れない部分だけ描く
+        if progress_width > 0:
+            surface.fill(self.color, (x, y, progress_width, self.height))
+        else:
+            progress_width = 0
+        
+        # 背景
+        if progress_width < self.width:
+            surface.fill(self.background_color,
+                         (x + progress_width, y, self.width - progress_width, self.height))
+        
+        # 枠線
+        if self.border_color:
+            pygame.draw.rect(surface, self.border_color, 
+                             (x, y, self.width, self.height), 
+                             self.border_width)
+    
     def set_value(self, value: float):
         """値を設定"""
-        self.value = max(0, min(value, self.max_value))
+        value = max(0, min(value, self.max_value))
+        if value != self.value:
+            self.value = value
+            self.mark_dirty()
     
     def set_max_value(self, max_value: float):
         """最大値を設定"""
         self.max_value = max(0.1, max_value)
         self.value = min(self.value, self.max_value)
+        self.mark_dirty()
 
 
 class ScrollPanel(Panel):
@@ -349,6 +598,19 @@ class ScrollPanel(Panel):
         self.dragging = False
         self.drag_start_y = 0
         self.drag_start_scroll = 0
+        self._update_scroll_metrics()
+    
+    def _update_scroll_metrics(self):
+        """スクロールバーの高さを計算（コンテンツ高さや大きさが変わった時のみ）"""
+        if self.content_height > self.height:
+            self._bar_height = max(20, int(self.height * (self.height / self.content_height)))
+        else:
+            self._bar_height = None  # スクロールバーなし
+    
+    def set_size(self, width: int, height: int):
+        """サイズを設定し、スクロールバーの高さを更新"""
+        super().set_size(width, height)
+        self._update_scroll_metrics()
     
     def render(self, screen):
         if not self.visible:
@@ -358,8 +620,8 @@ class ScrollPanel(Panel):
         super().render(screen)
         
         # スクロールバーを描画
-        if self.content_height > self.height:
-            bar_height = max(20, int(self.height * (self.height / self.content_height)))
+        bar_height = self._bar_height
+        if bar_height is not None:
             bar_y = self.y + int(self.scroll_y / self.max_scroll * (self.height - bar_height))
             
             pygame.draw.rect(screen, COLOR_BLACK, 
@@ -375,9 +637,11 @@ class ScrollPanel(Panel):
         if event.type == pygame.MOUSEBUTTONDOWN and self.contains_point(*event.pos):
             if event.button == 4:  # マウスホイール上回転
                 self.scroll_y = max(0, self.scroll_y - 20)
+                self.mark_dirty()
                 return True
             elif event.button == 5:  # マウスホイール下回転
                 self.scroll_y = min(self.max_scroll, self.scroll_y + 20)
+                self.mark_dirty()
                 return True
             elif event.button == 1:  # 左クリック
                 # スクロールバー領域をクリックした場合はドラッグ開始
@@ -397,10 +661,15 @@ class ScrollPanel(Panel):
             drag_distance = event.pos[1] - self.drag_start_y
             self.scroll_y = max(0, min(self.max_scroll,
                                      self.drag_start_scroll + drag_distance * self.max_scroll / self.height))
+            self.mark_dirty()
             return True
         
-        # 子要素のイベント処理
-        for child in reversed(self.children):  # 描画順と逆順に処理
+        # 子要素のイベント処理（その種類のイベントを処理しない要素は呼ばない）
+        event_type = event.type
+        for child in self._get_children_reversed():  # 描画順と逆順に処理
+            interested = child.INTERESTED_EVENTS
+            if interested is not None and event_type not in interested:
+                continue
             if child.active and child.handle_event(event):
                 return True
         
@@ -413,8 +682,20 @@ class ScrollPanel(Panel):
         if child_bottom > self.content_height:
             self.content_height = child_bottom
             self.max_scroll = max(0, self.content_height - self.height)
+            self._update_scroll_metrics()
         return child
     
+    def extend_children(self, children):
+        """複数の子要素をまとめて追加し、コンテンツ高さを一度だけ更新"""
+        children = super().extend_children(children)
+        if children:
+            bottom = max(child.y + child.height for child in children)
+            if bottom > self.content_height:
+                self.content_height = bottom
+                self.max_scroll = max(0, self.content_height - self.height)
+                self._update_scroll_metrics()
+        return children
+    
     def update_content_height(self):
         """子要素に基づいてコンテンツ高さを更新"""
         max_height = 0
@@ -425,6 +706,127 @@ class ScrollPanel(Panel):
         
         self.content_height = max(max_height, self.height)
         self.max_scroll = max(0, self.content_height - self.height)
+        self._update_scroll_metrics()
+
+
+class RowListPanel(ScrollPanel):
+    """同じ形の行を並べるスクロールパネル（行の背景と文字をまとめて一度に転送する）"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 行の背景と枠線の画像（形と色ごとに一度だけ作り、全行で共有）
+        self._row_chromes = {}
+    
+    def _get_row_chrome(self, row):
+        """不透明な行の背景と枠線を描いた画像を取得（なければ作成）"""
+        key = (row.width, row.height, row.color, row.border_color, row.border_width)
+        chrome = self._row_chromes.get(key)
+        if chrome is None:
+            chrome = pygame.Surface((row.width, row.height))
+            chrome.fill(row.color)
+            if row.border_color:
+                pygame.draw.rect(chrome, row.border_color, (0, 0, row.width, row.height), row.border_width)
+            self._row_chromes[key] = chrome
+        return chrome
+    
+    def _render_children(self, screen):
+        """不透明で背景のないラベルだけを持つ行は、背景と文字の画像を一つの一覧にして転送する"""
+        clip = screen.get_clip()
+        batch = []
+        for row in self.children:
+            if not row.visible:
+                continue
+            if (type(row) is not Panel or row.alpha < 255 or row._cache is not None
+                    or any(type(label) is not Label or label.background_color for label in row.children)):
+                # 形の違う要素はそのまま描画
+                if batch:
+                    _blit_batch(screen, batch)
+                    batch = []
+                row.render(screen)
+                continue
+            
+            batch.append((self._get_row_chrome(row), (row.x, row.y)))
+            for label in row.children:
+                if label.visible and label.text and clip.colliderect(label.get_rect()):
+                    batch.append((label._render_text(label.text, label.color), (label._aligned_x(), label.y)))
+        if batch:
+            _blit_batch(screen, batch)
+
+
+class VirtualScrollPanel(RowListPanel):
+    """表示範囲に入る行だけを生成するスクロールパネル（行数の多い一覧用）"""
+    def __init__(self, x: int, y: int, width: int, height: int,
+                 item_count: int, item_height: int,
+                 build_row: Callable[[int, int], UIElement],
+                 color: Tuple[int, int, int] = COLOR_GRAY,
+                 border_color: Optional[Tuple[int, int, int]] = COLOR_BLACK,
+                 border_width: int = 1,
+                 alpha: int = 200):
+        super().__init__(x, y, width, height, item_count * item_height,
+                         color, border_color, border_width, alpha)
+        self.item_count = item_count
+        self.item_height = item_height
+        self.build_row = build_row  # build_row(行番号, 行のy座標) -> 行の要素
+        self._rows = {}  # 行番号 -> (生成・移動時の行のy座標, 生成済みの行)
+        self._row_range = None
+        self._sync_rows()
+    
+    def _sync_rows(self):
+        """スクロール位置に合わせて表示中の行だけを子要素にする"""
+        scroll_y = int(self.scroll_y)
+        first = scroll_y // self.item_height
+        last = min(self.item_count, (scroll_y + self.height) // self.item_height + 1)
+        if self._row_range == (first, last, scroll_y):
+            return
+        self._row_range = (first, last, scroll_y)
+        
+        # 画面外に出た行は破棄し、表示中の行は行番号ごとに使い回す（スクロールした分だけ移動する）
+        rows = {}
+        for i in range(first, last):
+            row_y = i * self.item_height - scroll_y
+            cached = self._rows.get(i)
+            if cached is None:
+                rows[i] = (row_y, self.build_row(i, row_y))
+                continue
+            old_y, row = cached
+            if old_y != row_y:
+                row.set_position(row.x, row.y + row_y - old_y)
+            rows[i] = (row_y, row)
+        self._rows = rows
+        
+        self.clear_children()
+        self.extend_children([row for _, row in rows.values()])
+    
+    def set_item_count(self, item_count: int):
+        """行数を変更し、表示中の行を作り直す（行の内容が変わった時にも使う）"""
+        self.item_count = item_count
+        self.content_height = max(item_count * self.item_height, self.height)
+        self.max_scroll = max(0, item_count * self.item_height - self.height)
+        self.scroll_y = min(self.scroll_y, self.max_scroll)
+        self._update_scroll_metrics()
+        self._rows = {}
+        self._row_range = None
+        self._sync_rows()
+    
+    def render(self, screen):
+        if not self.visible:
+            return
+        
+        self._sync_rows()
+        super().render(screen)
+    
+    def handle_event(self, event) -> bool:
+        handled = super().handle_event(event)
+        self._sync_rows()
+        return handled
+    
+    def add_child(self, child):
+        """子要素を追加（コンテンツ高さは行数から決まるため更新しない）"""
+        Panel.add_child(self, child)
+        return child
+    
+    def extend_children(self, children):
+        """複数の子要素をまとめて追加（コンテンツ高さは更新しない）"""
+        return Panel.extend_children(self, children)
 
 
 class Menu(Panel):
@@ -450,19 +852,100 @@ class Menu(Panel):
         from font_manager import get_font
         self.font = font if font else get_font(font_size)
         
-        # ボタンの生成
+        # 項目の設定（ボタンは作らず、項目の一覧を一枚の画像として描画する）
+        self.hover_color = (220, 220, 220)
+        self.text_color = COLOR_BLACK
         self.setup_buttons()
     
+    def setup_buttons(self):
+        """項目を設定する（描画用の画像は次の描画時に作成）"""
+        self.clear_children()
+        self._entries = list(zip(self.items, self.callbacks))
+        self._list_key = None
+        self._list_surface = None
+        self._item_surfaces = []
+        self.hovered_index = -1
+        self.pressed_index = -1
+        
+        # 背景と当たり判定の範囲を項目数に合わせる
+        self.set_size(self.width, self.item_height * len(self._entries))
+        self.mark_dirty()
+    
+    def _build_list_surface(self):
+        """全項目を描いた画像を作成（項目・大きさ・色・フォントが変わった時のみ）"""
+        key = (tuple(self._entries), self.width, self.item_height, self.color, self.text_color, self.font)
+        if key == self._list_key:
+            return
+        
+        width, item_height = self.width, self.item_height
+        surface = pygame.Surface((width, item_height * len(self._entries)), pygame.SRCALPHA)
+        self._item_surfaces = []
+        for i, (item, _) in enumerate(self._entries):
+            row_y = i * item_height
+            text_surface = self.font.render(item, True, self.text_color)
+            text_pos = ((width - text_surface.get_width()) // 2,
+                        row_y + (item_height - text_surface.get_height()) // 2)
+            pygame.draw.rect(surface, self.color, (0, row_y, width, item_height))
+            surface.blit(text_surface, text_pos)
+            self._item_surfaces.append((text_surface, text_pos))
+        
+        self._list_surface = surface
+        self._list_key = key
+    
+    def _index_at(self, pos) -> int:
+        """座標にある項目の番号を取得（項目外なら-1）"""
+        x, y = pos
+        if not (self.x <= x < self.x + self.width) or y < self.y:
+            return -1
+        index = (y - self.y) // self.item_height
+        return index if index < len(self._entries) else -1
+    
     def render(self, screen):
         if not self.visible:
             return
-            
-        super().render(screen)
+        
+        # 項目の一覧を一度に描画し、ホバー中の項目だけを描き重ねる
+        # （項目がパネル全体を覆うので、パネルの背景は描かない）
+        self._build_list_surface()
+        screen.blit(self._list_surface, (self.x, self.y))
+        if self.hovered_index >= 0:
+            row_y = self.y + self.hovered_index * self.item_height
+            pygame.draw.rect(screen, self.hover_color, (self.x, row_y, self.width, self.item_height))
+            text_surface, (text_x, text_y) = self._item_surfaces[self.hovered_index]
+            screen.blit(text_surface, (self.x + text_x, self.y + text_y))
+        
+        # 枠線
+        if self.border_color:
+            pygame.draw.rect(screen, self.border_color,
+                             (self.x, self.y, self.width, self.height),
+                             self.border_width)
     
     def handle_event(self, event) -> bool:
         if not self.visible or not self.active:
             return False
-            
+        
+        if event.type == pygame.MOUSEMOTION:
+            index = self._index_at(event.pos)
+            if index != self.hovered_index:
+                self.hovered_index = index
+                self.mark_dirty()
+            return index >= 0
+        
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            index = self._index_at(event.pos)
+            if index >= 0:
+                self.pressed_index = index
+                return True
+        
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            pressed_index = self.pressed_index
+            self.pressed_index = -1
+            if pressed_index >= 0 and self._index_at(event.pos) == pressed_index:
+                callback = self._entries[pressed_index][1]
+                if callback:
+                    callback()
+                    return True
+        
         return super().handle_event(event)
 
     def clear_children(self):
@@ -482,7 +965,7 @@ class Dialog(Panel):
         super().__init__(x, y, width, height, color, border_color, border_width, alpha)
         
         self.title = title
-        self.font = font or pygame.font.Font(None, font_size)
+        self.font = font or get_font(font_size)
         
         # タイトルバー
         if title:
@@ -519,83 +1002,133 @@ class BattleForecast(Panel):
         
         self.attacker = attacker
         self.defender = defender
-        self.font = font or pygame.font.Font(None, font_size)
-        self.small_font = pygame.font.Font(None, 20)
+        self.font = font or get_font(font_size)
+        self.small_font = get_font(20)
         
         # タイトル
         title_label = Label(width//2, 10, "戦闘予測", self.font, font_size, COLOR_WHITE, None, "center")
         self.add_child(title_label)
         
-        self.setup_ui()
+        # ラベルは一度だけ作成し、予測の更新時は文字だけを差し替える
+        self._build_layout()
+        self._refresh()
     
-    def setup_ui(self):
-        """UIのセットアップ"""
-        if not self.attacker or not self.defender:
-            return
-            
+    def _build_layout(self):
+        """予測表示用のラベルを作成"""
+        small_font = self.small_font
+        
         # 左側（攻撃側）
         left_x = 20
-        self.add_child(Label(left_x, 50, self.attacker.name, self.font, 28, COLOR_BLUE))
-        self.add_child(Label(left_x, 80, f"HP: {self.attacker.current_hp}/{self.attacker.max_hp}", self.small_font))
-        
-        if self.attacker.equipped_weapon:
-            weapon_name = self.attacker.equipped_weapon.name
-            self.add_child(Label(left_x, 100, f"武器: {weapon_name}", self.small_font))
-        
-        # 攻撃力・命中・必殺
-        self.add_child(Label(left_x, 120, f"攻撃力: {self.attacker.get_attack_power()}", self.small_font))
-        hit_rate = min(100, max(0, self.attacker.get_hit_rate() - self.defender.get_avoid()))
-        self.add_child(Label(left_x, 140, f"命中率: {hit_rate}%", self.small_font))
-        crit_rate = max(0, self.attacker.get_critical_rate() - self.defender.luck)
-        self.add_child(Label(left_x, 160, f"必殺率: {crit_rate}%", self.small_font))
+        self._atk_name_label = Label(left_x, 50, "", self.font, 28, COLOR_BLUE)
+        self._atk_hp_label = Label(left_x, 80, "", small_font)
+        self._atk_weapon_label = Label(left_x, 100, "", small_font)
+        self._atk_power_label = Label(left_x, 120, "", small_font)
+        self._atk_hit_label = Label(left_x, 140, "", small_font)
+        self._atk_crit_label = Label(left_x, 160, "", small_font)
         
         # 右側（防御側）
         right_x = self.width - 150
-        self.add_child(Label(right_x, 50, self.defender.name, self.font, 28, COLOR_RED))
-        self.add_child(Label(right_x, 80, f"HP: {self.defender.current_hp}/{self.defender.max_hp}", self.small_font))
+        self._def_name_label = Label(right_x, 50, "", self.font, 28, COLOR_RED)
+        self._def_hp_label = Label(right_x, 80, "", small_font)
+        self._def_weapon_label = Label(right_x, 100, "", small_font)
+        self._counter_label = Label(right_x, 120, "", small_font)
+        self._def_power_label = Label(right_x, 140, "", small_font)
+        self._def_hit_label = Label(right_x, 160, "", small_font)
+        self._def_crit_label = Label(right_x, 180, "", small_font)
+        
+        # 攻撃回数
+        center_x = self.width // 2
+        self._hits_title_label = Label(center_x, 130, "攻撃回数", small_font, 20, COLOR_WHITE, None, "center")
+        self._atk_hits_label = Label(center_x - 40, 150, "", small_font, 20, COLOR_BLUE, None, "center")
+        self._def_hits_label = Label(center_x + 40, 150, "", small_font, 20, COLOR_RED, None, "center")
+        # 区切り線の端点（ラベルと同じ座標系）
+        self._divider_start = (center_x, 145)
+        self._divider_end = (center_x, 165)
+        
+        self._forecast_labels = [
+            self._atk_name_label, self._atk_hp_label, self._atk_weapon_label,
+            self._atk_power_label, self._atk_hit_label, self._atk_crit_label,
+            self._def_name_label, self._def_hp_label, self._def_weapon_label, self._counter_label,
+            self._def_power_label, self._def_hit_label, self._def_crit_label,
+            self._hits_title_label, self._atk_hits_label, self._def_hits_label,
+        ]
+        self.extend_children(self._forecast_labels)
+    
+    def _refresh(self):
+        """攻撃側・防御側の情報で表示を更新（変わったラベルだけが描き直される）"""
+        attacker = self.attacker
+        defender = self.defender
+        has_units = bool(attacker and defender)
+        for label in self._forecast_labels:
+            label.set_visible(has_units)
+        if not has_units:
+            return
         
-        if self.defender.equipped_weapon:
-            weapon_name = self.defender.equipped_weapon.name
-            self.add_child(Label(right_x, 100, f"武器: {weapon_name}", self.small_font))
+        # 攻撃側
+        self._atk_name_label.set_text(attacker.name)
+        self._atk_hp_label.set_text(f"HP: {attacker.current_hp}/{attacker.max_hp}")
+        if attacker.equipped_weapon:
+            self._atk_weapon_label.set_text(f"武器: {attacker.equipped_weapon.name}")
+        else:
+            self._atk_weapon_label.set_visible(False)
+        self._atk_power_label.set_text(f"攻撃力: {attacker.get_attack_power()}")
+        hit_rate = min(100, max(0, attacker.get_hit_rate() - defender.get_avoid()))
+        self._atk_hit_label.set_text(f"命中率: {hit_rate}%")
+        crit_rate = max(0, attacker.get_critical_rate() - defender.luck)
+        self._atk_crit_label.set_text(f"必殺率: {crit_rate}%")
+        
+        # 防御側
+        self._def_name_label.set_text(defender.name)
+        self._def_hp_label.set_text(f"HP: {defender.current_hp}/{defender.max_hp}")
+        if defender.equipped_weapon:
+            self._def_weapon_label.set_text(f"武器: {defender.equipped_weapon.name}")
+        else:
+            self._def_weapon_label.set_visible(False)
         
         # 防御側の反撃
-        counter_text = "反撃あり" if self.can_counter() else "反撃なし"
-        self.add_child(Label(right_x, 120, counter_text, self.small_font))
-        
-        if self.can_counter():
-            # 攻撃力・命中・必殺（防御側）
-            self.add_child(Label(right_x, 140, f"攻撃力: {self.defender.get_attack_power()}", self.small_font))
-            hit_rate = min(100, max(0, self.defender.get_hit_rate() - self.attacker.get_avoid()))
-            self.add_child(Label(right_x, 160, f"命中率: {hit_rate}%", self.small_font))
-            crit_rate = max(0, self.defender.get_critical_rate() - self.attacker.luck)
-            self.add_child(Label(right_x, 180, f"必殺率: {crit_rate}%", self.small_font))
-            
-        # 攻撃回数
-        attacker_hits = "2回" if self.attacker.can_double_attack(self.defender) else "1回"
-        defender_hits = "2回" if self.can_counter() and self.defender.can_double_attack(self.attacker) else "1回" if self.can_counter() else "0回"
+        can_counter = self.can_counter()
+        self._counter_label.set_text("反撃あり" if can_counter else "反撃なし")
+        if can_counter:
+            self._def_power_label.set_text(f"攻撃力: {defender.get_attack_power()}")
+            hit_rate = min(100, max(0, defender.get_hit_rate() - attacker.get_avoid()))
+            self._def_hit_label.set_text(f"命中率: {hit_rate}%")
+            crit_rate = max(0, defender.get_critical_rate() - attacker.luck)
+            self._def_crit_label.set_text(f"必殺率: {crit_rate}%")
+        else:
+            self._def_power_label.set_visible(False)
+            self._def_hit_label.set_visible(False)
+            self._def_crit_label.set_visible(False)
         
-        center_x = self.width // 2
-        self.add_child(Label(center_x, 130, "攻撃回数", self.small_font, COLOR_WHITE, None, "center"))
-        self.add_child(Label(center_x - 40, 150, attacker_hits, self.small_font, COLOR_BLUE, None, "center"))
-        self.add_child(Label(center_x + 40, 150, defender_hits, self.small_font, COLOR_RED, None, "center"))
+        # 攻撃回数
+        self._atk_hits_label.set_text("2回" if attacker.can_double_attack(defender) else "1回")
+        if can_counter:
+            self._def_hits_label.set_text("2回" if defender.can_double_attack(attacker) else "1回")
+        else:
+            self._def_hits_label.set_text("0回")
+    
+    def render(self, screen):
+        super().render(screen)
         
-        # 装飾
-        pygame.draw.line(screen, COLOR_WHITE, (center_x, 145), (center_x, 165), 1)
+        # 装飾（攻撃回数の区切り線）
+        if self.visible and self.attacker and self.defender:
+            pygame.draw.line(screen, COLOR_WHITE, self._divider_start, self._divider_end, 1)
     
     def can_counter(self):
         """防御側が反撃可能か判定"""
-        if not self.defender or not self.defender.equipped_weapon:
+        attacker = self.attacker
+        defender = self.defender
+        weapon = defender.equipped_weapon if defender else None
+        if not weapon:
             return False
-            
-        range_diff = abs(self.attacker.x - self.defender.x) + abs(self.attacker.y - self.defender.y)
-        return self.defender.equipped_weapon.range_min <= range_diff <= self.defender.equipped_weapon.range_max
+        
+        range_diff = abs(attacker.x - defender.x) + abs(attacker.y - defender.y)
+        return weapon.range_min <= range_diff <= weapon.range_max
     
     def update_forecast(self, attacker, defender):
         """戦闘予測を更新"""
         self.attacker = attacker
         self.defender = defender
-        self.clear_children()
-        self.setup_ui()
+        self._refresh()
 
 
 class StatusWindow(Panel):
@@ -610,9 +1143,9 @@ class StatusWindow(Panel):
         super().__init__(x, y, width, height, color, border_color, border_width, alpha)
         
         self.unit = unit
-        self.font = font or pygame.font.Font(None, font_size)
-        self.title_font = pygame.font.Font(None, 28)
-        self.small_font = pygame.font.Font(None, 20)
+        self.font = font or get_font(font_size)
+        self.title_font = get_font(28)
+        self.small_font = get_font(20)
         
         self.setup_ui()
     
@@ -726,21 +1259,6 @@ class ActionMenu(Menu):
         # メニューを閉じる
         self.visible = False
 
-    def setup_buttons(self):
-        """ボタンを設定する際にフォントを明示的に指定しない"""
-        # Menu クラスの setup_buttons をオーバーライド
-        self.clear_children()
-        
-        from font_manager import get_font
-        
-        for i, (item, callback) in enumerate(zip(self.items, self.callbacks)):
-            # フォントを明示的に指定しない (get_font(font_size) が使われる)
-            button = Button(0, i * self.item_height, self.width, self.item_height,
-                           item, None, self.font_size,  # None を渡してデフォルトフォントを使う
-                           self.color, COLOR_BLACK, (220, 220, 220),
-                           None, 0, callback)
-            self.add_child(button)
-
     def update_actions(self, unit):
         """ユニットの状態に応じて行動リストを更新"""
         actions = ["攻撃", "待機", "アイテム"]
@@ -785,6 +1303,32 @@ class ActionMenu(Menu):
         self.items = actions
         self.setup_buttons()
 
+class _UnitRow(Panel):
+    """ユニット一覧の1行（クリックで一覧の現在位置のユニットを選択）"""
+    def __init__(self, owner, unit_index, *args):
+        super().__init__(*args)
+        self.owner = owner
+        self.unit_index = unit_index
+        self.chrome = None  # 背景と枠線を描いた画像（同じ色の行で共有）
+    
+    def _render_background(self, screen):
+        screen.blit(self.chrome, (self.x, self.y))
+    
+    def sync(self, unit):
+        """ユニットの現在の状態に合わせて表示を更新（変化した部品だけが再描画される）"""
+        self.name_label.set_text(unit.name)
+        self.info_label.set_text(f"Lv {unit.level} {unit.unit_class}")
+        
+        hp_bar = self.hp_bar
+        if hp_bar.max_value != unit.max_hp:
+            hp_bar.set_max_value(unit.max_hp)
+        if hp_bar.value != unit.current_hp:
+            hp_bar.set_value(unit.current_hp)
+    
+    def handle_event(self, event=None) -> bool:
+        return self.owner.handle_unit_selection(self.unit_index)
+
+
 class UnitMenu(ScrollPanel):
     """ユニット一覧メニュー"""
     def __init__(self, x: int, y: int, width: int, height: int,
@@ -795,45 +1339,90 @@ class UnitMenu(ScrollPanel):
         self.on_unit_selected = on_unit_selected
         self.unit_height = 60  # 各ユニット表示の高さ
         
-        # フォントマネージャーは明示的に指定せず、親クラスのメソッドで自動的に使われる
+        # 行の作成ごとにフォントを引かないよう、使うフォントを先に取得しておく
+        self._title_font = get_font(28)
+        self._name_font = get_font(20)
+        self._small_font = get_font(16)
+        
+        # 行の背景と枠線の画像（色ごとに一度だけ作り、全行で共有）
+        self._row_chromes = {}
         
         self.setup_ui()
     
     def setup_ui(self):
         """UIのセットアップ"""
-        # タイトル - フォント指定なし（デフォルトでget_fontを使用）
-        title_label = Label(self.width // 2, 10, "ユニット一覧", None, 28, COLOR_WHITE, None, "center")
-        self.add_child(title_label)
+        # タイトル
+        self._title_label = Label(self.width // 2, 10, "ユニット一覧", self._title_font, 28, COLOR_WHITE, None, "center")
+        self.add_child(self._title_label)
         
-        # ユニットリスト
+        # ユニットごとの行（部品は使い回し、変化した値だけ更新する）
+        self._rows = {}
+        self._sync_rows()
+    
+    def _create_row(self, unit, index):
+        """ユニット1体分の行を作成"""
+        row = _UnitRow(self, index, 10, 40 + index * self.unit_height, self.width - 20, self.unit_height - 5,
+                       (60, 60, 60) if unit.team == 0 else (80, 40, 40))
+        row.chrome = self._get_row_chrome(row)
+        
+        # ユニット名とHP
+        row.name_label = Label(10, 5, unit.name, self._name_font, 20, COLOR_WHITE)
+        row.info_label = Label(10, 25, f"Lv {unit.level} {unit.unit_class}", self._small_font, 16, COLOR_WHITE)
+        
+        # HPバー
+        row.hp_bar = ProgressBar(100, 7, self.width - 150, 15, 
+                                 unit.current_hp, unit.max_hp, 
+                                 COLOR_GREEN, COLOR_GRAY, COLOR_BLACK, 1, True,
+                                 self._small_font, 16)
+        row.extend_children([row.name_label, row.info_label, row.hp_bar])
+        return row
+    
+    def _get_row_chrome(self, row):
+        """行の背景と枠線を描いた画像を取得（なければ作成）"""
+        key = (row.width, row.height, row.color, row.alpha, row.border_color, row.border_width)
+        chrome = self._row_chromes.get(key)
+        if chrome is None:
+            chrome = pygame.Surface((row.width, row.height), pygame.SRCALPHA)
+            chrome.fill((row.color[0], row.color[1], row.color[2], row.alpha))
+            if row.border_color:
+                pygame.draw.rect(chrome, row.border_color, (0, 0, row.width, row.height), row.border_width)
+            self._row_chromes[key] = chrome
+        return chrome
+    
+    def _sync_rows(self):
+        """ユニットリストと行を突き合わせ、増えた行・減った行だけを追加・削除する"""
+        old_rows = self._rows
+        rows = {}
+        added = []
         for i, unit in enumerate(self.units):
-            unit_panel = Panel(10, 40 + i * self.unit_height, self.width - 20, self.unit_height - 5,
-                            (60, 60, 60) if unit.team == 0 else (80, 40, 40))
-            
-            # ユニット名とHP - フォント指定なし
-            unit_panel.add_child(Label(10, 5, unit.name, None, 20, COLOR_WHITE))
-            unit_panel.add_child(Label(10, 25, f"Lv {unit.level} {unit.unit_class}", None, 16, COLOR_WHITE))
-            
-            # HPバー
-            hp_bar = ProgressBar(100, 7, self.width - 150, 15, 
-                                unit.current_hp, unit.max_hp, 
-                                COLOR_GREEN, COLOR_GRAY, COLOR_BLACK, 1, True,
-                                None, 16)  # フォント指定なし
-            unit_panel.add_child(hp_bar)
-            
-            # クリックハンドラ設定
-            unit_index = i  # クロージャのためにインデックスを保存
-            
-            def make_handler(idx):
-                # イベント引数を受け取るように修正
-                return lambda event=None: self.handle_unit_selection(idx)
-                    
-            unit_panel.handle_event = make_handler(unit_index)
+            row = old_rows.get(unit)
+            if row is None:
+                row = self._create_row(unit, i)
+                added.append(row)
+            else:
+                row.sync(unit)
+                if row.unit_index != i:
+                    row.unit_index = i
+                    row.set_position(10, 40 + i * self.unit_height)
+            rows[unit] = row
+        
+        self._rows = rows
+        
+        # 行は画面座標の部品を重ねて描くため、子要素の並びはユニットの並びと一致させる
+        if list(rows) != list(old_rows):
+            survivors = [row for unit, row in old_rows.items() if unit in rows]
+            removed = [row for unit, row in old_rows.items() if unit not in rows]
+            if survivors == list(rows.values())[:len(survivors)]:
+                # 削除と末尾への追加だけで済む場合は、その行だけを出し入れする
+                for row in removed:
+                    self.remove_child(row)
+                self.extend_children(added)
+            else:
+                self.clear_children()
+                self.extend_children([self._title_label] + list(rows.values()))
             
-            self.add_child(unit_panel)
-        
-        # コンテンツ高さの更新
-        self.update_content_height()
+            # コンテンツ高さの更新
+            self.update_content_height()
     
     def handle_unit_selection(self, index):
         """ユニットが選択されたときの処理"""
@@ -845,8 +1434,7 @@ class UnitMenu(ScrollPanel):
     def update_units(self, units):
         """ユニットリストを更新"""
         self.units = units
-        self.clear_children()
-        self.setup_ui()
+        self._sync_rows()
 
 class MapController:
     """マップコントロール（移動・攻撃などのマップ操作を担当）"""
@@ -855,61 +1443,89 @@ class MapController:
         self.ui_manager = ui_manager
         
         # 移動と攻撃の範囲を視覚的に表示するためのサーフェス
+        # 作成時の範囲の版数を覚えておき、変わった時だけ作り直す
         self.move_surface = None
         self.attack_surface = None
-        
-        # ユニット選択・移動など状態関連
+        self._move_version = -1
+        self._attack_version = -1
+        # サーフェスは範囲を囲む最小の大きさで作り、この位置に描画する
+        self._move_origin = (0, 0)
+        self._attack_origin = (0, 0)
+        
+        # 範囲表示用の1マス分のタイル（作成時にまとめて転送する）
+        self._move_tile = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
+        self._move_tile.fill((0, 0, 255, 128))
+        self._attack_tile = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
+        self._attack_tile.fill((255, 0, 0, 128))
+        
+        # ホバー位置のハイライト枠
+        self._hover_tile = _make_border_tile(COLOR_YELLOW, 2)
+        
+        # ユニット選択・移動など状態関連（ホバー位置はマウス移動イベントで更新）
         self.hover_x = -1
         self.hover_y = -1
+        self.on_mouse_move(pygame.mouse.get_pos())
+        
+        # マップの大きさ（毎フレームの範囲判定で参照を辿らないよう保持）
+        self.bind_map(game_manager.game_map)
     
-    def update(self):
-        """状態の更新"""
-        # マウス位置の更新
-        mouse_x, mouse_y = pygame.mouse.get_pos()
-        self.hover_x = mouse_x // GRID_SIZE
-        self.hover_y = mouse_y // GRID_SIZE
+    def bind_map(self, game_map):
+        """対象のマップを設定（マップが切り替わった時に呼ぶ）"""
+        self._map_cols = game_map.cols
+        self._map_rows = game_map.rows
+    
+    def on_mouse_move(self, pos):
+        """マウス位置からホバー中のマスを更新"""
+        self.hover_x = pos[0] // GRID_SIZE
+        self.hover_y = pos[1] // GRID_SIZE
     
     def render(self, screen):
         """マップコントロールの描画"""
         # 移動範囲の描画
-        if self.game_manager.phase == "move_unit" and self.game_manager.move_targets:
-            if not self.move_surface:
+        gm = self.game_manager
+        if gm.phase == "move_unit" and gm.move_targets:
+            if self._move_version != gm.move_targets_version:
                 self._create_move_surface()
-            screen.blit(self.move_surface, (0, 0))
-        else:
-            self.move_surface = None
+                self._move_version = gm.move_targets_version
+            screen.blit(self.move_surface, self._move_origin)
         
         # 攻撃範囲の描画
-        if self.game_manager.phase == "select_attack_target" and self.game_manager.attack_targets:
-            if not self.attack_surface:
+        if gm.phase == "select_attack_target" and gm.attack_targets:
+            if self._attack_version != gm.attack_targets_version:
                 self._create_attack_surface()
-            screen.blit(self.attack_surface, (0, 0))
-        else:
-            self.attack_surface = None
+                self._attack_version = gm.attack_targets_version
+            screen.blit(self.attack_surface, self._attack_origin)
         
         # ホバー位置のハイライト
         if self._is_valid_hover_position():
-            hover_rect = pygame.Rect(self.hover_x * GRID_SIZE, self.hover_y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-            pygame.draw.rect(screen, COLOR_YELLOW, hover_rect, 2)
+            screen.blit(self._hover_tile, (self.hover_x * GRID_SIZE, self.hover_y * GRID_SIZE))
+    
+    def _create_range_surface(self, targets, tile):
+        """範囲表示用のサーフェスを作成（範囲を囲む大きさのみ確保）"""
+        # 座標を列ごとに分け、最小・最大はCレベルの組み込み関数で求める
+        xs, ys = zip(*targets)
+        min_x, max_x = min(xs), max(xs)
+        min_y, max_y = min(ys), max(ys)
+        surface = pygame.Surface(((max_x - min_x + 1) * GRID_SIZE, (max_y - min_y + 1) * GRID_SIZE),
+                                 pygame.SRCALPHA)
+        # 透明なサーフェスへMAX合成で転送し、タイルの色をそのまま書き込む
+        _blit_batch(surface, [(tile, ((x - min_x) * GRID_SIZE, (y - min_y) * GRID_SIZE))
+                              for x, y in targets], pygame.BLEND_RGBA_MAX)
+        return surface, (min_x * GRID_SIZE, min_y * GRID_SIZE)
     
     def _create_move_surface(self):
         """移動範囲表示用のサーフェスを作成"""
-        self.move_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for x, y in self.game_manager.move_targets:
-            rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-            pygame.draw.rect(self.move_surface, (0, 0, 255, 128), rect)
+        self.move_surface, self._move_origin = self._create_range_surface(
+            self.game_manager.move_targets, self._move_tile)
     
     def _create_attack_surface(self):
         """攻撃範囲表示用のサーフェスを作成"""
-        self.attack_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for x, y in self.game_manager.attack_targets:
-            rect = pygame.Rect(x * GRID_SIZE, y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-            pygame.draw.rect(self.attack_surface, (255, 0, 0, 128), rect)
+        self.attack_surface, self._attack_origin = self._create_range_surface(
+            self.game_manager.attack_targets, self._attack_tile)
     
     def _is_valid_hover_position(self):
         """現在のホバー位置が有効かどうかをチェック"""
-        return (0 <= self.hover_x < self.game_manager.game_map.cols and 
-                0 <= self.hover_y < self.game_manager.game_map.rows)
+        return 0 <= self.hover_x < self._map_cols and 0 <= self.hover_y < self._map_rows
     
     def handle_click(self, x, y):
         """マップ上のクリックを処理"""
@@ -948,6 +1564,14 @@ class MapController:
 
 class UIManager:
     """UI管理クラス（ゲーム全体のUI要素を管理）"""
+    # フェーズ表示のテキスト
+    PHASE_TEXTS = {
+        "select_unit": "ユニット選択",
+        "move_unit": "移動先選択",
+        "select_action": "行動選択",
+        "select_attack_target": "攻撃対象選択"
+    }
+    
     def __init__(self, screen, game_manager):
         self.screen = screen
         self.game_manager = game_manager
@@ -961,9 +1585,16 @@ class UIManager:
         # UI要素
         self.ui_elements = []
         
+        # ターン・フェーズ表示に最後に反映した値
+        self._last_turn_key = None
+        self._last_phase = None
+        
         # マップコントローラー
         self.map_controller = MapController(game_manager, self)
         
+        # 選択中ユニットのハイライト枠
+        self._select_tile = _make_border_tile(COLOR_YELLOW, 3)
+        
         # UI要素の初期化
         self._init_ui()
     
@@ -1013,6 +1644,7 @@ class UIManager:
         unit_list.visible = False
         self.ui_elements.append(unit_list)
         self.unit_list = unit_list
+        self._unit_list_version = -1  # 一覧に反映済みのユニット版数
         
         # エンドターンボタン - フォント指定なし（デフォルトでget_fontを使用）
         end_turn_btn = Button(SCREEN_WIDTH - 110, SCREEN_HEIGHT - 40, 100, 30, "ターン終了", None, 20,
@@ -1025,31 +1657,34 @@ class UIManager:
         battle_log.visible = False
         self.ui_elements.append(battle_log)
         self.battle_log = battle_log
+        
+        # update()を持つ要素だけを毎フレーム更新の対象にする（ボタンなどは何もしないため）
+        self._updatable_elements = [element for element in self.ui_elements
+                                    if type(element).update is not UIElement.update]
     
     def update(self):
         """状態の更新"""
-        # ターン表示の更新
-        self.turn_label.set_text(f"ターン {self.game_manager.current_turn+1} - {'プレイヤー' if self.game_manager.turn_player == 0 else '敵'}")
+        gm = self.game_manager
+        
+        # ターン表示の更新（ターンか手番が変わった時だけ文字列を作る）
+        turn_key = (gm.current_turn, gm.turn_player)
+        if turn_key != self._last_turn_key:
+            self._last_turn_key = turn_key
+            self.turn_label.set_text(f"ターン {gm.current_turn+1} - {'プレイヤー' if gm.turn_player == 0 else '敵'}")
         
         # フェーズ表示の更新
-        phase_texts = {
-            "select_unit": "ユニット選択",
-            "move_unit": "移動先選択",
-            "select_action": "行動選択",
-            "select_attack_target": "攻撃対象選択"
-        }
-        self.phase_label.set_text(phase_texts.get(self.game_manager.phase, ""))
+        if gm.phase != self._last_phase:
+            self._last_phase = gm.phase
+            self.phase_label.set_text(self.PHASE_TEXTS.get(gm.phase, ""))
         
         # ユニット一覧の更新（表示中の場合）
-        if self.unit_list.visible:
-            self.unit_list.update_units(self.game_manager.game_map.units)
-        
-        # マップコントローラーの更新
-        self.map_controller.update()
+        if self.unit_list.visible and self._unit_list_version != self.game_manager.game_map.units_version:
+            self._refresh_unit_list()
         
-        # 各UI要素の更新
-        for element in self.ui_elements:
-            element.update()
+        # 各UI要素の更新（非表示の要素は更新しない）
+        for element in self._updatable_elements:
+            if element.visible:
+                element.update()
     
     def render(self):
         """UI要素の描画"""
@@ -1059,8 +1694,7 @@ class UIManager:
         # 選択中のユニットを強調表示
         if self.game_manager.selected_unit:
             unit = self.game_manager.selected_unit
-            rect = pygame.Rect(unit.x * GRID_SIZE, unit.y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
-            pygame.draw.rect(self.screen, COLOR_YELLOW, rect, 3)
+            self.screen.blit(self._select_tile, (unit.x * GRID_SIZE, unit.y * GRID_SIZE))
         
         # UI要素の描画
         for element in self.ui_elements:
@@ -1080,9 +1714,19 @@ class UIManager:
     
     def handle_event(self, event):
         """イベント処理"""
-        # UI要素のイベント処理
+        # ホバー位置はマウス移動時だけ更新（UIが処理する移動でもマップ側は追従させる）
+        event_type = event.type
+        if event_type == pygame.MOUSEMOTION:
+            self.map_controller.on_mouse_move(event.pos)
+        
+        # UI要素のイベント処理（非表示の要素とその種類のイベントを処理しない要素は呼ばない）
         for element in reversed(self.ui_elements):  # 前面の要素から処理
-            if element.visible and element.active and element.handle_event(event):
+            if not element.visible or not element.active:
+                continue
+            interested = element.INTERESTED_EVENTS
+            if interested is not None and event_type not in interested:
+                continue
+            if element.handle_event(event):
                 return True
         
         # UIで処理されなかった場合、マップ上のクリックとして処理
@@ -1121,9 +1765,15 @@ class UIManager:
         if self.unit_list.visible:
             self.unit_list.visible = False
         else:
-            self.unit_list.update_units(self.game_manager.game_map.units)
+            self._refresh_unit_list()
             self.unit_list.visible = True
     
+    def _refresh_unit_list(self):
+        """ユニット一覧を現在のユニットで更新"""
+        game_map = self.game_manager.game_map
+        self.unit_list.update_units(game_map.units)
+        self._unit_list_version = game_map.units_version
+    
     def on_unit_list_selection(self, unit):
         """ユニット一覧からユニットが選択されたときの処理"""
         # マップ上の該当ユニットにカメラを移動する処理などを実装可能
@@ -1,18 +1,74 @@
 # unit.py
 from typing import List, Dict, Optional
-from constants import WeaponType
+from constants import WeaponType, GRID_SIZE, COLOR_GREEN, COLOR_YELLOW, COLOR_RED
 from weapon import Weapon
 from skills import SkillTriggerType
 from movement_system import MovementType  # 新たにインポート
 
+# 職業名に含まれるキーワードと移動タイプの対応（上から順に判定）
+_MOVEMENT_KEYWORDS = (
+    (("ペガサス", "pegasus", "飛行", "falcon"), MovementType.FLYING),
+    (("アーマー", "armor", "重騎士", "general"), MovementType.ARMORED),
+    (("騎馬", "paladin", "cavalier", "ソシアル"), MovementType.CAVALRY),
+    (("忍者", "ninja", "シーフ", "thief"), MovementType.NINJA),
+    (("魔道", "mage", "sage", "魔法"), MovementType.MAGE),
+    (("山賊", "斧", "berserker"), MovementType.MOUNTAIN),
+    (("海賊", "sailor", "海"), MovementType.AQUATIC),
+    (("森", "猟兵", "ranger"), MovementType.FOREST),
+    (("砂漠", "desert"), MovementType.DESERT),
+    (("幽霊", "ghost", "亡霊"), MovementType.GHOST),
+)
+
+# 職業名（小文字）ごとの判定結果
+_MOVEMENT_TYPE_CACHE = {}
+
+# 体格の基本値（職業によって異なる）
+_BASE_BUILD = {
+    "ロード": 5,
+    "ソードマスター": 7,
+    "ヒーロー": 8,
+    "戦士": 9,
+    "傭兵": 6,
+    "アーマー": 13,
+    "ナイト": 11,
+    "ペガサスナイト": 5,
+    "ワイバーンナイト": 9,
+    "ソシアルナイト": 8,
+    "魔道士": 5,
+    "僧侶": 5,
+    "シーフ": 6
+}
+
+
+def _classify_movement_type(class_name):
+    """職業名から移動タイプを判定（該当なしは歩兵）"""
+    for keywords, movement_type in _MOVEMENT_KEYWORDS:
+        for keyword in keywords:
+            if keyword in class_name:
+                return movement_type
+    return MovementType.INFANTRY
+
+
 class Unit:
+    # 後から設定される属性（exp, race など）も含めて宣言しておく
+    __slots__ = (
+        "name", "unit_class", "level", "_max_hp", "_current_hp", "hp_color", "hp_bar_width",
+        "strength", "magic", "skill", "speed", "luck", "defense", "resistance", "movement",
+        "team", "weapons", "equipped_weapon", "x", "y", "has_moved", "has_attacked", "is_hero",
+        "movement_type", "skills", "temp_stat_modifiers", "active_skills",
+        "build", "is_mounted", "is_flying", "is_important", "rescuing", "rescued_by",
+        "has_item_box_access", "ai_role",
+        "exp", "death_status", "race", "faction", "alignment", "growth_rates", "is_support",
+    )
+    
     def __init__(self, name, unit_class, level, hp, strength, magic, skill, 
                  speed, luck, defense, resistance, movement, team, weapons=None, movement_type=MovementType.INFANTRY):  # 移動タイプを引数に追加):
         self.name = name
         self.unit_class = unit_class
         self.level = level
-        self.max_hp = hp
-        self.current_hp = hp
+        self._max_hp = hp
+        self._current_hp = hp
+        self._update_hp_bar()
         self.strength = strength
         self.magic = magic
         self.skill = skill
@@ -31,7 +87,7 @@ class Unit:
         self.is_hero = False
         
         # 移動タイプを設定 - 新規追加
-        self.movement_type = movement_type
+        self.movement_type = movement_type or MovementType.INFANTRY
         self._determine_movement_type_from_class()  # クラスに基づいて自動設定
 
         # スキル関連のフィールド
@@ -61,60 +117,69 @@ class Unit:
         # AIの役割（敵ユニット用）
         self.ai_role = None  # "attacker", "defender", "healer", "support", "assassin", "tank"
 
+    @property
+    def max_hp(self):
+        return self._max_hp
+    
+    @max_hp.setter
+    def max_hp(self, value):
+        self._max_hp = value
+        self._update_hp_bar()
+    
+    @property
+    def current_hp(self):
+        return self._current_hp
+    
+    @current_hp.setter
+    def current_hp(self, value):
+        self._current_hp = value
+        self._update_hp_bar()
+    
+    def _update_hp_bar(self):
+        """HPバーの色と幅を更新（HP変化時のみ計算）"""
+        hp_ratio = self._current_hp / self._max_hp if self._max_hp > 0 else 0
+        self.hp_color = COLOR_GREEN if hp_ratio > 0.5 else COLOR_YELLOW if hp_ratio > 0.25 else COLOR_RED
+        self.hp_bar_width = max(0, int(GRID_SIZE * hp_ratio))
+    
     def _determine_movement_type_from_class(self):
         """ユニットクラスに基づいて移動タイプを自動設定"""
-        # 職業名から移動タイプを推測
+        # 職業名から移動タイプを推測（同じ職業名は前回の結果を使う）
         class_name = self.unit_class.lower() if self.unit_class else ""
-        
-        # 自動判定ロジック
-        if "ペガサス" in class_name or "pegasus" in class_name or "飛行" in class_name or "falcon" in class_name:
-            self.movement_type = MovementType.FLYING
-        elif "アーマー" in class_name or "armor" in class_name or "重騎士" in class_name or "general" in class_name:
-            self.movement_type = MovementType.ARMORED
-        elif "騎馬" in class_name or "paladin" in class_name or "cavalier" in class_name or "ソシアル" in class_name:
-            self.movement_type = MovementType.CAVALRY
-        elif "忍者" in class_name or "ninja" in class_name or "シーフ" in class_name or "thief" in class_name:
-            self.movement_type = MovementType.NINJA
-        elif "魔道" in class_name or "mage" in class_name or "sage" in class_name or "魔法" in class_name:
-            self.movement_type = MovementType.MAGE
-        elif "山賊" in class_name or "斧" in class_name or "berserker" in class_name:
-            self.movement_type = MovementType.MOUNTAIN
-        elif "海賊" in class_name or "sailor" in class_name or "海" in class_name:
-            self.movement_type = MovementType.AQUATIC
-        elif "森" in class_name or "猟兵" in class_name or "ranger" in class_name:
-            self.movement_type = MovementType.FOREST
-        elif "砂漠" in class_name or "desert" in class_name:
-            self.movement_type = MovementType.DESERT
-        elif "幽霊" in class_name or "ghost" in class_name or "亡霊" in class_name:
-            self.movement_type = MovementType.GHOST
-        else:
-            # デフォルトは歩兵
-            self.movement_type = MovementType.INFANTRY
+        movement_type = _MOVEMENT_TYPE_CACHE.get(class_name)
+        if movement_type is None:
+            movement_type = _classify_movement_type(class_name)
+            _MOVEMENT_TYPE_CACHE[class_name] = movement_type
+        self.movement_type = movement_type
 
     def get_attack_power(self) -> int:
-        if not self.equipped_weapon:
+        weapon = self.equipped_weapon
+        if not weapon:
             return 0
-        if self.equipped_weapon.weapon_type == WeaponType.MAGIC:
-            return self.magic + self.equipped_weapon.might
-        return self.strength + self.equipped_weapon.might
+        if weapon.weapon_type == WeaponType.MAGIC:
+            return self.magic + weapon.might
+        return self.strength + weapon.might
 
     def get_hit_rate(self) -> int:
-        if not self.equipped_weapon:
+        weapon = self.equipped_weapon
+        if not weapon:
             return 0
-        return self.equipped_weapon.hit + (self.skill * 2) + (self.luck // 2)
+        return weapon.hit + (self.skill * 2) + (self.luck // 2)
 
     def get_avoid(self) -> int:
         return (self.speed * 2) + self.luck
 
     def get_critical_rate(self) -> int:
-        if not self.equipped_weapon:
+        weapon = self.equipped_weapon
+        if not weapon:
             return 0
-        return self.equipped_weapon.crit + (self.skill // 2)
+        return weapon.crit + (self.skill // 2)
 
     def get_attack_speed(self) -> int:
-        if not self.equipped_weapon:
-            return self.speed
-        return max(0, self.speed - max(0, self.equipped_weapon.weight - (self.strength // 5)))
+        weapon = self.equipped_weapon
+        speed = self.speed
+        if not weapon:
+            return speed
+        return max(0, speed - max(0, weapon.weight - (self.strength // 5)))
     
     def can_double_attack(self, target) -> bool:
         return self.get_attack_speed() >= target.get_attack_speed() + 4
@@ -157,25 +222,8 @@ class Unit:
     
     def _calculate_build(self):
         """ユニットの体格を計算（救出判定用）"""
-        # 体格の基本値（職業によって異なる）
-        base_build = {
-            "ロード": 5,
-            "ソードマスター": 7,
-            "ヒーロー": 8,
-            "戦士": 9,
-            "傭兵": 6,
-            "アーマー": 13,
-            "ナイト": 11,
-            "ペガサスナイト": 5,
-            "ワイバーンナイト": 9,
-            "ソシアルナイト": 8,
-            "魔道士": 5,
-            "僧侶": 5,
-            "シーフ": 6
-        }
-        
         # 基本値 + (力 / 5) を体格とする
-        class_build = base_build.get(self.unit_class, 7)  # デフォルト値は7
+        class_build = _BASE_BUILD.get(self.unit_class, 7)  # デフォルト値は7
         return class_build + (self.strength // 5)
     
     def can_rescue(self, target):
@@ -2,6 +2,13 @@
 from constants import WeaponType
 
 class Weapon:
+    # 装備できるユニットが限られる武器（can_equipを持つ）かどうか
+    HAS_EQUIP_CHECK = False
+    
+    # priceはショップ価格として後から設定される
+    __slots__ = ("name", "weapon_type", "might", "hit", "crit", "weight",
+                 "range_min", "range_max", "durability", "max_durability", "price")
+    
     def __init__(self, name, weapon_type, might, hit, crit, weight, range_min, range_max, durability):
         self.name = name
         self.weapon_type = weapon_type
@@ -1,13 +1,36 @@
 # weapon_shop.py
 import pygame
-from ui_system import Panel, Label, Button, ScrollPanel
+from ui_system import Panel, Label, Button, VirtualScrollPanel
+from font_manager import get_font
 
 class WeaponShop(Panel):
+    # リストの1行分の高さ（行の間隔を含む）
+    WEAPON_ROW_HEIGHT = 70
+    UNIT_ROW_HEIGHT = 60
+    
+    # 詳細パネルの武器情報（表示形式, フォントサイズ, 色）。上から20ピクセル間隔で並べる
+    DETAIL_FIELDS = (
+        ("名前: {0.name}", 18, (255, 255, 255)),
+        ("種類: {0.weapon_type.name}", 16, (200, 200, 200)),
+        ("威力: {0.might}", 16, (200, 200, 200)),
+        ("命中: {0.hit}", 16, (200, 200, 200)),
+        ("必殺: {0.crit}", 16, (200, 200, 200)),
+        ("重さ: {0.weight}", 16, (200, 200, 200)),
+        ("射程: {0.range_min}-{0.range_max}", 16, (200, 200, 200)),
+        ("価格: {0.price}G", 16, (255, 255, 0)),
+    )
+    
+    # 現在の装備との差の色（差の符号 + 1 で引く：下がる・同じ・上がる）
+    DIFF_COLORS = ((255, 100, 100), (200, 200, 200), (100, 255, 100))
+    
     def __init__(self, x, y, width, height, game_manager, on_close=None):
         super().__init__(x, y, width, height)
         self.game_manager = game_manager
         self.on_close = on_close
         self.inventory = []  # 販売アイテムリスト
+        
+        # 行や詳細の作成ごとにフォントを引かないよう、使うフォントを先に取得しておく
+        self._fonts = {size: get_font(size) for size in (16, 18, 20)}
         self.selected_weapon = None
         self.selected_unit = None
         
@@ -20,13 +43,22 @@ class WeaponShop(Panel):
         self.add_child(gold_label)
         self.gold_label = gold_label
         
-        # 武器リスト（左側）
-        weapons_panel = ScrollPanel(20, 70, width // 2 - 30, height - 150, height, (40, 40, 50), (0, 0, 0), 1, 220)
+        # 武器とユニットのリストの行（行番号ごとに作り、表示範囲に入った時に使い回す）
+        self._weapon_rows = {}
+        self._unit_rows = {}
+        self._listed_inventory = None  # 行の文字を作った時の販売リスト
+        self._shop_units = ()
+        self._shop_units_version = None  # 味方一覧を取得した時のgame_map.units_version
+        
+        # 武器リスト（左側、表示範囲の行だけを生成）
+        weapons_panel = VirtualScrollPanel(20, 70, width // 2 - 30, height - 150, 0, self.WEAPON_ROW_HEIGHT,
+                                           self._build_weapon_row, (40, 40, 50), (0, 0, 0), 1, 220)
         self.add_child(weapons_panel)
         self.weapons_panel = weapons_panel
         
-        # ユニットリスト（右上）
-        units_panel = ScrollPanel(width // 2 + 10, 70, width // 2 - 30, height // 2 - 40, height, (40, 40, 50), (0, 0, 0), 1, 220)
+        # ユニットリスト（右上、表示範囲の行だけを生成）
+        units_panel = VirtualScrollPanel(width // 2 + 10, 70, width // 2 - 30, height // 2 - 40, 0, self.UNIT_ROW_HEIGHT,
+                                         self._build_unit_row, (40, 40, 50), (0, 0, 0), 1, 220)
         self.add_child(units_panel)
         self.units_panel = units_panel
         
@@ -34,6 +66,7 @@ class WeaponShop(Panel):
         details_panel = Panel(width // 2 + 10, height // 2 + 40, width // 2 - 30, height // 2 - 110, (40, 40, 50), (0, 0, 0), 1, 220)
         self.add_child(details_panel)
         self.details_panel = details_panel
+        self._create_details()
         
         # ボタン類
         buy_btn = Button(width // 4 - 50, height - 60, 100, 40, "購入", None, 24,
@@ -60,70 +93,120 @@ class WeaponShop(Panel):
         # ボタンの初期状態
         self.buy_btn.set_active(False)
         self.equip_btn.set_active(False)
+        
+        # ショップ全体は一枚の画像にまとめて描画（選択・購入・ホバー・スクロールなどで見た目が変わった時のみ再描画）
+        self.render_to_cache()
     
-    def update_weapon_list(self):
-        """販売武器リストを更新"""
-        self.weapons_panel.clear_children()
+    def update_weapon_list(self, reload=False):
+        """販売武器リストを更新（表示範囲の行だけを作り直す）"""
+        # 販売武器のデータ取得（実際はゲームマネージャーから取得。品揃えは開店時か再読み込み時のみ取得）
+        if reload or not self.inventory:
+            self.inventory = self.game_manager.get_shop_weapons()
         
-        # 販売武器のデータ取得（実際はゲームマネージャーから取得）
-        self.inventory = self.game_manager.get_shop_weapons()
+        # 品揃えが前回と同じなら行の文字も同じなので作り直さない（販売中の武器は変化しない）
+        if self.inventory is self._listed_inventory:
+            return
+        self._listed_inventory = self.inventory
         
-        for i, weapon in enumerate(self.inventory):
-            weapon_panel = Panel(10, i * 70 + 10, self.weapons_panel.width - 30, 60, (50, 50, 60), (0, 0, 0), 1, 255)
-            
-            # 武器名
-            weapon_panel.add_child(Label(10, 10, weapon.name, None, 20, (255, 255, 255)))
-            
-            # 武器性能
-            stats_text = f"威力:{weapon.might} 命中:{weapon.hit} 重さ:{weapon.weight}"
-            weapon_panel.add_child(Label(10, 35, stats_text, None, 16, (200, 200, 200)))
-            
-            # 価格
-            price_text = f"{weapon.price}G"
-            weapon_panel.add_child(Label(weapon_panel.width - 70, 10, price_text, None, 18, (255, 255, 0), None, "right"))
-            
-            # クリックハンドラを設定
-            weapon_index = i
-            
-            def make_handler(idx):
-                return lambda: self.select_weapon(self.inventory[idx])
-            
-            weapon_panel.handle_event = make_handler(weapon_index)
-            
-            self.weapons_panel.add_child(weapon_panel)
+        self.weapons_panel.set_item_count(len(self.inventory))
+    
+    def _build_weapon_row(self, i, row_y):
+        """表示範囲に入った武器リストの行を用意（行は番号ごとに使い回し、変わった文字だけ描き直す）"""
+        weapon_panel = self._weapon_rows.get(i)
+        if weapon_panel is None:
+            weapon_panel = self._create_weapon_row()
+            self._weapon_rows[i] = weapon_panel
+        weapon_panel.set_position(10, row_y + 10)
         
-        # コンテンツ高さを更新
-        self.weapons_panel.update_content_height()
+        weapon = self.inventory[i]
+        weapon_panel.name_label.set_text(weapon.name)
+        weapon_panel.stats_label.set_text(f"威力:{weapon.might} 命中:{weapon.hit} 重さ:{weapon.weight}")
+        weapon_panel.price_label.set_text(f"{weapon.price}G")
+        return weapon_panel
+    
+    def _create_weapon_row(self):
+        """武器リストの1行を作成"""
+        weapon_panel = Panel(10, 10, self.weapons_panel.width - 30, self.WEAPON_ROW_HEIGHT - 10, (50, 50, 60), (0, 0, 0), 1, 255)
+        
+        # 武器名・武器性能・価格
+        weapon_panel.name_label = Label(10, 10, "", self._fonts[20], 20, (255, 255, 255))
+        weapon_panel.stats_label = Label(10, 35, "", self._fonts[16], 16, (200, 200, 200))
+        weapon_panel.price_label = Label(weapon_panel.width - 70, 10, "", self._fonts[18], 18, (255, 255, 0), None, "right")
+        weapon_panel.extend_children([weapon_panel.name_label, weapon_panel.stats_label, weapon_panel.price_label])
+        return weapon_panel
     
     def update_unit_list(self):
-        """ユニットリストを更新"""
-        self.units_panel.clear_children()
+        """ユニットリストを更新（表示範囲の行だけを作り直す）"""
+        # プレイヤーユニットの取得（ユニットの増減がなければ前回の一覧を使う）
+        game_map = self.game_manager.game_map
+        if self._shop_units_version != game_map.units_version:
+            self._shop_units = tuple(unit for unit in game_map.units if unit.team == 0)
+            self._shop_units_version = game_map.units_version
         
-        # プレイヤーユニットの取得
-        units = [unit for unit in self.game_manager.game_map.units if unit.team == 0]
+        # 装備の変更も反映するため、行数が同じでも表示中の行は作り直す
+        self.units_panel.set_item_count(len(self._shop_units))
+    
+    def _build_unit_row(self, i, row_y):
+        """表示範囲に入ったユニットリストの行を用意（行は番号ごとに使い回し、変わった文字だけ描き直す）"""
+        unit_panel = self._unit_rows.get(i)
+        if unit_panel is None:
+            unit_panel = self._create_unit_row()
+            self._unit_rows[i] = unit_panel
+        unit_panel.set_position(10, row_y + 10)
         
-        for i, unit in enumerate(units):
-            unit_panel = Panel(10, i * 60 + 10, self.units_panel.width - 30, 50, (50, 50, 60), (0, 0, 0), 1, 255)
-            
-            # ユニット名と職業
-            unit_panel.add_child(Label(10, 10, f"{unit.name} (Lv.{unit.level} {unit.unit_class})", None, 18, (255, 255, 255)))
-            
-            # 装備中の武器
-            equipped_text = f"装備: {unit.equipped_weapon.name if unit.equipped_weapon else '無し'}"
-            unit_panel.add_child(Label(10, 30, equipped_text, None, 16, (200, 200, 200)))
-            
-            # クリックハンドラを設定
-            unit_index = i
-            
-            def make_handler(idx):
-                return lambda: self.select_unit(units[idx])
-            
-            unit_panel.handle_event = make_handler(unit_index)
-            
-            self.units_panel.add_child(unit_panel)
+        # ユニット名と職業、装備中の武器
+        unit = self._shop_units[i]
+        unit_panel.name_label.set_text(f"{unit.name} (Lv.{unit.level} {unit.unit_class})")
+        unit_panel.equipped_label.set_text(f"装備: {unit.equipped_weapon.name if unit.equipped_weapon else '無し'}")
+        return unit_panel
+    
+    def _create_unit_row(self):
+        """ユニットリストの1行を作成"""
+        unit_panel = Panel(10, 10, self.units_panel.width - 30, self.UNIT_ROW_HEIGHT - 10, (50, 50, 60), (0, 0, 0), 1, 255)
+        
+        unit_panel.name_label = Label(10, 10, "", self._fonts[18], 18, (255, 255, 255))
+        unit_panel.equipped_label = Label(10, 30, "", self._fonts[16], 16, (200, 200, 200))
+        unit_panel.extend_children([unit_panel.name_label, unit_panel.equipped_label])
+        return unit_panel
+    
+    def handle_event(self, event) -> bool:
+        """イベントを処理（リストの行のクリックはここで位置から行を求めて振り分ける）"""
+        if super().handle_event(event):
+            return True
+        
+        if (event.type == pygame.MOUSEBUTTONDOWN and event.button == 1
+                and self.visible and self.active):
+            return self._dispatch_click(event.pos)
+        return False
+    
+    def _dispatch_click(self, pos) -> bool:
+        """クリック位置の行の武器・ユニットを選択"""
+        idx = self._row_index_at(self.weapons_panel, pos, self.WEAPON_ROW_HEIGHT, len(self.inventory))
+        if idx is not None:
+            self.select_weapon(self.inventory[idx])
+            return True
         
-        # コンテンツ高さを更新
-        self.units_panel.update_content_height()
+        idx = self._row_index_at(self.units_panel, pos, self.UNIT_ROW_HEIGHT, len(self._shop_units))
+        if idx is not None:
+            self.select_unit(self._shop_units[idx])
+            return True
+        return False
+    
+    @staticmethod
+    def _row_index_at(panel, pos, row_height, row_count):
+        """リストパネル内の位置にある行番号を取得（行の間の余白やスクロールバー上ならNone）"""
+        if not panel.contains_point(*pos):
+            return None
+        
+        # 行はパネル内の (10, 行番号 * 行の高さ + 10) から (幅 - 30, 行の高さ - 10) の大きさで並ぶ
+        x = pos[0] - panel.x - 10
+        y = pos[1] - panel.y + int(panel.scroll_y) - 10
+        if not 0 <= x < panel.width - 30 or y < 0:
+            return None
+        idx, offset = divmod(y, row_height)
+        if idx >= row_count or offset >= row_height - 10:
+            return None
+        return idx
     
     def select_weapon(self, weapon):
         """武器を選択"""
@@ -144,7 +227,30 @@ class WeaponShop(Panel):
         # 装備ボタンの有効化（ユニットと武器の両方が選択されている場合）
         self.equip_btn.set_active(self.selected_weapon is not None)
     
-    # weapon_shop.py の続き
+    def _create_details(self):
+        """詳細パネルの部品を作成（選択のたびに作り直さず、文字だけ差し替えて使い回す）"""
+        # 武器詳細
+        self._weapon_detail_labels = [
+            Label(10, 10 + i * 20, "", self._fonts[font_size], font_size, color)
+            for i, (_, font_size, color) in enumerate(self.DETAIL_FIELDS)
+        ]
+        
+        # 選択中のユニットとの相性（背景枠）
+        self._compatibility_panel = Panel(self.details_panel.width // 2, 10, self.details_panel.width // 2 - 20, 160, (60, 60, 70), (0, 0, 0), 1, 200)
+        
+        # ユニット名・装備可否
+        self._compat_name_label = Label(10, 10, "", self._fonts[18], 18, (255, 255, 255))
+        self._compat_equip_label = Label(10, 30, "", self._fonts[16], 16, (100, 255, 100))
+        
+        # 現在の装備との比較
+        self._compat_current_labels = [
+            Label(10, 50, "現在装備中:", self._fonts[16], 16, (200, 200, 200)),
+            Label(10, 70, "", self._fonts[16], 16, (180, 180, 230)),
+            Label(10, 90, "", self._fonts[16], 16, (200, 200, 200)),
+            Label(10, 110, "", self._fonts[16], 16, (200, 200, 200)),
+            Label(10, 130, "", self._fonts[16], 16, (200, 200, 200)),
+        ]
+    
     def update_details(self):
         """詳細パネルを更新"""
         self.details_panel.clear_children()
@@ -153,54 +259,47 @@ class WeaponShop(Panel):
             return
         
         # 武器詳細
-        self.details_panel.add_child(Label(10, 10, f"名前: {self.selected_weapon.name}", None, 18, (255, 255, 255)))
-        self.details_panel.add_child(Label(10, 30, f"種類: {self.selected_weapon.weapon_type.name}", None, 16, (200, 200, 200)))
-        self.details_panel.add_child(Label(10, 50, f"威力: {self.selected_weapon.might}", None, 16, (200, 200, 200)))
-        self.details_panel.add_child(Label(10, 70, f"命中: {self.selected_weapon.hit}", None, 16, (200, 200, 200)))
-        self.details_panel.add_child(Label(10, 90, f"必殺: {self.selected_weapon.crit}", None, 16, (200, 200, 200)))
-        self.details_panel.add_child(Label(10, 110, f"重さ: {self.selected_weapon.weight}", None, 16, (200, 200, 200)))
-        self.details_panel.add_child(Label(10, 130, f"射程: {self.selected_weapon.range_min}-{self.selected_weapon.range_max}", None, 16, (200, 200, 200)))
-        self.details_panel.add_child(Label(10, 150, f"価格: {self.selected_weapon.price}G", None, 16, (255, 255, 0)))
+        weapon = self.selected_weapon
+        labels = self._weapon_detail_labels
+        for label, (template, _, _) in zip(labels, self.DETAIL_FIELDS):
+            label.set_text(template.format(weapon))
+        self.details_panel.extend_children(labels)
         
         # 選択中のユニットとの相性を表示
         if self.selected_unit:
-            # 背景枠
-            compatibility_panel = Panel(self.details_panel.width // 2, 10, self.details_panel.width // 2 - 20, 160, (60, 60, 70), (0, 0, 0), 1, 200)
+            compatibility_panel = self._compatibility_panel
+            compatibility_panel.clear_children()
             self.details_panel.add_child(compatibility_panel)
             
             # ユニット名
-            compatibility_panel.add_child(Label(10, 10, self.selected_unit.name, None, 18, (255, 255, 255)))
+            self._compat_name_label.set_text(self.selected_unit.name)
             
             # 武器との相性チェック
             can_equip = True  # デフォルトでは装備可能
             
             # レジェンダリー武器の場合は特別なチェック
-            if hasattr(self.selected_weapon, 'can_equip'):
-                can_equip = self.selected_weapon.can_equip(self.selected_unit)
+            if weapon.HAS_EQUIP_CHECK:
+                can_equip = weapon.can_equip(self.selected_unit)
             
             # 装備可能かどうかを表示
-            equip_text = "装備可能" if can_equip else "装備不可"
-            equip_color = (100, 255, 100) if can_equip else (255, 100, 100)
-            compatibility_panel.add_child(Label(10, 30, equip_text, None, 16, equip_color))
+            self._compat_equip_label.set_text("装備可能" if can_equip else "装備不可")
+            self._compat_equip_label.color = (100, 255, 100) if can_equip else (255, 100, 100)
+            compatibility_panel.extend_children([self._compat_name_label, self._compat_equip_label])
             
             # 現在の装備と比較
             if self.selected_unit.equipped_weapon:
                 current = self.selected_unit.equipped_weapon
-                compatibility_panel.add_child(Label(10, 50, "現在装備中:", None, 16, (200, 200, 200)))
-                compatibility_panel.add_child(Label(10, 70, current.name, None, 16, (180, 180, 230)))
+                current_labels = self._compat_current_labels
+                current_labels[1].set_text(current.name)
                 
                 # 簡易ステータス比較
-                might_diff = self.selected_weapon.might - current.might
-                hit_diff = self.selected_weapon.hit - current.hit
-                crit_diff = self.selected_weapon.crit - current.crit
-                
-                might_color = (100, 255, 100) if might_diff > 0 else (255, 100, 100) if might_diff < 0 else (200, 200, 200)
-                hit_color = (100, 255, 100) if hit_diff > 0 else (255, 100, 100) if hit_diff < 0 else (200, 200, 200)
-                crit_color = (100, 255, 100) if crit_diff > 0 else (255, 100, 100) if crit_diff < 0 else (200, 200, 200)
-                
-                compatibility_panel.add_child(Label(10, 90, f"威力: {might_diff:+d}", None, 16, might_color))
-                compatibility_panel.add_child(Label(10, 110, f"命中: {hit_diff:+d}", None, 16, hit_color))
-                compatibility_panel.add_child(Label(10, 130, f"必殺: {crit_diff:+d}", None, 16, crit_color))
+                diffs = (("威力", weapon.might - current.might),
+                         ("命中", weapon.hit - current.hit),
+                         ("必殺", weapon.crit - current.crit))
+                for label, (stat_name, diff) in zip(current_labels[2:], diffs):
+                    label.set_text(f"{stat_name}: {diff:+d}")
+                    label.color = self.DIFF_COLORS[(diff > 0) - (diff < 0) + 1]
+                compatibility_panel.extend_children(current_labels)
     
     def buy_weapon(self):
         """武器を購入"""
@@ -227,7 +326,7 @@ class WeaponShop(Panel):
             return
         
         # インベントリに武器があるか確認
-        if self.selected_weapon not in self.game_manager.inventory:
+        if not self.game_manager.has_item(self.selected_weapon):
             # 購入が必要なメッセージ
             return
         